@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the parsing engine based on the standard ast module.
+
+    It contains the AstEngine class, which reads a Python source and returns its outline:
+    the module's docstring, its imports, its classes (with their methods) and its module-level functions.
+    The outline only holds strings and lists, the html_gen module turns it into PythonElement objects.
+"""
+
+import ast
+import re
+
+
+class AstEngine:
+    """ Inherits: None
+        This class parses a Python source with the ast module.
+        Unlike the regular expressions, it finds the nested classes, the decorated elements and the module-level functions.
+        The names of the classes and methods are taken from the source, as the regular expressions do.
+    """
+
+    def __init__(self, data):
+        """ Constructor
+            Params: String data -> the content of the Python source
+            Return: None
+            The source is parsed (a SyntaxError is raised if it is not valid Python).
+            The offsets of the beginning of each line are computed, to convert the ast positions into string indexes.
+        """
+        self._data = data
+        self._tree = ast.parse(data)
+        self._line_starts = [0] + [result.end() for result in re.finditer(r'\r\n|\r|\n', data)]
+
+    def outline(self):
+        """ Object method
+            Params: None
+            Return: the outline of the source (dict), with the keys:
+                        'docstring' -> String or None
+                        'imports' -> List of String
+                        'classes' -> List of (name, docstring, methods) tuples, methods being a list of (name, docstring) tuples
+                        'functions' -> List of (name, docstring) tuples
+            Only the module level elements are gathered. Nested classes are named after their enclosing class (Outer.Inner).
+        """
+        classes = []
+        functions = []
+
+        for node in self._tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.extractClass(node, "", classes)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions.append(self.extractFunction(node))
+
+        return {
+            'docstring': ast.get_docstring(self._tree, clean=False),
+            'imports': self.extractImports(),
+            'classes': classes,
+            'functions': functions,
+        }
+
+    def extractClass(self, node, prefix, classes):
+        """ Object method
+            Params: ast.ClassDef node -> the class node
+                    String prefix -> the name of the enclosing classes, followed by a dot ("" for a module level class)
+                    List classes -> the list of classes to fill
+            Return: None
+            Appends the class to the classes list, then its nested classes.
+        """
+        methods = []
+        nested_classes = []
+
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods.append(self.extractFunction(child))
+            elif isinstance(child, ast.ClassDef):
+                nested_classes.append(child)
+
+        # The bases are written as in the source, in parentheses
+        start = self.offset(node.lineno, node.col_offset)
+        name_end = self._data.index(node.name, start + len("class")) + len(node.name)
+        name = prefix + node.name + self.parenthesized(name_end, node.bases + [keyword.value for keyword in node.keywords])
+
+        classes.append((name, ast.get_docstring(node, clean=False), methods))
+
+        for child in nested_classes:
+            self.extractClass(child, prefix + node.name + ".", classes)
+
+    def extractFunction(self, node):
+        """ Object method
+            Params: ast.FunctionDef node -> the function or method node
+            Return: the (name, docstring) tuple of the function. The name contains the parameters, as written in the source.
+            The name is searched after the 'def' keyword, which follows 'async' in an async function.
+        """
+        arguments = node.args
+        components = arguments.posonlyargs + arguments.args + arguments.kwonlyargs + arguments.defaults
+        components += [default for default in arguments.kw_defaults if default is not None]
+        components += [arg for arg in (arguments.vararg, arguments.kwarg) if arg is not None]
+
+        start = self.offset(node.lineno, node.col_offset)
+        name_end = re.compile(r'\bdef\s+' + re.escape(node.name) + r'\b').search(self._data, start).end()
+        name = node.name + self.parenthesized(name_end, components)
+
+        return (name, ast.get_docstring(node, clean=False))
+
+    def extractImports(self):
+        """ Object method
+            Params: None
+            Return: the list of the module level imports (List of String)
+            As for the regular expressions, the 'import' statements come first, then the 'from ... import' statements.
+            An element imported from a module is written 'module.element'.
+        """
+        imports = []
+        imports_from = []
+
+        for node in self._tree.body:
+            if isinstance(node, ast.Import):
+                imports += [self.aliasName(alias) for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                lib = "." * node.level + (node.module or "")
+                imports_from += [lib + "." + self.aliasName(alias) for alias in node.names]
+
+        return imports + imports_from
+
+    @staticmethod
+    def aliasName(alias):
+        """ Static method
+            Params: ast.alias alias -> an imported name
+            Return: the imported name, followed by its alias if any (String)
+        """
+        if alias.asname is None:
+            return alias.name
+        return alias.name + " as " + alias.asname
+
+    def parenthesized(self, index, components):
+        """ Object method
+            Params: int index -> index of the end of an element's name, in the source
+                    List components -> the ast nodes written between the parentheses following the name
+            Return: the parentheses following the name and their content, as written in the source (String).
+                    An empty string is returned if there are no parentheses.
+        """
+        opening = index
+        while opening < len(self._data) and self._data[opening] in " \t\\\r\n":
+            opening += 1
+        if opening >= len(self._data) or self._data[opening] != "(":
+            return ""
+
+        # The closing parenthesis follows the last component
+        last_end = opening + 1
+        for component in components:
+            last_end = max(last_end, self.offset(component.end_lineno, component.end_col_offset))
+
+        closing = self._data.find(")", last_end)
+        return self._data[opening:closing+1]
+
+    def offset(self, lineno, col_offset):
+        """ Object method
+            Params: int lineno -> line number of a position, starting from 1
+                    int col_offset -> UTF-8 byte offset of the position in its line
+            Return: the index of the position in the source (int)
+        """
+        line_start = self._line_starts[lineno-1]
+        line = self._data[line_start:line_start + col_offset]
+        if not line.isascii():
+            line = line.encode("utf-8")[:col_offset].decode("utf-8", "ignore")
+        return line_start + len(line)
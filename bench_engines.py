@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Benchmark comparing the parsing engines of the html_gen module.
+
+    Usage: python bench_engines.py [files and directories...]
+    The python files found in the given paths (the current directory by default) are parsed with each engine.
+    For each engine, the parsing time and the number of elements found are printed, so the faster and more accurate engine can be chosen for a corpus.
+"""
+
+import os
+import sys
+import time
+
+from html_gen import PythonFile
+from file_handler import FileHandler
+from constants import *
+
+
+def collectFiles(paths):
+    """ Function
+        Params: List paths -> files and directories
+        Return: the python files contained in the given paths (List of String)
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += FileHandler.extractFiles(path)
+        else:
+            files.append(path)
+    return [f for f in files if os.path.splitext(f)[1] in ('.py', '.pyw')]
+
+
+def benchmark(files, engine):
+    """ Function
+        Params: List files -> the python files to parse
+                String engine -> the parsing engine
+        Return: a dictionary containing the parsing time, the number of elements found and the number of failures.
+    """
+    stats = {'time': 0.0, 'classes': 0, 'methods': 0, 'functions': 0, 'imports': 0, 'failures': 0}
+
+    for path in files:
+        start = time.perf_counter()
+        try:
+            python_file = PythonFile(path, engine)
+        except (SyntaxError, ValueError, UnicodeDecodeError):
+            stats['failures'] += 1
+            continue
+        finally:
+            stats['time'] += time.perf_counter() - start
+
+        stats['classes'] += len(python_file._classes)
+        stats['methods'] += sum(len(python_class._methods) for python_class in python_file._classes)
+        stats['functions'] += len(python_file._functions)
+        stats['imports'] += len(python_file._imported_modules)
+
+    return stats
+
+
+if __name__ == "__main__":
+    files = collectFiles(sys.argv[1:] or ["."])
+    print("%d files" % len(files))
+    print("%-14s %10s %9s %9s %10s %9s %9s" % ("engine", "time (s)", "classes", "methods", "functions", "imports", "failures"))
+
+    for engine in (REGEX_ENGINE, AST_ENGINE):
+        stats = benchmark(files, engine)
+        print("%-14s %10.3f %9d %9d %10d %9d %9d" % (engine, stats['time'], stats['classes'], stats['methods'],
+                                                   stats['functions'], stats['imports'], stats['failures']))
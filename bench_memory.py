@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Benchmark measuring the memory held by the model of a synthetic corpus.
+
+    Usage: python bench_memory.py [number of files] [number of classes per file] [number of methods per class]
+    The corpus is parsed, then the memory retained by the PythonFile, PythonClass and PythonMethod objects is measured with tracemalloc.
+    The same tree is then rebuilt as the model used to be: objects with a __dict__, eagerly formatted docstrings and names that are not interned.
+    The bytes per method are printed for both trees.
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from html_gen import PythonFile
+from bench_templates import syntheticModule
+
+
+class DictElement:
+    """ Inherits: None
+        Element storing its attributes in a __dict__, as the model did before __slots__.
+    """
+
+    def __init__(self, element, children):
+        """ Constructor
+            Params: PythonElement element -> the copied element
+                    List children -> the copied classes, methods or imports of the element
+            Return: None
+            The name is copied into a new string, as each element used to own its name.
+            The formatted docstring is stored, as it used to be formatted by the constructors.
+        """
+        self._name = element._name[:1] + element._name[1:]
+        self._docstring = element._docstring[:1] + element._docstring[1:]
+        self._children = children
+
+
+def copyTree(python_files):
+    """ Function
+        Params: List python_files -> the parsed files
+        Return: the tree of DictElement objects mirroring the files (List)
+    """
+    tree = []
+    for python_file in python_files:
+        classes = []
+        for python_class in python_file._classes:
+            methods = [DictElement(method, []) for method in python_class._methods]
+            classes.append(DictElement(python_class, methods))
+        imports = [element[:1] + element[1:] for element in python_file._imported_modules]
+        tree.append(DictElement(python_file, classes + imports))
+    return tree
+
+
+def retainedMemory(build):
+    """ Function
+        Params: function build -> function returning the measured object
+        Return: the measured object, and the number of bytes it retains (int)
+    """
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - before
+
+
+if __name__ == "__main__":
+    number_files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    number_classes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    number_methods = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        for i in range(number_files):
+            paths.append(os.path.join(folder, "module%d.py" % i))
+            with open(paths[-1], "w") as file_resource:
+                file_resource.write(syntheticModule(number_classes, number_methods))
+
+        tracemalloc.start()
+        python_files, model_size = retainedMemory(lambda: [PythonFile(path) for path in paths])
+        dict_tree, dict_size = retainedMemory(lambda: copyTree(python_files))
+        tracemalloc.stop()
+
+    total = number_files * number_classes * number_methods
+    print("%d files, %d methods" % (number_files, total))
+    print("before (__dict__, eager docstrings): %8.1f bytes/method" % (dict_size / total))
+    print("after (__slots__, lazy docstrings):  %8.1f bytes/method" % (model_size / total))
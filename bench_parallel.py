@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Benchmark measuring the scaling of the parallel documentation generation.
+
+    Usage: python bench_parallel.py [number of files]
+    A synthetic corpus, made of files of various sizes, is documented in the current process, then with 1, 2, 4 and 8 worker processes.
+    The duration of each generation is printed, and the pages generated by the workers are checked against the pages generated in the current process.
+"""
+
+import os
+import sys
+import time
+import filecmp
+import tempfile
+
+from parse_budget import ParseBudget
+from parallel_gen import generateFiles
+from bench_templates import syntheticModule
+from templates import DEFAULT_TEMPLATES
+from constants import *
+
+
+def serialGeneration(paths, folder):
+    """ Function
+        Params: List paths -> the python files' paths
+                String folder -> the documentation folder
+        Return: None
+        Generates the documentation in the current process, as FileHandler.processFiles does with a single job.
+    """
+    budget = ParseBudget()
+    for path in paths:
+        budget.parse(path).save(folder, NATURAL_ORDER, DEFAULT_TEMPLATES)
+    budget.close()
+
+
+def parallelGeneration(paths, folder, jobs):
+    """ Function
+        Params: List paths -> the python files' paths
+                String folder -> the documentation folder
+                int jobs -> the number of worker processes
+        Return: None
+    """
+    for result in generateFiles(paths, folder, NATURAL_ORDER, REGEX_ENGINE, DEFAULT_TEMPLATES, None, PARSE_TIME_BUDGET, jobs):
+        pass
+
+
+def timed(function, *args):
+    """ Function
+        Params: function function -> the timed function
+                args -> its arguments
+        Return: the duration of the call, in seconds (float)
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    number_files = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+
+    with tempfile.TemporaryDirectory() as folder:
+        sources = os.path.join(folder, "sources")
+        os.mkdir(sources)
+        paths = []
+        for i in range(number_files):
+            paths.append(os.path.join(sources, "module%d.py" % i))
+            with open(paths[-1], "w") as file_resource:
+                file_resource.write(syntheticModule(5 + (i % 8) * 20, 10))
+
+        reference = os.path.join(folder, "serial")
+        os.mkdir(reference)
+        print("%d files, %d cores" % (number_files, os.cpu_count()))
+        print("serial:    %7.2f s" % timed(serialGeneration, paths, reference))
+
+        for jobs in (1, 2, 4, 8):
+            output = os.path.join(folder, "jobs%d" % jobs)
+            os.mkdir(output)
+            duration = timed(parallelGeneration, paths, output, jobs)
+
+            names = os.listdir(reference)
+            match, mismatch, errors = filecmp.cmpfiles(reference, output, names, shallow=False)
+            print("%d worker%s: %7.2f s, %s" % (jobs, "s" if jobs > 1 else " ", duration,
+                                                "identical pages" if len(match) == len(names) else "%d different pages" % len(mismatch + errors)))
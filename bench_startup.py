@@ -0,0 +1,81 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Benchmark measuring the time to the first window of the graphical interface.
+
+    Usage: python bench_startup.py [time limit in seconds] [number of runs]
+    The interface is started in a new interpreter, with 'python -X importtime' and the offscreen Qt platform, until its window is shown.
+    The best time of the runs is printed, with the modules taking the longest to import.
+    The exit status is 1 if the time exceeds the limit, or if a module only needed by the style screen was imported before the first window.
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+from constants import *
+
+
+# Started in the new interpreter: the window is created and shown, then the interpreter exits
+STARTUP_SCRIPT = """
+import sys
+import importlib.util
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+spec = importlib.util.spec_from_file_location("goodoc", "goodoc.pyw")
+goodoc = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(goodoc)
+window = goodoc.Window()
+app.processEvents()
+print("shown", flush=True)
+"""
+
+# Modules which must not be imported before the first window
+DEFERRED_MODULES = ("style_screen", "PyQt5.QtWebKitWidgets", "PyQt5.QtWebKit")
+
+
+def startup():
+    """ Function
+        Params: None
+        Return: the time to the first window (float, in seconds) and the cumulated import time of each module (Dictionary: module -> microseconds)
+    """
+    environment = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT], cwd=GOODOC_FOLDER, env=environment,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    shown = process.stdout.readline()
+    elapsed = time.perf_counter() - start
+    output, errors = process.communicate()
+
+    if shown.strip() != "shown":
+        raise RuntimeError("the window was not shown:\n" + errors)
+
+    # Lines of -X importtime: "import time: self [us] | cumulative | imported package"
+    imports = {}
+    for line in errors.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if fields[1].strip().isdigit():
+            imports[fields[2].strip()] = int(fields[1])
+
+    return elapsed, imports
+
+
+if __name__ == "__main__":
+    limit = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    results = [startup() for i in range(runs)]
+    elapsed, imports = min(results, key=lambda result: result[0])
+
+    print("time to first window: %.3f s (best of %d runs, limit %.3f s)" % (elapsed, runs, limit))
+    print("slowest imports (cumulative):")
+    for module in sorted(imports, key=imports.get, reverse=True)[:10]:
+        print("%10.1f ms  %s" % (imports[module] / 1000, module))
+
+    deferred = [module for module in DEFERRED_MODULES if module in imports]
+    if deferred != []:
+        print("imported before the first window: " + ", ".join(deferred))
+    sys.exit(1 if elapsed > limit or deferred != [] else 0)
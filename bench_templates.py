@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Benchmark comparing the rendering through the compiled templates with the former string concatenation.
+
+    Usage: python bench_templates.py [number of classes] [number of methods per class]
+    A synthetic module is parsed once, then rendered repeatedly in both ways.
+    The rendering throughput, in methods per second, is printed for each way.
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from html_gen import PythonFile
+from constants import *
+
+
+def concatenatedDocument(python_file):
+    """ Function
+        Params: PythonFile python_file -> the documented file
+        Return: the documentation of the file (String), built by concatenation, as the html_gen module used to.
+    """
+    html_documentation = "<!DOCTYPE html>\n"
+    html_documentation += "<html>\n"
+    html_documentation += "\t<head>\n"
+    html_documentation += "\t\t<title> " + os.path.basename(python_file._name) + " </title>\n"
+    html_documentation += "\t\t<meta charset='utf-8' />\n"
+    html_documentation += "\t\t<link  rel='stylesheet' type='text/css' href=" + STYLE_BASENAME + " />\n"
+    html_documentation += "\t\t<script src='" + os.path.basename(JAVASCRIPT_FILE_PATH) + "'></script>\n"
+    html_documentation += "\t</head>\n"
+    html_documentation += "\t<body>\n"
+    html_documentation += "\t\t<h1>\n\t\t\t" + os.path.basename(python_file._name) + "\n\t\t</h1>\n"
+    html_documentation += "\t\t<p>\n\t\t\t" + python_file._docstring + "\n\t\t</p>\n"
+    html_documentation += "\t\t<h2>imports:</h2>\n\t\t<ul>\n"
+    for element in python_file._imported_modules:
+        html_documentation += "\t\t\t<li>"+element+"</li>\n"
+    html_documentation += "\t\t</ul>\n"
+
+    for python_class in python_file._classes:
+        html_documentation += "\t\t<section class='pythonClass'>\n"
+        html_documentation += "\t\t\t<h2>\n\t\t\t\t" + python_class._name + "\n\t\t\t</h2>\n"
+        html_documentation += "\t\t\t<p>\n\t\t\t\t" + python_class._docstring + "\n\t\t\t</p>\n"
+        html_documentation += "\t\t\t<table class='methods'>\n"
+        html_documentation += "\t\t\t\t<th colspan = 2> Methods </th>\n"
+        for method in python_class._methods:
+            html_documentation += "\t\t\t\t<tr>\n"
+            html_documentation += "\t\t\t\t\t<td>\n\t\t\t\t\t\t" + method._name + "\n\t\t\t\t\t</td>\n"
+            html_documentation += "\t\t\t\t\t<td>\n\t\t\t\t\t\t" + method._docstring + "\n\t\t\t\t\t</td>\n"
+            html_documentation += "\t\t\t\t</tr>\n"
+        html_documentation += "\t\t\t</table>\n"
+        html_documentation += "\t\t</section>\n"
+
+    html_documentation += "\t</body>\n"
+    html_documentation += "</html>\n"
+    return html_documentation
+
+
+def syntheticModule(number_classes, number_methods):
+    """ Function
+        Params: int number_classes -> the number of classes of the module
+                int number_methods -> the number of methods of each class
+        Return: the source of a synthetic module (String)
+    """
+    lines = ['""" Synthetic module """', '', 'import os', '']
+    for i in range(number_classes):
+        lines.append('class Class%d:' % i)
+        lines.append('    """ Class docstring\n        on two lines """')
+        lines.append('')
+        for j in range(number_methods):
+            lines.append('    def method%d(self, x):' % j)
+            lines.append('        """ Method docstring\n            Params: x\n            Return: None """')
+            lines.append('        pass')
+            lines.append('')
+    return "\n".join(lines) + "\n"
+
+
+def throughput(render, python_file, number_methods, repeat = 5):
+    """ Function
+        Params: function render -> the rendering function, called with python_file
+                PythonFile python_file -> the documented file
+                int number_methods -> the number of methods of the file
+                int repeat -> the number of renderings, has 5 for default value
+        Return: the number of methods rendered per second (float), for the best run.
+    """
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        render(python_file)
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return number_methods / best
+
+
+if __name__ == "__main__":
+    number_classes = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    number_methods = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "synthetic.py")
+        with open(path, "w") as file_resource:
+            file_resource.write(syntheticModule(number_classes, number_methods))
+        python_file = PythonFile(path)
+
+    total = number_classes * number_methods
+    assert python_file.document() == concatenatedDocument(python_file)
+
+    print("%d classes, %d methods" % (number_classes, total))
+    print("concatenation: %12.0f methods/s" % throughput(concatenatedDocument, python_file, total))
+    print("templates:     %12.0f methods/s" % throughput(lambda f: f.document(), python_file, total))
+    print("templates (streamed, not joined): %12.0f methods/s" % throughput(lambda f: sum(1 for fragment in f.iterDocument()), python_file, total))
@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the build manifest, used by incremental documentation builds.
+
+    The manifest is a JSON file stored in the documentation folder.
+    For each documented source, it records the source's modification time, size and hash, the settings of the build and the generated page.
+    A page is only generated again when its source or the settings changed.
+    It contains the BuildManifest class.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+from compression import removeCompressed
+from constants import *
+
+
+class BuildManifest:
+    """ Inherits: None
+        This class represents the build manifest of a documentation folder.
+        Its _entries attribute maps the absolute path of each source to a dictionary with the keys mtime, size, hash, settings, output and symbols.
+        The symbols of the page (see PythonFile.symbols()) let an incremental build index the pages it doesn't generate again, without parsing their source.
+    """
+
+    def __init__(self, folder):
+        """ Constructor
+            Params: String folder -> the documentation folder
+            Return: None
+            The manifest is read from the folder, if it exists. An unreadable manifest is ignored, so everything is generated again.
+        """
+        self._path = os.path.join(folder, MANIFEST_FILE_NAME)
+        self._entries = {}
+
+        try:
+            with open(self._path, "r") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def key(source):
+        """ Static method
+            Params: String source -> the path of a source
+            Return: the key of the source in the manifest, its normalized absolute path (String)
+        """
+        return os.path.normcase(os.path.abspath(source))
+
+    @staticmethod
+    def hashFile(source):
+        """ Static method
+            Params: String source -> the path of a source
+            Return: the SHA-256 hash of the source's content (String)
+        """
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def output(self, source):
+        """ Object method
+            Params: String source -> the path of a source
+            Return: the path of the page generated for the source (String), or None if the source is not in the manifest
+        """
+        entry = self._entries.get(self.key(source))
+        if entry is None:
+            return None
+        return entry['output']
+
+    def symbols(self, source):
+        """ Object method
+            Params: String source -> the path of a source
+            Return: the symbols documented by the page of the source (List of tuples), empty if the source is not in the manifest
+        """
+        entry = self._entries.get(self.key(source))
+        if entry is None:
+            return []
+        return [tuple(symbol) for symbol in entry.get('symbols', [])]
+
+    def isUpToDate(self, source, settings):
+        """ Object method
+            Params: String source -> the path of a source
+                    String settings -> the settings of the build (ordering mode, engine, templates...)
+            Return: True if the page of the source needs not be generated again (bool)
+            The page needs to exist, and to have been generated with the same settings.
+            The source is unchanged if its modification time and size are unchanged, or else if its hash is unchanged.
+        """
+        entry = self._entries.get(self.key(source))
+        if entry is None or entry['settings'] != settings or not os.path.isfile(entry['output']):
+            return False
+
+        stat = os.stat(source)
+        if stat.st_mtime == entry['mtime'] and stat.st_size == entry['size']:
+            return True
+
+        if self.hashFile(source) != entry['hash']:
+            return False
+
+        # Touched, but unchanged
+        entry['mtime'] = stat.st_mtime
+        entry['size'] = stat.st_size
+        return True
+
+    def record(self, source, settings, output, symbols = ()):
+        """ Object method
+            Params: String source -> the path of a source
+                    String settings -> the settings of the build
+                    String output -> the path of the page generated for the source
+                    List symbols -> the symbols documented by the page, has () for default value
+            Return: None
+        """
+        stat = os.stat(source)
+        self._entries[self.key(source)] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'hash': self.hashFile(source),
+            'settings': settings,
+            'output': output,
+            'symbols': [list(symbol) for symbol in symbols],
+        }
+
+    def removeStale(self):
+        """ Object method
+            Params: None
+            Return: the paths of the removed pages (List of String)
+            The pages whose source was removed are deleted, with the fragments of their classes and their compressed copies if any, and their entries are removed from the manifest.
+        """
+        removed = []
+        for source in list(self._entries):
+            if os.path.exists(source):
+                continue
+
+            output = self._entries.pop(source)['output']
+            if os.path.isfile(output):
+                os.remove(output)
+            removeCompressed(output)
+            fragments = os.path.splitext(output)[0] + CLASS_FRAGMENTS_SUFFIX
+            if os.path.isdir(fragments):
+                shutil.rmtree(fragments)
+            removed.append(output)
+
+        return removed
+
+    def save(self):
+        """ Object method
+            Params: None
+            Return: None
+            Writes the manifest in the documentation folder. It is written in a temporary file first, so an interrupted build never leaves a partial manifest.
+        """
+        temporary_path = self._path + ".tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(self._entries, f, indent=1, sort_keys=True)
+        os.replace(temporary_path, self._path)
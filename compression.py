@@ -0,0 +1,152 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the precompressed copies of the generated documentation, for static web servers (e.g. nginx gzip_static and brotli_static).
+
+    Each compressed file has a gzip copy next to it, with the GZIP_EXTENSION extension appended to its name,
+    and a brotli copy with the BROTLI_EXTENSION extension if the optional brotli module is installed.
+    The copies are reproducible: the gzip header holds neither the name nor the modification time of the file.
+    It contains the CompressedCopies class and the compressFile, compressAsset and removeCompressed functions.
+"""
+
+import os
+import gzip
+from constants import *
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def compressedPaths(path):
+    """ Function
+        Params: String path -> the path of a file
+        Return: the paths of the compressed copies of the file (List of String)
+    """
+    if brotli is None:
+        return [path + GZIP_EXTENSION]
+    return [path + GZIP_EXTENSION, path + BROTLI_EXTENSION]
+
+
+class CompressedCopies:
+    """ Inherits: None
+        This class represents the compressed copies of a file being written.
+        The data written to it is compressed on the fly into temporary files, which replace the copies when it is closed without error:
+        an interrupted write never leaves a half-written copy.
+        It is used as a context manager.
+    """
+
+    def __init__(self, path):
+        """ Constructor
+            Params: String path -> the path of the file whose copies are written
+            Return: None
+        """
+        self._path = path
+        self._files = []
+
+    def __enter__(self):
+        """ Special method
+            Params: None
+            Return: self
+            Opens the temporary copies.
+        """
+        suffix = "." + str(os.getpid())
+        for path in compressedPaths(self._path):
+            raw = open(path + suffix, "wb")
+            if path.endswith(GZIP_EXTENSION):
+                stream = gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=GZIP_LEVEL, mtime=0)
+            else:
+                stream = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._files.append((path, path + suffix, raw, stream))
+        return self
+
+    def write(self, data):
+        """ Object method
+            Params: bytes data -> the next bytes of the file
+            Return: None
+        """
+        for path, temporary_path, raw, stream in self._files:
+            if isinstance(stream, gzip.GzipFile):
+                stream.write(data)
+            else:
+                raw.write(stream.process(data))
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Special method
+            Params: the exception raised while writing, if any
+            Return: False: the exception is not suppressed
+            The copies replace the previous ones, or are removed if an exception was raised.
+        """
+        for path, temporary_path, raw, stream in self._files:
+            try:
+                if isinstance(stream, gzip.GzipFile):
+                    stream.close()
+                else:
+                    raw.write(stream.finish())
+            finally:
+                raw.close()
+
+            if exc_type is None:
+                os.replace(temporary_path, path)
+            elif os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        self._files = []
+        return False
+
+    def tee(self, fragments, encoding = "utf-8"):
+        """ Generator
+            Params: Iterable fragments -> the fragments of the file (String)
+                    String encoding -> the encoding of the file, has "utf-8" for default value
+            Yield: the fragments, unchanged, once they are compressed
+            The copies are compressed while the file is written from the fragments, so the file is never read again.
+        """
+        for fragment in fragments:
+            self.write(fragment.encode(encoding))
+            yield fragment
+
+
+def compressFile(path):
+    """ Function
+        Params: String path -> the path of an existing file
+        Return: None
+        Writes the compressed copies of the file, reading it by chunks.
+    """
+    with open(path, "rb") as source, CompressedCopies(path) as copies:
+        for chunk in iter(lambda: source.read(WRITE_BUFFER_SIZE), b""):
+            copies.write(chunk)
+
+
+def compressAsset(path):
+    """ Function
+        Params: String path -> the path of an existing file, copied or written into the documentation folder (script, style sheet or search index)
+        Return: True if the copies were written, False if they were up to date (bool)
+        The copies are only written again if one of them is missing, or if the gzip copy doesn't hold the content of the file.
+        The content is compared rather than the modification times, which say nothing of a file replaced by an older one.
+    """
+    with open(path, "rb") as file_resource:
+        data = file_resource.read()
+
+    try:
+        with gzip.open(path + GZIP_EXTENSION, "rb") as compressed:
+            up_to_date = compressed.read() == data
+    except (OSError, EOFError):
+        up_to_date = False
+
+    if up_to_date and all(os.path.isfile(compressed_path) for compressed_path in compressedPaths(path)):
+        return False
+
+    compressFile(path)
+    return True
+
+
+def removeCompressed(path):
+    """ Function
+        Params: String path -> the path of a file
+        Return: None
+        Removes the compressed copies of the file, if any, whether brotli is installed or not.
+    """
+    for compressed_path in (path + GZIP_EXTENSION, path + BROTLI_EXTENSION):
+        if os.path.isfile(compressed_path):
+            os.remove(compressed_path)
@@ -1,6 +1,11 @@
 
 """ Module containing all the constants used in the GooDoc project. """
 
+import os
+
+# Folder of the application, containing its resources (scripts and style sheets)
+GOODOC_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
 
 ################################################################## DOCUMENTATION ################################################################## 
 
@@ -23,6 +28,121 @@ REGEX_IMPORT = r'\nimport (?P<module>.+)\n'
 REGEX_IMPORT_FROM = r'\nfrom (?P<lib>.+) import (?P<element>.+)\n'
 
 REGEX_STYLE = r'href=(?P<style>.+?) '
+# Link tags of a page's head, and the (quoted) target of such a tag, matched on the page's bytes
+REGEX_LINK_TAG = rb'<link\b[^>]*>'
+REGEX_LINK_HREF = rb'''\bhref=(?P<style>'[^']*'|"[^"]*"|[^\s>]+)'''
+
+REGEX_TEMPLATE_FIELD = r'\$(\{(?P<field>\w+)\}|\$)'
+
+# TEMPLATES
+
+TEMPLATE_PAGE = "<!DOCTYPE html>\n"\
+              + "<html>\n"\
+              + "${head}${body}"\
+              + "</html>\n"
+
+TEMPLATE_HEAD = "\t<head>\n"\
+              + "\t\t<title> ${title} </title>\n"\
+              + "\t\t<meta charset='utf-8' />\n"\
+              + "\t\t<link  rel='stylesheet' type='text/css' href=${style} />\n"\
+              + "\t\t<script src='${script}'></script>\n"\
+              + "\t</head>\n"
+
+TEMPLATE_BODY = "\t<body>\n"\
+              + "\t\t<h1>\n\t\t\t${title}\n\t\t</h1>\n"\
+              + "\t\t<p>\n\t\t\t${docstring}\n\t\t</p>\n"\
+              + "\t\t<h2>imports:</h2>\n\t\t<ul>\n"\
+              + "${imports}"\
+              + "\t\t</ul>\n"\
+              + "${functions}${classes}"\
+              + "\t</body>\n"
+
+TEMPLATE_IMPORT = "\t\t\t<li>${module}</li>\n"
+
+TEMPLATE_FUNCTIONS = "\t\t<section class='pythonFunctions'>\n"\
+                   + "\t\t\t<h2>\n\t\t\t\tfunctions\n\t\t\t</h2>\n"\
+                   + "\t\t\t<table class='methods'>\n"\
+                   + "\t\t\t\t<th colspan = 2> Functions </th>\n"\
+                   + "${functions}"\
+                   + "\t\t\t</table>\n"\
+                   + "\t\t</section>\n"
+
+TEMPLATE_CLASS = "\t\t<section class='pythonClass'>\n"\
+               + "\t\t\t<h2>\n\t\t\t\t${name}\n\t\t\t</h2>\n"\
+               + "\t\t\t<p>\n\t\t\t\t${docstring}\n\t\t\t</p>\n"\
+               + "\t\t\t<table class='methods'>\n"\
+               + "\t\t\t\t<th colspan = 2> Methods </th>\n"\
+               + "${methods}"\
+               + "\t\t\t</table>\n"\
+               + "\t\t</section>\n"
+
+# Outline of a class whose section is loaded lazily, from its fragment file (see PythonFile.saveFragments)
+TEMPLATE_CLASS_OUTLINE = "\t\t<section class='pythonClass' id='${id}' data-fragment='${fragment}'>\n"\
+                       + "\t\t\t<h2>\n\t\t\t\t${name}\n\t\t\t</h2>\n"\
+                       + "\t\t</section>\n"
+
+TEMPLATE_METHOD = "\t\t\t\t<tr>\n"\
+                + "\t\t\t\t\t<td>\n\t\t\t\t\t\t${name}\n\t\t\t\t\t</td>\n"\
+                + "\t\t\t\t\t<td>\n\t\t\t\t\t\t${docstring}\n\t\t\t\t\t</td>\n"\
+                + "\t\t\t\t</tr>\n"
+
+TEMPLATE_SEARCH_PAGE = "<!DOCTYPE html>\n"\
+                     + "<html>\n"\
+                     + "${head}"\
+                     + "\t<body>\n"\
+                     + "\t\t<h1>\n\t\t\tSearch\n\t\t</h1>\n"\
+                     + "\t\t<input id='goodocQuery' type='text' placeholder='Class, method or function name' autofocus />\n"\
+                     + "\t\t<table id='goodocResults' class='methods'></table>\n"\
+                     + "\t</body>\n"\
+                     + "</html>\n"
+
+# SEARCH INDEX
+
+# Kinds of the indexed symbols
+SYMBOL_CLASS = 0
+SYMBOL_METHOD = 1
+SYMBOL_FUNCTION = 2
+
+# Maximum length of the docstring excerpt of a symbol
+SEARCH_EXCERPT_LENGTH = 80
+
+# The index is split into shards, one per first letter of the symbols' names after their leading underscores, read by the search script in SEARCH_FOLDER_NAME
+SEARCH_FOLDER_NAME = "search"
+SEARCH_OTHER_SHARD = "_"
+# The hyphen can't appear in a module name: no documented module can have the page of the search
+SEARCH_PAGE_NAME = "goodoc-search.html"
+SEARCH_SCRIPT_PATH = os.path.join(GOODOC_FOLDER, "javascript", "search.js")
+
+# LAZY CLASS SECTIONS
+
+# The sections of the classes of a page are written in the folder named after the page, with this suffix, one javascript file per class
+CLASS_FRAGMENTS_SUFFIX = "_classes"
+CLASS_FRAGMENT_ID = "goodocClass%d"
+CLASS_FRAGMENT_CALL = "insertClass(%s,%s);\n"
+
+# PRECOMPRESSED OUTPUT (see compression module)
+
+GZIP_EXTENSION = ".gz"
+GZIP_LEVEL = 9
+# Only used if the optional brotli module is installed
+BROTLI_EXTENSION = ".br"
+BROTLI_QUALITY = 11
+
+# PARSING ENGINES
+
+REGEX_ENGINE = "regex_engine"
+AST_ENGINE = "ast_engine"
+
+# PARSE CACHE
+
+# Version of the parsers, part of the cache keys. It must change whenever the extracted content changes.
+PARSER_VERSION = "1"
+PARSE_CACHE_MAX_SIZE = 256 * 1024 * 1024
+CACHE_EXTENSION = ".pickle"
+
+# PARSE TIME BUDGET (seconds per file)
+
+PARSE_TIME_BUDGET = 10
 
 # INDENTATION LEVEL
 
@@ -30,37 +150,74 @@ FILE_INDENTATION_LEVEL = 3
 CLASS_INDENTATION_LEVEL = 4
 METHOD_INDENTATION_LEVEL = 6
 
+# Version of the generated documentation, part of the settings recorded by incremental builds
+GENERATOR_VERSION = "1"
+
+# Build manifest, stored in the documentation folder by incremental builds
+MANIFEST_FILE_NAME = "goodoc_manifest.json"
+
+# Size of the buffer of the generated files, in bytes
+WRITE_BUFFER_SIZE = 65536
+
+# PROGRESS STAGES, notified by the file handler for each file (see FileHandler.notify)
+
+PROGRESS_DISCOVERED = "discovered"
+PROGRESS_PARSED = "parsed"
+PROGRESS_WRITTEN = "written"
+PROGRESS_RESTYLED = "restyled"
+PROGRESS_STAGES = (PROGRESS_DISCOVERED, PROGRESS_PARSED, PROGRESS_WRITTEN, PROGRESS_RESTYLED)
+
+# WATCH MODE (seconds)
+
+# Delay between two scans of the watched files
+WATCH_INTERVAL = 0.5
+# Delay without any change before the touched files are generated again, so that a burst of saves is handled once
+WATCH_DEBOUNCE = 0.3
+
 # File name
-JAVASCRIPT_FILE_PATH = "./javascript/fold.js"
+JAVASCRIPT_FILE_PATH = os.path.join(GOODOC_FOLDER, "javascript", "fold.js")
 
 # ELEMENTS ORDER
 
 NATURAL_ORDER = "natural_order"
 ALPHABETICAL_ORDER = "alphabetical_order"
 
+######## COMMAND LINE ########
+
+CLI_DESCRIPTION = "Generates the HTML documentation of Python source code, without the graphical interface."
+
 ######## SCREEN ########
 
 # Title
 DOCUMENTATION_TITLE = "GooDoc - Documentation"
 STYLE_BUTTON_TITLE = "Stylesheets"
+PARSE_REPORT_TITLE = "Files not processed normally"
 
 # Images
 ADD_FILES_ICON = "img/addFiles.png"
 ADD_DIR_ICON = "img/addDir.png"
 START_ICON = "img/start.png"
 SETTINGS_ICON = "img/settings.png"
+CANCEL_ICON = "img/close.png"
 
 # Shortcuts
 ADD_FILES_SHORTCUT = 'Ctrl+O'
 ADD_DIR_SHORTCUT = 'Ctrl+Shift+O'
 START_SHORTCUT = 'Ctrl+K'
 SETTINGS_SHORTCUT = 'Ctrl+L'
+CANCEL_SHORTCUT = 'Esc'
 
 # ToolTip
 ADD_FILES_TIP = "Add files"
 ADD_DIR_TIP = "Add directory"
 START_TIP = "Start generation"
 SETTINGS_TIP = "Settings"
+CANCEL_TIP = "Cancel"
+
+# Status bar
+PROGRESS_MESSAGE = "{discovered} files discovered, {parsed} parsed, {written} written, {restyled} restyled"
+CANCELLED_MESSAGE = "Cancelled"
+DONE_MESSAGE = "Done"
 
 # Folders
 NAME_CREATED_FOLDER = "GOODOC_DOCUMENTATION"
@@ -71,6 +228,12 @@ DOCSCREEN_STYLESHEET_PATH = "./style/documentation_screen.css"
 # Extension
 AUTHORIZED_EXTENSIONS = (".py",".pyw",".htm",".html")
 
+# Folders never walked when looking for files: version control, virtual environments, dependencies and caches.
+# A folder containing a VIRTUALENV_MARKER file is a virtual environment, whatever its name.
+EXCLUDED_FOLDERS = (".git", ".hg", ".svn", ".tox", ".nox", ".venv", "venv", "node_modules", "__pycache__")
+VIRTUALENV_MARKER = "pyvenv.cfg"
+GITIGNORE_FILE_NAME = ".gitignore"
+
 ######## TBD ########
 
 DEFAULT_FILE_SELECT_LOCATION = "C:\\"
@@ -79,12 +242,14 @@ DEFAULT_FILE_SELECT_LOCATION = "C:\\"
 
 # Title Screen
 STYLE_TITLE = "GooDoc - Stylesheets"
+# Displayed by the style screen when no generated page can be previewed
+NO_PREVIEW_HTML = "<p>No generated page to preview.</p>"
 
 # Style path
-STYLE_GOO_PATH = "./style/goo.css"
-STYLE_DEEPBLUE_PATH = "./style/deepblue.css"
-STYLE_MELTDOWN_PATH = "./style/meltdown.css"
-STYLE_DOXYGEN_PATH = "./style/doxygen.css"
+STYLE_GOO_PATH = os.path.join(GOODOC_FOLDER, "style", "goo.css")
+STYLE_DEEPBLUE_PATH = os.path.join(GOODOC_FOLDER, "style", "deepblue.css")
+STYLE_MELTDOWN_PATH = os.path.join(GOODOC_FOLDER, "style", "meltdown.css")
+STYLE_DOXYGEN_PATH = os.path.join(GOODOC_FOLDER, "style", "doxygen.css")
 
 # Style name
 STYLE_GOO_NAME = "Goo"
@@ -96,8 +261,14 @@ NEW_STYLE_NAME = "NewStyle"
 # Other path
 SAVE_FILE_PATH = "./save/saved_style"
 SAVE_FOLDER_PATH = "./save"
+STYLE_SETTINGS_PATH = "./save/style"
 STYLE_BASENAME = "'(GOODOC_STYLE_BASENAME)'"
 STYLESCREEN_STYLESHEET_PATH = "./style/style_screen.css"
 
+# Restyling: the head of a page is read by chunks, up to a limit, and the pages are restyled by a pool of threads
+HEAD_CHUNK_SIZE = 4096
+HEAD_SIZE_LIMIT = 65536
+RESTYLE_THREADS = 8
+
 # Other name
 CONFIRM_BUTTON_NAME = "Choose"
@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module discovering the documented files of a folder and its subfolders.
+
+    The folders are read with os.scandir: the type of each entry is known without any additional system call, except for symbolic links.
+    Folders which can't contain documented sources are pruned, and never read: version control folders, virtual environments, node_modules, caches,
+    the folders matching an exclude glob, and the ones ignored by a .gitignore file.
+    Each folder is read at most once, even when symbolic links form a loop: the folders are identified by their device and inode numbers.
+    The rules of the .gitignore files may be cached from a walk to the next, and a single file can be checked without walking its folder (isWanted).
+"""
+
+import os
+import re
+import fnmatch
+from constants import *
+
+
+class GitIgnore:
+    """ Inherits: None
+        Class modeling the rules of the .gitignore files found while walking a folder.
+        The usual syntax is supported: comments, negated rules (!), folder rules (trailing /), anchored rules (containing a /) and ** wildcards.
+    """
+
+    def __init__(self, rules = ()):
+        """ Constructor
+            Params: tuple rules -> the rules, as (compiled regex, negated, folder only) tuples, has () for default value
+            Return: self
+        """
+        self._rules = rules
+
+    def extend(self, folder, relative, cache = None):
+        """ Object method
+            Params: String folder -> the folder's path
+                    String relative -> the folder's path, relative to the walked folder ("" for the walked folder itself)
+                    Dictionary cache -> the rules already read, kept from a walk to the next (see readRules), has None for default value (no cache)
+            Return: the rules applying to the folder's content (GitIgnore): self, followed by the rules of the folder's .gitignore file, if any
+        """
+        rules = readRules(folder, relative, cache)
+        if rules == ():
+            return self
+        return GitIgnore(self._rules + rules)
+
+    def ignores(self, relative, is_folder):
+        """ Object method
+            Params: String relative -> the path of a file or folder, relative to the walked folder
+                    bool is_folder -> True if the path is a folder's one
+            Return: True if the path is ignored (bool). As in git, the last matching rule wins.
+        """
+        ignored = False
+        for regex, negated, folder_only in self._rules:
+            if (is_folder or not folder_only) and regex.match(relative):
+                ignored = not negated
+        return ignored
+
+
+def readRules(folder, relative, cache = None):
+    """ Function
+        Params: String folder -> the folder's path
+                String relative -> the folder's path, relative to the walked folder
+                Dictionary cache -> the rules already read (Dictionary: (folder, relative) -> ((modification time, size) of the .gitignore file, rules)),
+                                    has None for default value (no cache)
+        Return: the rules of the folder's .gitignore file, as (compiled regex, negated, folder only) tuples (tuple), empty if there is no such file
+        With a cache, a .gitignore file is only read and compiled again when its modification time or size changed: it is merely stated.
+    """
+    path = os.path.join(folder, GITIGNORE_FILE_NAME)
+    if cache is not None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            cache.pop((folder, relative), None)
+            return ()
+
+        state = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get((folder, relative))
+        if cached is None or cached[0] != state:
+            cached = (state, readRules(folder, relative))
+            cache[(folder, relative)] = cached
+        return cached[1]
+
+    try:
+        with open(path, "r", errors="replace") as file_resource:
+            lines = file_resource.read().splitlines()
+    except OSError:
+        return ()
+
+    prefix = relative + "/" if relative != "" else ""
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if line == "" or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        folder_only = line.endswith("/")
+        line = line.strip("/") if folder_only else line
+        if line == "":
+            continue
+
+        # A rule without any inner slash matches at any depth, the others are relative to the folder of the .gitignore file
+        if "/" in line.lstrip("/"):
+            pattern = re.escape(prefix) + translate(line.lstrip("/"))
+        else:
+            pattern = re.escape(prefix) + "(?:.*/)?" + translate(line.lstrip("/"))
+        rules.append((re.compile(pattern + r"\Z"), negated, folder_only))
+
+    return tuple(rules)
+
+
+def translate(pattern):
+    """ Function
+        Params: String pattern -> a glob pattern, whose parts are separated by slashes
+        Return: the regular expression of the pattern (String)
+        As in .gitignore files, '*' and '?' never match a slash, and '**' matches any number of folders.
+    """
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            regex += "[" + pattern[i + 1:end].replace("!", "^", 1).replace("\\", "\\\\") + "]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+    return regex
+
+
+def matches(relative, name, patterns):
+    """ Function
+        Params: String relative -> the path of a file or folder, relative to the walked folder
+                String name -> its name
+                tuple patterns -> glob patterns
+        Return: True if one of the patterns matches the relative path or the name (bool)
+    """
+    for pattern in patterns:
+        if fnmatch.fnmatch(relative, pattern) or fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+
+def walkFiles(folder, extensions = AUTHORIZED_EXTENSIONS, include = (), exclude = (), gitignore = True, cache = None):
+    """ Generator
+        Params: String folder -> the walked folder
+                tuple extensions -> the extensions of the wanted files, has AUTHORIZED_EXTENSIONS for default value
+                tuple include -> glob patterns, one of which must match the path (relative to the folder) or the name of each file. Has () for default value: all the files are wanted
+                tuple exclude -> glob patterns of the pruned files and folders, has () for default value
+                bool gitignore -> if True, the files and folders ignored by the .gitignore files are pruned. Has True for default value
+                Dictionary cache -> the rules of the .gitignore files already read, kept from a walk to the next (see readRules), has None for default value
+        Yield: the path of each wanted file (String), folder by folder. The order of the files in a folder is the order of the file system.
+        The folders named in EXCLUDED_FOLDERS and the virtual environments are always pruned.
+    """
+    try:
+        stat = os.stat(folder)
+    except OSError:
+        return
+    visited = {(stat.st_dev, stat.st_ino)}
+
+    # Depth first walk, without recursion
+    stack = [(folder, "", GitIgnore().extend(folder, "", cache) if gitignore else None)]
+    while stack:
+        path, relative, rules = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+
+        folders = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                entry_relative = relative + "/" + name if relative != "" else name
+
+                try:
+                    is_folder = entry.is_dir()
+                except OSError:
+                    continue
+
+                if exclude and matches(entry_relative, name, exclude):
+                    continue
+                if rules is not None and rules.ignores(entry_relative, is_folder):
+                    continue
+
+                if is_folder:
+                    if name not in EXCLUDED_FOLDERS:
+                        folders.append((entry, entry_relative))
+                elif os.path.splitext(name)[1] in extensions:
+                    if not include or matches(entry_relative, name, include):
+                        try:
+                            if entry.is_file():
+                                yield entry.path
+                        except OSError:
+                            continue
+
+        for entry, entry_relative in reversed(folders):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            # A folder already read (symbolic link loop, or several links to the same folder) is skipped
+            key = (stat.st_dev, stat.st_ino)
+            if key in visited:
+                continue
+            visited.add(key)
+
+            if os.path.isfile(os.path.join(entry.path, VIRTUALENV_MARKER)):
+                continue
+
+            stack.append((entry.path, entry_relative, rules.extend(entry.path, entry_relative, cache) if rules is not None else None))
+
+
+def isWanted(folder, path, extensions = AUTHORIZED_EXTENSIONS, include = (), exclude = (), gitignore = True, cache = None):
+    """ Function
+        Params: String folder -> the walked folder
+                String path -> the path of a file, inside the folder
+                tuple extensions, include, exclude, bool gitignore, Dictionary cache -> see walkFiles
+        Return: True if the file would be yielded by walkFiles, if it exists (bool)
+        Only the folders between the walked folder and the file are checked, not the whole folder. Symbolic links are not followed.
+    """
+    relative = os.path.relpath(path, folder)
+    if os.path.isabs(relative) or relative.split(os.sep)[0] == os.pardir:
+        return False
+    if os.path.splitext(path)[1] not in extensions:
+        return False
+
+    parts = relative.split(os.sep)
+    rules = GitIgnore().extend(folder, "", cache) if gitignore else None
+    current = folder
+    entry_relative = ""
+    for i, name in enumerate(parts):
+        entry_relative = entry_relative + "/" + name if entry_relative != "" else name
+        is_folder = i < len(parts) - 1
+
+        if exclude and matches(entry_relative, name, exclude):
+            return False
+        if rules is not None and rules.ignores(entry_relative, is_folder):
+            return False
+
+        if is_folder:
+            current = os.path.join(current, name)
+            if name in EXCLUDED_FOLDERS or os.path.isfile(os.path.join(current, VIRTUALENV_MARKER)):
+                return False
+            if rules is not None:
+                rules = rules.extend(current, entry_relative, cache)
+
+    return not include or matches(entry_relative, parts[-1], include)
@@ -107,14 +107,14 @@ class DocumentationScreen(QWidget):
         """ Redefined Object method
             Params: QDragEnterEvent event -> Object dragged onto the widget
             Return: None
-            Finds the path of each file dropped onto the widget and sends it (if possible) to the addFiles method of the FileHandler object, attribute of the parent object.
+            Finds the path of each file dropped onto the widget and sends it (if possible) to the addFiles method of the parent object, which adds them in the background.
         """
         files = []
         for url in event.mimeData().urls():
             files.append(url.toLocalFile())
 
         try:
-            self.parent()._files.addFiles(files)
+            self.parent().addFiles(files)
         except Exception:
             pass;
             
@@ -3,26 +3,55 @@
 
 import os
 import shutil
+import threading
 from style_handler import StyleHandler
-from html_gen import PythonFile
+from html_gen import PythonSource
+from parse_budget import ParseBudget
+from parse_cache import ParseCache
+from build_manifest import BuildManifest
+from parallel_gen import generateFiles
+from dir_walker import walkFiles
+from search_index import SearchIndex
+from file_registry import FileRegistry
+from templates import DEFAULT_TEMPLATES
+from compression import compressAsset, compressFile
 from constants import *
 
 
 class FileHandler:
     """ Manages all the python and html files of the application. 
         It can add files in the correct list, by reading their extension, call the documentation generation of the python files and add a style to the html files.
-        Contains a list of python files and a list of html files.
+        Contains a registry of python files and a registry of html files (file_registry module), indexed by path.
+        The python files are queued as PythonSource objects, and only parsed when the documentation is generated, within a time budget (see parse_budget module).
+        The long operations (addFiles, processFiles and processStyles) notify their progress file by file (see notify()), and can be cancelled from another thread (see cancel()).
     """
 
     def __init__(self, parent=None):
         """ Constructor. 
-            Params: Window (goodoc module) parent -> the parent of the file handler.
+            Params: Window (goodoc module) parent -> the parent of the file handler. Has None for default value, when there is no graphical interface.
             return: self
         """
-        self._pythonFiles = [];
-        self._htmlFiles = [];
+        self._pythonFiles = FileRegistry()
+        self._htmlFiles = FileRegistry()
         self._order = NATURAL_ORDER;
+        self._engine = REGEX_ENGINE
+        self._templates = DEFAULT_TEMPLATES
+        self._budget = ParseBudget()
+        self._cache = None
+        self._incremental = False
+        self._jobs = 1
+        self._lazy = False
+        self._compress = False
+        self._include = ()
+        self._exclude = ()
+        self._style = None
+        self._pageStyles = {}
+        self._search = True
+        self._searchIndex = SearchIndex()
+        self._searchPage = None
         self._path = ""
+        self._progress = None
+        self._cancel = threading.Event()
         self._parent = parent;
 
 
@@ -32,24 +61,19 @@ class FileHandler:
             Return: None
             Adds files to the correct list.
             For each content_given's element, if it is a python or html file, it is appended to the correct list.
-            If it is a directory, extractFiles() is called.
-            For each element of the files list, it reads the extension and adds it to the correct list.
+            If it is a directory, extractFiles() is called, with the include and exclude glob patterns of the handler.
+            For each element of the files list, it reads the extension and adds it to the correct list, unless it is already there.
+            The python files are neither read nor parsed here.
+            The views are updated once, after all the files are added.
+            Each new file is notified as discovered. If the operation is cancelled, the files discovered so far are kept.
         """
-        files = []
+        self._cancel.clear()
 
-        # files list creation
-        for el in content_given:
-
-            # File case
-            if os.path.isfile(el):
-                files.append(el)
+        # Each element is put in the correct list
+        for name in self.iterFiles(content_given):
 
-            # Dir case
-            if os.path.isdir(el):
-                files += self.extractFiles(el)
-
-        # Each element is put in the correct list, and views are updated.
-        for name in files:
+            if self._cancel.is_set():
+                break
 
             if self._path == "":
                 self._path =  os.path.join(os.path.dirname(name), NAME_CREATED_FOLDER);
@@ -58,48 +82,44 @@ class FileHandler:
 
             # Python files
             if extension in ('.py','.pyw'):
-                self._pythonFiles.append(PythonFile(name));
-                self._pythonFiles=list(set(self._pythonFiles)); #removing duplicates
-                python_list = self._parent.centralWidget().tab_bar.widget(0)
-                python_list.model().setPythonList(self._pythonFiles)
+                if name not in self._pythonFiles:
+                    self._pythonFiles.add(name, PythonSource(name))
+                    self.notify(PROGRESS_DISCOVERED, name)
 
             # Html files
             elif extension in ('.html','.htm'):
-                self._htmlFiles.append(name);
-                self._htmlFiles=list(set(self._htmlFiles)); #removing duplicates
-                html_list = self._parent.centralWidget().tab_bar.widget(1)
-                html_list.model().setStringList(self._htmlFiles)
-                
+                if self._htmlFiles.add(name):
+                    self.notify(PROGRESS_DISCOVERED, name)
 
-    @staticmethod
-    def extractFiles(folder):
-        """ Static method.
-            Params : String folder
-            Return Value : List containing path names of all files in specified folder and its subfolders
-        """
+        self.updatePythonView()
+        self.updateHtmlView()
 
-        #two lists are needed to avoid skipping files when doing operations on the source list
-        content = os.listdir(folder);
-        files = []
-
-        #fix for listdir not returning full path names
-        for i in range(0, len(content)):
-            content[i] = folder + "/" + content[i];
-
-
-        for el in content:
+    def iterFiles(self, content_given):
+        """ Object method
+            Params: List content_given -> a list of files and directories
+            Return: Generator of the given files, and of the files found in the given directories by extractFiles()
+        """
+        for el in content_given:
 
-            #keep only files with desired extensions
+            # File case
             if os.path.isfile(el):
-                extension = os.path.splitext(el)[1]
-                if extension in AUTHORIZED_EXTENSIONS:
-                    files.append(el);
+                yield el
 
-            #if el is a directory, recurse into it
-            elif os.path.isdir(el):
-                files += FileHandler.extractFiles(el);
+            # Dir case
+            if os.path.isdir(el):
+                yield from self.extractFiles(el, self._include, self._exclude)
 
-        return files;
+    @staticmethod
+    def extractFiles(folder, include = (), exclude = ()):
+        """ Static method.
+            Params : String folder
+                     tuple include -> glob patterns, one of which must match each file, has () for default value (all the files)
+                     tuple exclude -> glob patterns of the skipped files and folders, has () for default value
+            Return Value : Generator of the path names of all files with an authorized extension in specified folder and its subfolders
+            The folders are walked by the dir_walker module: version control folders, virtual environments, node_modules
+            and the files ignored by .gitignore files are skipped, and symbolic link loops are followed only once.
+        """
+        return walkFiles(folder, AUTHORIZED_EXTENSIONS, include, exclude)
 
 
     def processFiles(self):
@@ -110,40 +130,307 @@ class FileHandler:
             The folder wich is containing the generated documentation is first created, if it's necessary.
             If the folder's path is "", there is nothing to do, the method return false.
             Then, javascript file are copied into the folder.
-            For each python file, the method save is called.
+            Each python file is parsed, then its method save is called. A python file exceeding its parse time budget may be skipped, see parseReport().
             Then, the path of generated html file is added to the htmlFiles list.
-            The method then return True.
+            In incremental mode, a build manifest (build_manifest module) is kept in the folder: only the pages whose source or settings changed are generated,
+            and the pages whose source was removed are deleted.
+            If more than one job is set, the files are parsed, rendered and written by a pool of worker processes (see parallel_gen module).
+            If the _lazy attribute is set, the pages only outline their classes, whose sections are loaded on demand from fragment files (see PythonFile.save).
+            If the _compress attribute is set, the compressed copies of the pages are written while they are generated, for static web servers (see compression module).
+            The copies of the javascript file and of the style sheet are only written again if they changed.
+            The least recently used entries of the parse cache are evicted, if it is enabled, and the child process of the parse time budget is stopped.
+            If the style of the documentation is known (_style attribute), the pages link it directly and it is copied into the folder: they need not be restyled.
+            The symbols of the generated files are added to the search index, which is then saved with the documentation (see saveSearchIndex()).
+            In incremental mode, the symbols of the pages which are not generated again are read from the build manifest.
+            Each file is notified as parsed, then its page as written.
+            If the operation is cancelled, the files not generated yet stay in the python files list, and the method return false.
+            Else, the method then return True.
         """
         if self._path == "":
             return False
-
-        if not os.path.exists(self._path) and self._pythonFiles != []:
-            os.mkdir(self._path)
-        shutil.copy(JAVASCRIPT_FILE_PATH, self._path)
-
+        self._cancel.clear()
+
+        if not os.path.exists(self._path) and len(self._pythonFiles) > 0:
+            os.makedirs(self._path)
+        self.copyAsset(JAVASCRIPT_FILE_PATH)
+        if self._style is not None:
+            self.copyAsset(self._style)
+        style = self.styleName()
+
+        if self._incremental:
+            manifest = BuildManifest(self._path)
+            settings = self.buildSettings()
+
+            for html_file in manifest.removeStale():
+                self._htmlFiles.discard(html_file)
+                self._searchIndex.remove(html_file)
+
+        # Pages to generate
+        pending = []
+        generated = {}
+        symbols = {}
         for f in self._pythonFiles:
-            self._htmlFiles.append(f.save(self._path, self._order))
-            
-        self._pythonFiles = []
+            if self._incremental and manifest.isUpToDate(f._path, settings):
+                generated[f._path] = manifest.output(f._path)
+                self._htmlFiles.add(generated[f._path])
+                self._searchIndex.add(generated[f._path], manifest.symbols(f._path))
+            else:
+                pending.append(f)
+
+        if self._jobs > 1:
+            results = generateFiles([f._path for f in pending], self._path, self._order, self._engine,
+                                    self._templates, self._cache, self._budget._budget, self._jobs, style, self._lazy, self._compress)
+            for source, new_path, diagnostics, file_symbols in results:
+                generated[source] = new_path
+                symbols[source] = file_symbols
+                self._budget.record(diagnostics)
+                if new_path is not None:
+                    self.notify(PROGRESS_PARSED, source)
+                    self.notify(PROGRESS_WRITTEN, new_path)
+                if self._cancel.is_set():
+                    results.close()
+                    break
+        else:
+            for f in pending:
+                if self._cancel.is_set():
+                    break
+                python_file = f.parse(self._budget, self._engine, self._cache)
+                generated[f._path] = None
+                if python_file is not None:
+                    self.notify(PROGRESS_PARSED, f._path)
+                    generated[f._path] = python_file.save(self._path, self._order, self._templates, style, self._lazy, self._compress)
+                    symbols[f._path] = python_file.symbols()
+                    self.notify(PROGRESS_WRITTEN, generated[f._path])
+
+        # The pages are listed in the order of the python files
+        for f in pending:
+            new_path = generated.get(f._path)
+            if new_path is None:
+                continue
+            if self._incremental:
+                manifest.record(f._path, settings, new_path, symbols[f._path])
+            self._htmlFiles.add(new_path)
+            self._pageStyles[new_path] = style
+            self._searchIndex.add(new_path, symbols[f._path])
+
+        if self._incremental:
+            manifest.save()
+        self.saveSearchIndex()
+
+        cancelled = self._cancel.is_set()
+        if cancelled:
+            for path in generated:
+                self._pythonFiles.discard(path)
+        else:
+            self._pythonFiles.clear()
+
+        # The cache is kept below its maximum size once per run
+        if self._cache is not None:
+            self._cache.evict()
+        self._budget.close()
+
+        self.updateHtmlView()
+        self.updatePythonView()
+        return not cancelled
+
+    def notify(self, stage, path):
+        """ Object method
+            Params: String stage -> the progress stage (PROGRESS_DISCOVERED, PROGRESS_PARSED, PROGRESS_WRITTEN or PROGRESS_RESTYLED constant)
+                    String path -> the path of the file concerned
+            Return: None
+            Calls the progress callback of the handler, if any, with the stage and the path.
+            The callback is set by the worker running the operation in the background (worker module), and is called in the worker's thread.
+        """
+        if self._progress is not None:
+            self._progress(stage, path)
 
-        html_list = self._parent.centralWidget().tab_bar.widget(1)
-        html_list.model().setStringList(self._htmlFiles)
+    def cancel(self):
+        """ Object method
+            Params: None
+            Return: None
+            Cancels the running operation, from any thread. The operation stops after the file being handled: no page is left half-written.
+        """
+        self._cancel.set()
+
+    def updatePythonView(self):
+        """ Object method
+            Params: None
+            Return: None
+            Displays the python files list in the 'Python' tab of the documentation screen, if there is a graphical interface.
+            While a worker runs an operation in the background, the view is updated by the worker instead, in the thread of the interface.
+        """
+        if self._parent is None or self._progress is not None:
+            return
         python_list = self._parent.centralWidget().tab_bar.widget(0)
         python_list.model().setPythonList(self._pythonFiles)
-        return True
+
+    def updateHtmlView(self):
+        """ Object method
+            Params: None
+            Return: None
+            Displays the html files list in the 'HTML' tab of the documentation screen, if there is a graphical interface.
+            While a worker runs an operation in the background, the view is updated by the worker instead, in the thread of the interface.
+        """
+        if self._parent is None or self._progress is not None:
+            return
+        html_list = self._parent.centralWidget().tab_bar.widget(1)
+        html_list.model().setStringList(list(self._htmlFiles))
+
+    def buildSettings(self):
+        """ Object method
+            Params: None
+            Return: the settings of the documentation generation (String), recorded in the build manifest.
+            A page generated with other settings is generated again by an incremental build.
+        """
+        return "/".join((GENERATOR_VERSION, self._order, self._engine, self._templates.fingerprint(),
+                         "lazy" if self._lazy else "full", "compressed" if self._compress else "plain"))
+
+    def enableCache(self, folder, max_size = PARSE_CACHE_MAX_SIZE):
+        """ Object method
+            Params: String folder -> the cache folder
+                    int max_size -> the maximum size of the cache, in bytes. Has PARSE_CACHE_MAX_SIZE constant for default value
+            Return: None
+            From now on, the parsed python files are stored in the cache folder, and unchanged files are read from it instead of being parsed.
+        """
+        self._cache = ParseCache(folder, max_size)
+
+    def clearCache(self):
+        """ Object method
+            Params: None
+            Return: None
+            Removes all the entries of the cache, if it is enabled.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def parseReport(self):
+        """ Object method
+            Params: None
+            Return: the report of the python files which exceeded their parse time budget, and of the pages which couldn't be restyled, since the last call (String).
+                    Empty if there is no such file.
+        """
+        return self._budget.report()
+
+    def saveSearchIndex(self):
+        """ Object method
+            Params: None
+            Return: None
+            Writes the search index (search_index module), the search page and the search script in the documentation folder, if the search is enabled.
+            The search page links the style of the handler, and is restyled with the pages.
+            If the _compress attribute is set, their compressed copies are written too.
+        """
+        if not self._search:
+            return
+        self._searchPage = self._searchIndex.save(self._path, self.styleName(), self._compress)
+        self._pageStyles[self._searchPage] = self.styleName()
+
+    def previewPage(self):
+        """ Object method
+            Params: None
+            Return: the path of the smallest existing html file (String), previewed by the style screen, or None if there is none
+            The smallest page is displayed the fastest, and shows the style as well as any other.
+        """
+        sizes = {}
+        for html_file in self._htmlFiles:
+            try:
+                sizes[html_file] = os.path.getsize(html_file)
+            except OSError:
+                continue
+
+        if sizes == {}:
+            return None
+        return min(sizes, key=sizes.get)
+
+    def styleName(self):
+        """ Object method
+            Params: None
+            Return: the quoted name of the style sheet linked by the generated pages (String): the basename of the _style attribute,
+                    or the STYLE_BASENAME placeholder if the style isn't known yet
+        """
+        if self._style is None:
+            return STYLE_BASENAME
+        return "'" + os.path.basename(self._style) + "'"
 
     def processStyles(self, style_path):
         """ Object method
             Params: style_path (str) -> The style's path
+            Return: False if the operation was cancelled, else True (bool)
+            Copies the style of style_path into the created dir, created again if it was removed, and applies it to the documentation. It becomes the style of the handler.
+            The pages generated with this style are not rewritten: only the other pages are restyled, by a pool of threads (see StyleHandler.setStyles()).
+            If the _compress attribute is set, the compressed copies of the style sheet and of the restyled pages are written again.
+            Each restyled page is notified. A page which can't be restyled keeps its style, and is reported by parseReport().
+        """
+        self._cancel.clear()
+        self._style = style_path
+        style_name = self.styleName()
+        os.makedirs(self._path, exist_ok=True)
+        self.copyAsset(style_path)
+
+        pages = list(self._htmlFiles)
+        if self._searchPage is not None and os.path.isfile(self._searchPage):
+            pages.append(self._searchPage)
+
+        diagnostics = []
+        restyled = StyleHandler.setStyles([f for f in pages if self._pageStyles.get(f) != style_name], style_name, diagnostics=diagnostics)
+        for html_file, changed in restyled:
+            self._pageStyles[html_file] = style_name
+            if changed and self._compress:
+                compressFile(html_file)
+            self.notify(PROGRESS_RESTYLED, html_file)
+            if self._cancel.is_set():
+                restyled.close()
+                self._budget.record(diagnostics)
+                return False
+
+        self._budget.record(diagnostics)
+        return True
+
+    def copyAsset(self, path):
+        """ Object method
+            Params: String path -> the path of a javascript file or of a style sheet
+            Return: None
+            Copies the file into the documentation folder, and writes its compressed copies if the _compress attribute is set.
+            The contents are compared first: a copy holding the content of the file is not written again, nor are its compressed copies (see compressAsset()).
+        """
+        copy_path = os.path.join(self._path, os.path.basename(path))
+        try:
+            with open(path, "rb") as source, open(copy_path, "rb") as copy:
+                unchanged = source.read() == copy.read()
+        except OSError:
+            unchanged = False
+
+        if not unchanged:
+            shutil.copy(path, copy_path)
+        if self._compress:
+            compressAsset(copy_path)
+
+    def loadStyle(self):
+        """ Object method
+            Params: None
             Return: None
-            Applies the style of style_path to the documentation and copies it into the created dir.
+            Sets the style of the handler to the style saved by saveStyle(), if any and if it still exists.
         """
-        style_name = os.path.basename(style_path)
+        try:
+            with open(STYLE_SETTINGS_PATH, "r") as f:
+                style_path = f.read().strip()
+        except OSError:
+            return
 
-        for html_file in self._htmlFiles:
-            StyleHandler.setStyle(html_file, "'"+style_name+"'")
+        if os.path.isfile(style_path):
+            self._style = style_path
 
-        shutil.copyfile(style_path, self._path + "/" + style_name)
+    def saveStyle(self):
+        """ Object method
+            Params: None
+            Return: None
+            Saves the style of the handler, so that the next sessions generate their pages with it directly (see loadStyle()).
+        """
+        if self._style is None:
+            return
+        if not os.path.isdir(SAVE_FOLDER_PATH):
+            os.mkdir(SAVE_FOLDER_PATH)
+        with open(STYLE_SETTINGS_PATH, "w") as f:
+            f.write(os.path.abspath(self._style))
 
 
 
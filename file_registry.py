@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the registry of the files handled by the application.
+
+    A registry is an ordered list of files, indexed by their normalized absolute path: a file is found, added or discarded in constant time,
+    and the same file can't be added twice, even through different paths (relative path, '..', case on Windows).
+    It behaves as a list for the models of the documentation screen (len, indexing, iteration and pop).
+    Only popping the last item is done in constant time: popping another index walks the registry up to it.
+"""
+
+import os
+from itertools import islice
+
+
+class FileRegistry:
+    """ Inherits: None
+        Class modeling an ordered collection of files, without duplicates.
+        Each item (a path, or a PythonFile) is registered with the path of its file.
+    """
+
+    __slots__ = ("_items", "_list")
+
+    def __init__(self):
+        """ Constructor
+            Params: None
+            Return: self
+            The registry is empty. _items maps the key of each file to its item, in the order of addition.
+            _list is the list of the items, built on the first indexing after a removal (None until then), so that indexing row by row stays in constant time.
+        """
+        self._items = {}
+        self._list = []
+
+    @staticmethod
+    def key(path):
+        """ Static method
+            Params: String path -> a file's path
+            Return: the key of the file in a registry (String): its normalized absolute path
+        """
+        return os.path.normcase(os.path.abspath(path))
+
+    def add(self, path, item = None):
+        """ Object method
+            Params: String path -> the file's path
+                    item -> the registered item, has None for default value (the path itself)
+            Return: True if the file was added, False if it was already registered (bool)
+        """
+        key = self.key(path)
+        if key in self._items:
+            return False
+
+        item = path if item is None else item
+        self._items[key] = item
+        if self._list is not None:
+            self._list.append(item)
+        return True
+
+    def discard(self, path):
+        """ Object method
+            Params: String path -> the file's path
+            Return: None
+            Removes the file from the registry, if it is registered, in constant time.
+        """
+        key = self.key(path)
+        if key in self._items:
+            del self._items[key]
+            self._list = None
+
+    def pop(self, index = -1):
+        """ Object method
+            Params: int index -> index of the removed item, has -1 for default value (the last one)
+            Return: the removed item
+            The last item is removed in constant time, any other in a time proportional to its index.
+        """
+        if len(self._items) == 0:
+            raise IndexError("pop from empty registry")
+
+        if index == -1 or index == len(self._items) - 1:
+            key, item = self._items.popitem()
+            if self._list is not None:
+                self._list.pop()
+            return item
+
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("pop index out of range")
+
+        key = next(islice(self._items, index, None))
+        self._list = None
+        return self._items.pop(key)
+
+    def clear(self):
+        """ Object method
+            Params: None
+            Return: None
+            Removes all the files of the registry.
+        """
+        self._items.clear()
+        self._list = []
+
+    def __contains__(self, path):
+        """ Special method
+            Params: String path -> a file's path
+            Return: True if the file is registered (bool), with syntax:
+                path in registry
+        """
+        return self.key(path) in self._items
+
+    def __getitem__(self, index):
+        """ Special method
+            Params: int index -> the index of the wanted item
+            Return: the item at the given index, with syntax:
+                registry[index]
+        """
+        if self._list is None:
+            self._list = list(self._items.values())
+        return self._list[index]
+
+    def __len__(self):
+        """ Special method
+            Params: None
+            Return: the number of registered files
+        """
+        return len(self._items)
+
+    def __iter__(self):
+        """ Special method
+            Params: None
+            Return: an iterator over the items, in the order of addition
+        """
+        return iter(self._items.values())
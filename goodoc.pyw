@@ -10,14 +10,13 @@ import sys
 import os
 
 from PyQt5.QtCore import QDir
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QAbstractItemView, QListView, QAction, QDialog, QFileDialog, QDialogButtonBox, QRadioButton, QToolBar, QVBoxLayout)
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QAbstractItemView, QListView, QAction, QDialog, QFileDialog, QDialogButtonBox, QRadioButton, QToolBar, QVBoxLayout, QMessageBox)
 from PyQt5.QtGui import QIcon
 
 from doc_screen import DocumentationScreen
-from style_screen import StyleScreen
 from dialogs import SettingsDialog
 from file_handler import FileHandler
-from html_gen import PythonFile
+from worker import Worker
 from constants import *
 
 
@@ -27,16 +26,22 @@ class Window (QMainWindow):
         This class is the main class of the application.
         It contains a FileHandler (file_handler module) containing the python and HTML files managed in the application.
         It sets consecutively as central widget a DocumentationScreen (doc_screen module) and a StyleScreen (style_screen module).
+        The style_screen module, which needs QtWebKit, is only imported when the style screen is shown, so the window appears faster.
+        The long operations of the file handler run in the background, on a Worker (worker module): their progress is displayed in the status bar, and they can be cancelled.
     """
 
     def __init__(self):
         """ Constructor
             Params: None
             Return: self
-            This method creates the file handler. Then the documentation screen is set as central widget.
+            This method creates the file handler, with the style saved by the previous session, if any. Then the documentation screen is set as central widget.
+            No worker is running.
         """
         super().__init__();
         self._files = FileHandler(self);
+        self._files.loadStyle()
+        self._worker = None
+        self._progress = dict.fromkeys(PROGRESS_STAGES, 0)
         self.setDocumentationScreen();
 
     def setStyleSheet(self, path):
@@ -71,7 +76,8 @@ class Window (QMainWindow):
         """ Object method
             Params: None
             Return: None
-            Creates a ToolBar with 4 buttons connected to 4 methods : fileSelectDialog(), dirSelectDialog(), FileHandler.processFiles() and settings().
+            Creates a ToolBar with 5 buttons connected to 5 methods : fileSelectDialog(), dirSelectDialog(), generate(), settings() and cancel().
+            The cancel action is also added to the window, so that its shortcut works on every screen. It is only enabled while a worker is running.
         """
         self.toolbar = QToolBar(self);
         
@@ -85,19 +91,141 @@ class Window (QMainWindow):
 
         startGenAction=QAction(QIcon(START_ICON), START_TIP, self);
         startGenAction.setShortcut(START_SHORTCUT);
-        startGenAction.triggered.connect(self._files.processFiles);
+        startGenAction.triggered.connect(lambda: self.generate());
 
         settingsAction=QAction(QIcon(SETTINGS_ICON), SETTINGS_TIP, self);
         settingsAction.setShortcut(SETTINGS_SHORTCUT);
         settingsAction.triggered.connect(self.settings);
 
+        self.cancelAction = QAction(QIcon(CANCEL_ICON), CANCEL_TIP, self)
+        self.cancelAction.setShortcut(CANCEL_SHORTCUT)
+        self.cancelAction.triggered.connect(self.cancel)
+        self.cancelAction.setEnabled(self._worker is not None)
+        self.addAction(self.cancelAction)
+
+        self._actions = (addFileAction, addDirAction, startGenAction, settingsAction)
 
         self.addToolBar(self.toolbar);
         self.toolbar.addAction(addFileAction);
         self.toolbar.addAction(addDirAction);
         self.toolbar.addAction(startGenAction);
         self.toolbar.addAction(settingsAction);
+        self.toolbar.addAction(self.cancelAction);
+
+
+    def generate(self, finished = None):
+        """ Object method
+            Params: function finished -> function called without parameter once the documentation is generated, if it wasn't cancelled. Has None for default value
+            Return: True if the generation is started, False if another operation is running (bool)
+            Generates the documentation in the background (FileHandler.processFiles()). The files which exceeded their parse time budget are then reported in a message box.
+        """
+        def generationFinished(generated):
+            report = self._files.parseReport()
+            if report != "":
+                QMessageBox.warning(self, PARSE_REPORT_TITLE, report)
+            if generated and finished is not None:
+                finished()
+
+        return self.runInBackground(generationFinished, self._files.processFiles)
+
+    def addFiles(self, paths):
+        """ Object method
+            Params: List paths -> a list of files and directories
+            Return: True if the operation is started, False if another operation is running (bool)
+            Adds the files to the file handler in the background (FileHandler.addFiles()).
+        """
+        return self.runInBackground(None, self._files.addFiles, paths)
+
+    def runInBackground(self, finished, operation, *args):
+        """ Object method
+            Params: function finished -> function called with the return value of the operation once it is finished, or None
+                    function operation -> an operation of the file handler
+                    args -> the arguments of the operation
+            Return: True if the operation is started, False if another operation is running (bool)
+            Runs the operation on a new Worker. Meanwhile, the actions and the central widget are disabled, except for the cancel action.
+        """
+        if self._worker is not None:
+            return False
+
+        self._progress = dict.fromkeys(PROGRESS_STAGES, 0)
+        self._worker = Worker(self._files, operation, *args)
+        self._worker.progress.connect(self.showProgress)
+        self._worker.finished.connect(lambda: self.operationFinished(finished))
+        self.setBusy(True)
+        self._worker.start()
+        return True
+
+    def operationFinished(self, finished):
+        """ Object method
+            Params: function finished -> function called with the return value of the operation, or None
+            Return: None
+            Called in the thread of the interface once the worker is finished. The views of the documentation screen are updated as a whole.
+        """
+        result = self._worker.result()
+        self._worker = None
+        self.setBusy(False)
+        self.statusBar().showMessage(CANCELLED_MESSAGE if self._files._cancel.is_set() else DONE_MESSAGE)
+
+        if isinstance(self.centralWidget(), DocumentationScreen):
+            self._files.updatePythonView()
+            self._files.updateHtmlView()
+
+        if finished is not None:
+            finished(result)
+
+    def showProgress(self, stage, path):
+        """ Object method
+            Params: String stage -> the progress stage (PROGRESS_* constants)
+                    String path -> the path of the file concerned
+            Return: None
+            Displays the number of files of each stage in the status bar.
+            On the documentation screen, the discovered python files and the discovered or written html files are appended to the views as they arrive.
+        """
+        self._progress[stage] += 1
+        self.statusBar().showMessage(PROGRESS_MESSAGE.format(**self._progress))
+
+        if not isinstance(self.centralWidget(), DocumentationScreen):
+            return
+
+        extension = os.path.splitext(path)[1]
+        if stage == PROGRESS_DISCOVERED and extension in ('.py', '.pyw'):
+            self.centralWidget().tab_bar.widget(0).model().appendRows()
+        elif stage == PROGRESS_WRITTEN or (stage == PROGRESS_DISCOVERED and extension in ('.html', '.htm')):
+            html_model = self.centralWidget().tab_bar.widget(1).model()
+            row = html_model.rowCount()
+            html_model.insertRows(row, 1)
+            html_model.setData(html_model.index(row), path)
+
+    def setBusy(self, busy):
+        """ Object method
+            Params: bool busy -> True while a worker is running
+            Return: None
+            Enables or disables the actions and the central widget. The cancel action is only enabled while a worker is running.
+        """
+        for action in self._actions:
+            action.setEnabled(not busy)
+        self.cancelAction.setEnabled(busy)
+        self.centralWidget().setEnabled(not busy)
+
+    def closeEvent(self, event):
+        """ Redefined Object method
+            Params: QCloseEvent event -> the close event
+            Return: None
+            The running worker, if any, is cancelled and waited for before the window is closed.
+        """
+        if self._worker is not None:
+            self._files.cancel()
+            self._worker.wait()
+        super().closeEvent(event)
 
+    def cancel(self):
+        """ Object method
+            Params: none
+            Return: none
+            Cancels the operation of the running worker, if any. The operation stops after the file being handled.
+        """
+        if self._worker is not None:
+            self._files.cancel()
 
     def settings(self):
         """ Object method
@@ -120,7 +248,7 @@ class Window (QMainWindow):
         file_dialog.setFileMode(QFileDialog.ExistingFiles);
 
         if file_dialog.exec_() :
-	        self._files.addFiles(file_dialog.selectedFiles());
+	        self.addFiles(file_dialog.selectedFiles());
 
     def dirSelectDialog(self):
         """ Object method
@@ -134,23 +262,31 @@ class Window (QMainWindow):
         if file_dialog.exec_():
 	        directories = file_dialog.selectedFiles()
 	        if len(directories) > 0:
-	            self._files.addFiles(directories);
+	            self.addFiles(directories);
 
     ## Stylesheets ##
 
     def setStyleScreen(self):
+        """ Object method
+            Params: none
+            Return: none
+            Generates the documentation, then calls showStyleScreen() if it wasn't cancelled.
+        """
+        self.generate(self.showStyleScreen)
+
+    def showStyleScreen(self):
         """ Object method
             Params: none
             Return: none
             Creates the Style screen and sets it as central widget. The toolbar is removed and the window title is changed.
+            The style_screen module is imported here, on first use.
         """
-        
-        if self._files.processFiles():
-            style_screen = StyleScreen(self)
-            self.setCentralWidget(style_screen)
-            self.setStyleSheet(STYLESCREEN_STYLESHEET_PATH)
-            self.removeToolBar(self.toolbar)
-            self.setWindowTitle(STYLE_TITLE);
+        from style_screen import StyleScreen
+        style_screen = StyleScreen(self)
+        self.setCentralWidget(style_screen)
+        self.setStyleSheet(STYLESCREEN_STYLESHEET_PATH)
+        self.removeToolBar(self.toolbar)
+        self.setWindowTitle(STYLE_TITLE);
 
 
 if __name__ == "__main__":
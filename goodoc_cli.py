@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Command line interface of the GooDoc Application.
+
+    It generates the documentation without the graphical interface, and never imports PyQt5, so it starts fast (e.g. in continuous integration).
+    The files are discovered and documented by a FileHandler (file_handler module), as in the graphical interface.
+
+    Usage: python goodoc_cli.py [options] files, directories or globs...
+    Run 'python goodoc_cli.py --help' for the list of options.
+"""
+
+import os
+import sys
+import glob
+import argparse
+
+from file_handler import FileHandler
+from watcher import Watcher
+from templates import TemplateSet
+from constants import *
+
+
+# Style sheets shipped with GooDoc, by name
+DEFAULT_STYLES = {
+    STYLE_GOO_NAME: STYLE_GOO_PATH,
+    STYLE_DEEPBLUE_NAME: STYLE_DEEPBLUE_PATH,
+    STYLE_MELTDOWN_NAME: STYLE_MELTDOWN_PATH,
+    STYLE_DOXYGEN_NAME: STYLE_DOXYGEN_PATH,
+}
+
+
+def parseArguments(arguments):
+    """ Function
+        Params: List arguments -> the command line arguments, without the program's name
+        Return: the parsed arguments (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(description=CLI_DESCRIPTION)
+    parser.add_argument("paths", nargs="+", help="python or html files, directories or globs")
+    parser.add_argument("-o", "--output", help="documentation folder (default: %s, next to the first file)" % NAME_CREATED_FOLDER)
+    parser.add_argument("--order", choices=(NATURAL_ORDER, ALPHABETICAL_ORDER), default=NATURAL_ORDER,
+                        help="order of the classes and methods")
+    parser.add_argument("--style", help="name of a GooDoc style sheet (%s) or path to a CSS file" % ", ".join(DEFAULT_STYLES))
+    parser.add_argument("--engine", choices=(REGEX_ENGINE, AST_ENGINE), default=REGEX_ENGINE, help="parsing engine")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--incremental", action="store_true", help="only generate the pages whose source changed")
+    parser.add_argument("--cache-dir", help="folder of the parse cache (disabled by default)")
+    parser.add_argument("--templates", help="folder containing user templates")
+    parser.add_argument("--include", action="append", default=[], metavar="GLOB",
+                        help="in the given directories, only document the files matching this pattern (repeatable)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="GLOB",
+                        help="skip the files and directories matching this pattern (repeatable)")
+    parser.add_argument("--lazy-classes", action="store_true",
+                        help="only outline the classes in the pages, and load their sections when they are expanded or scrolled into view")
+    parser.add_argument("--compress", action="store_true",
+                        help="also write the gzip (and brotli, if installed) copies of the pages, for static web servers")
+    parser.add_argument("--no-search", action="store_true", help="don't generate the search index and page")
+    parser.add_argument("--watch", action="store_true", help="keep running, and generate again the pages of the edited files")
+    return parser.parse_args(arguments)
+
+
+def expandPaths(paths):
+    """ Function
+        Params: List paths -> files, directories or globs
+        Return: the existing files and directories (List of String), the globs being expanded
+        A message is printed for each path matching nothing.
+    """
+    expanded = []
+    for path in paths:
+        if os.path.exists(path):
+            expanded.append(path)
+            continue
+
+        matches = sorted(glob.glob(path, recursive=True))
+        if matches == []:
+            print("goodoc: no such file: " + path, file=sys.stderr)
+        expanded += matches
+
+    return expanded
+
+
+def stylePath(style):
+    """ Function
+        Params: String style -> name of a GooDoc style sheet, or path to a CSS file
+        Return: the path of the style sheet (String), or None if there is no such style
+    """
+    if os.path.isfile(style):
+        return style
+
+    for name, path in DEFAULT_STYLES.items():
+        if name.lower() == style.lower():
+            return path
+
+    return None
+
+
+def main(arguments = None):
+    """ Function
+        Params: List arguments -> the command line arguments, has None (sys.argv) for default value
+        Return: the exit status (int): 0 on success, 1 if no python or html file was given, or if the generation was interrupted, 2 for an invalid argument
+        Generates the documentation of the given paths, linking the style sheet, if any. The given html files are then restyled.
+        If only html files are given, they are restyled, and the style sheet is copied next to the first one, unless an output folder is given.
+        The files which exceeded their parse time budget are reported on the error output.
+        In watch mode, the function then returns only when the process is interrupted (see watcher module).
+    """
+    options = parseArguments(sys.argv[1:] if arguments is None else arguments)
+
+    style_path = None
+    if options.style is not None:
+        style_path = stylePath(options.style)
+        if style_path is None:
+            print("goodoc: no such style: " + options.style, file=sys.stderr)
+            return 2
+
+    handler = FileHandler()
+    handler._order = options.order
+    handler._engine = options.engine
+    handler._jobs = max(1, options.jobs)
+    handler._lazy = options.lazy_classes
+    handler._compress = options.compress
+    handler._incremental = options.incremental
+    handler._include = tuple(options.include)
+    handler._exclude = tuple(options.exclude)
+    handler._style = style_path
+    handler._search = not options.no_search
+    if options.output is not None:
+        handler._path = options.output
+    if options.cache_dir is not None:
+        handler.enableCache(options.cache_dir)
+    if options.templates is not None:
+        handler._templates = TemplateSet.load(options.templates)
+
+    paths = expandPaths(options.paths)
+    handler.addFiles(paths)
+    given_pages = set(handler._htmlFiles)
+
+    if len(handler._pythonFiles) == 0 and len(given_pages) == 0:
+        print("goodoc: nothing to document", file=sys.stderr)
+        return 1
+
+    generated = []
+    if len(handler._pythonFiles) > 0:
+        if not handler.processFiles():
+            print("goodoc: the generation was interrupted", file=sys.stderr)
+            return 1
+        generated = [page for page in handler._htmlFiles if page not in given_pages]
+    elif options.output is None:
+        handler._path = os.path.dirname(next(iter(given_pages))) or "."
+
+    if style_path is not None:
+        os.makedirs(handler._path, exist_ok=True)
+        handler.processStyles(style_path)
+
+    report = handler.parseReport()
+    if report != "":
+        print(PARSE_REPORT_TITLE + ":\n" + report, file=sys.stderr)
+
+    if generated != []:
+        print("%d pages generated in %s" % (len(generated), handler._path))
+    if given_pages:
+        print("%d html files %s" % (len(given_pages), "restyled" if style_path is not None else "given, without any style to apply"))
+
+    if options.watch:
+        print("watching for changes, press Ctrl+C to stop")
+        Watcher(paths, handler).run(printPages)
+
+    return 0
+
+
+def printPages(pages):
+    """ Function
+        Params: List pages -> the paths of the pages generated or removed in watch mode
+        Return: None
+    """
+    for page in pages:
+        print(("updated " if os.path.exists(page) else "removed ") + page)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,10 @@
 
 """ Module modeling all the Python elements used in the GooDoc Project.
 
-    It contains four classes:
+    It contains five classes:
         - PythonElement: Superclass of all python elements.
         - PythonFile : Data structure representing a Python file
+        - PythonSource : Data structure representing a Python file waiting for its documentation, not parsed yet
         - PythonClass : Data structure representing a Python class, inside a file
         - PythonMethod : Data structure representing a Python method, inside a Python class
 """
@@ -13,6 +14,12 @@
 import os
 import re
 import sys
+import json
+import shutil
+from itertools import chain
+from ast_engine import AstEngine
+from templates import DEFAULT_TEMPLATES
+from compression import CompressedCopies, compressedPaths, removeCompressed
 from constants import *
 
 
@@ -20,38 +27,71 @@ class PythonElement:
     """ Inherits: None
         This class represents an abstract block of Python code. It must be subclassed.
         It has one attribute, _name, and a method initDocstring.
+        The docstring is stored raw, and only formatted when the _docstring property is first read.
+        The elements declare their attributes in __slots__ and intern their names, to keep large corpora compact in memory.
     """
 
+    __slots__ = ("_name", "_raw_docstring", "_indentation_level", "_formatted_docstrings")
+
     def __init__(self, name):  
         """ Constructor
             Param: String name -> the name of the python element
             Return: None
-            Initializes the attribute _name with the name given in params 
+            Initializes the attribute _name with the interned name given in params 
         """
-        self._name = name
+        self._name = sys.intern(name)
 
     def initDocstring(self, docstring, indentation_level):
         """ Object method
             Params: String docstring -> the docstring to initialize
                     int indentation_level -> the indentation level to add to the docstring
-            This method initializes and formats the element's docstring
-            It splits the docstring into a list of lines. Each line is stripped of its leading and tailing whitespaces.
-            The list of lines is then joined with '<br />' tags and appropriately indented.
+            This method initializes the element's raw docstring and its indentation level.
+            The docstring is formatted later, by formatDocstring(), when it is first needed.
         """
         if docstring == None:
-            self._docstring = ""
-            return 
+            docstring = ""
 
-        array_line = docstring.split("\n")
+        self._raw_docstring = docstring
+        self._indentation_level = indentation_level
+        self._formatted_docstrings = None
 
-        i = 0
-        length = len(array_line)
-        while i<length:
-            array_line[i] = array_line[i].strip()
-            i+=1
+    def formatDocstring(self, indentation_level):
+        """ Object method
+            Params: int indentation_level -> the indentation level to add to the docstring
+            Return: the formatted docstring (String)
+            It splits the docstring into a list of lines. Each line is stripped of its leading and tailing whitespaces.
+            The list of lines is then joined with '<br />' tags and appropriately indented.
+            The result is memoized for each indentation level.
+        """
+        if self._formatted_docstrings is None:
+            self._formatted_docstrings = {}
+        elif indentation_level in self._formatted_docstrings:
+            return self._formatted_docstrings[indentation_level]
+
+        array_line = [line.strip() for line in self._raw_docstring.split("\n")]
 
         sep = "<br />\n"+"\t"*indentation_level
-        self._docstring = sep.join(array_line)
+        formatted = sep.join(array_line)
+        self._formatted_docstrings[indentation_level] = formatted
+        return formatted
+
+    def excerpt(self):
+        """ Object method
+            Params: None
+            Return: the first non-empty line of the raw docstring, shortened to SEARCH_EXCERPT_LENGTH characters (String)
+        """
+        for line in self._raw_docstring.split("\n"):
+            line = line.strip()
+            if line != "":
+                return line[:SEARCH_EXCERPT_LENGTH]
+        return ""
+
+    @property
+    def _docstring(self):
+        """ Property
+            Return: the docstring, formatted with the element's indentation level (String)
+        """
+        return self.formatDocstring(self._indentation_level)
 
 
 
@@ -61,21 +101,62 @@ class PythonFile(PythonElement):
         This class represents a source file, written in Python. 
     """
 
-    def __init__(self, path):
+    __slots__ = ("_path", "_engine", "_classes", "_imported_modules", "_functions")
+
+    def __init__(self, path, engine = REGEX_ENGINE, cache = None):
         """ Constructor
             Params: String path -> the python file's path
+                    String engine -> the parsing engine (REGEX_ENGINE or AST_ENGINE), has REGEX_ENGINE constant for default value
+                    ParseCache cache -> the cache of the parsed files (parse_cache module), has None (no cache) for default value
             Return: None
             The content of the path's file is backed up
-            The _name attribute is the given path, without its extension.
-            The _classes attributes is an empty list, initialized with the extractContent method.
+            The _path attribute is the given path, the _name attribute is the given path, without its extension.
+            The _classes, _imported_modules and _functions attributes are empty lists, initialized with the extractContent method (regex engine) or the extractAstContent method (ast engine).
+            Only the ast engine finds the module-level functions.
+            If the cache holds an entry for the file's content, the attributes are initialized from it and the file is not parsed.
+            Else, the extracted content is stored in the cache.
         """
         with open(path, "r") as file_resource:
             data = file_resource.read()
 
         super().__init__(os.path.splitext(path)[0])
+        self._path = path
+        self._engine = engine
         self._classes = []
         self._imported_modules = []
-        self.extractContent(data)
+        self._functions = []
+
+        if cache is not None:
+            key = cache.key(data, engine)
+            content = cache.get(key)
+            if content is not None:
+                self.setContent(content)
+                return
+
+        if engine == AST_ENGINE:
+            self.extractAstContent(data)
+        else:
+            self.extractContent(data)
+
+        if cache is not None:
+            cache.put(key, self.content())
+
+    def content(self):
+        """ Object method
+            Params: None
+            Return: the content extracted from the file (tuple): raw docstring, imported modules, classes and functions.
+            It holds everything but the file's name, so it can be stored in the cache for any file with the same content.
+        """
+        return (self._raw_docstring, self._imported_modules, self._classes, self._functions)
+
+    def setContent(self, content):
+        """ Object method
+            Params: tuple content -> a content returned by the content method
+            Return: None
+            Initializes the file's docstring, imported modules, classes and functions with the given content.
+        """
+        docstring, self._imported_modules, self._classes, self._functions = content
+        self.initDocstring(docstring, FILE_INDENTATION_LEVEL)
 
 
     def extractContent(self, data):
@@ -84,7 +165,8 @@ class PythonFile(PythonElement):
             Return: None
             The docstring content is sent to the initDocstring method.
             From the given content, the _classes list is filled, using the extractClasses method.
-            Then the _imports list is initialized, by calling the extractImports method.
+            Then the _imports list is initialized, by calling the extractImports method, which skips the classes' blocks.
+            The content is walked once and never copied.
         """
         # Docstring initialization
         result = re.search(REGEX_DOCSTRING, data, re.DOTALL)
@@ -95,63 +177,100 @@ class PythonFile(PythonElement):
         self.initDocstring(docstring, FILE_INDENTATION_LEVEL)
 
         # Classes list creation
-        data = self.extractClasses(data)
+        class_spans = self.extractClasses(data)
 
         # importations list creation
-        data = self.extractImports(data)
+        self.extractImports(data, class_spans)
+
+    def extractAstContent(self, data):
+        """ Object method
+            Params: String data -> file's content.
+            Return: None
+            The content is parsed by an AstEngine (ast_engine module), which raises a SyntaxError if the content is not valid Python.
+            The docstring, the imports, the classes and the module-level functions of its outline fill the file's attributes.
+        """
+        outline = AstEngine(data).outline()
+
+        self.initDocstring(outline['docstring'], FILE_INDENTATION_LEVEL)
+        self._imported_modules = [sys.intern(element) for element in outline['imports']]
+
+        for name, docstring, methods in outline['classes']:
+            new_class = PythonClass(name, docstring)
+            new_class._methods = [PythonMethod(method_name, method_docstring) for method_name, method_docstring in methods]
+            self._classes.append(new_class)
+
+        self._functions = [PythonMethod(name, docstring) for name, docstring in outline['functions']]
 
     def extractClasses(self, data):
         """ Object method.
             Params: String data -> the file's content
-            Return: the rest of the file's content (String)
+            Return: the list of the (start, end) spans of the extracted classes, in the data param (List)
             This method extracts the python classes contained in the data param, and fills the _classes list.
             For each class, a PythonClass object is created and appended to the _classes list.
+            The search resumes where the previous class ended, so the content is walked once.
         """
         class_regex = re.compile(REGEX_CLASS, re.DOTALL)
+        class_spans = []
         result = class_regex.search(data)
 
         while result is not None:
             new_class = PythonClass(result.group("name"), result.group("docstring"), result.group("methods"))
             self._classes.append(new_class)
-            data = data[0:result.start()] + data[result.end()-1:]
-            result = class_regex.search(data)
+            # The character ending the class belongs to the next block
+            class_spans.append((result.start(), result.end()-1))
+            result = class_regex.search(data, result.end()-1)
 
-        return data
+        return class_spans
 
-    def extractImports(self, data):
+    def extractImports(self, data, class_spans = ()):
         """ Object method
             Params: String data -> the file's content
-            Return: the rest of file's content (String)
+                    List class_spans -> the (start, end) spans of the classes to skip, as returned by extractClasses. Has an empty tuple for default value
+            Return: None
             This method extracts the python imports contained in the data param, and fills the _imported_modules list.
             For each line, the name of the imported module is added to the _imported_modules list.
+            The 'import' lines come first, then the 'from ... import' lines.
         """
+        # Blocks of the content lying between the classes
+        blocks = []
+        start = 0
+        for class_start, class_end in class_spans:
+            blocks.append((start, class_start))
+            # The newline preceding the next block is kept, as it may open an import line
+            start = class_end - 1
+        blocks.append((start, len(data)))
 
         imports_regex = re.compile(REGEX_IMPORT)
-        result = imports_regex.search(data)
-
-        while result is not None:
-            self._imported_modules.append(result.group("module"))
-            data = data[0:result.start()] + data[result.end()-1:]
-            result = imports_regex.search(data)
+        for start, end in blocks:
+            result = imports_regex.search(data, start, end)
+            while result is not None:
+                self._imported_modules.append(sys.intern(result.group("module")))
+                result = imports_regex.search(data, result.end()-1, end)
 
         importfrom_regex = re.compile(REGEX_IMPORT_FROM)
-        result = importfrom_regex.search(data)
-
-        while result is not None:
-            self._imported_modules.append(result.group("lib")+"."+result.group("element"))
-            data = data[0:result.start()] + data[result.end()-1:]
-            result = importfrom_regex.search(data)
+        for start, end in blocks:
+            result = importfrom_regex.search(data, start, end)
+            while result is not None:
+                self._imported_modules.append(sys.intern(result.group("lib")+"."+result.group("element")))
+                result = importfrom_regex.search(data, result.end()-1, end)
 
-        return data
 
-
-    def save(self, path, order = NATURAL_ORDER):
+    def save(self, path, order = NATURAL_ORDER, templates = DEFAULT_TEMPLATES, style = STYLE_BASENAME, lazy = False, compress = False):
         """ Object method
             Params: String order -> the order of methods and classes (natural or alphabetical) in the documentation, has NATURAL_ORDER constant for default value
                     String path -> the save folder's path
+                    TemplateSet templates -> the templates of the documentation (templates module), has DEFAULT_TEMPLATES for default value
+                    String style -> the quoted name of the style sheet linked by the page, has STYLE_BASENAME constant (a placeholder, see StyleHandler.setStyle) for default value
+                    Boolean lazy -> if True, the page only contains the outline of the classes, whose sections are saved in fragment files (see saveFragments()).
+                                    Has False for default value
+                    Boolean compress -> if True, the compressed copies of the page are written too (see compression module), has False for default value
             Return: The new path of the generated file (String)
             This method generates html documentation of the current file, and saves it in a new file. 
             This file has the name of the current file, with a '.html' extension.
+            The documentation is streamed to the file, fragment by fragment (see iterDocument()), and is never held in memory as a whole.
+            It is written in a temporary file first, which then replaces the page: an interrupted generation never leaves a half-written page.
+            The fragments of a previous lazy generation are removed when the page is not lazy anymore.
+            The compressed copies are compressed while the page is streamed, so the page is never read again. Without compression, the previous copies are removed.
             May call the sort() method.
         """
         
@@ -159,90 +278,268 @@ class PythonFile(PythonElement):
             self.sort()
 
         new_path = os.path.join(path, os.path.basename(self._name) + ".html")
-        
-        with open(new_path, "w") as file_resource:
-            file_resource.write(self.document())
-
+        temporary_path = new_path + "." + str(os.getpid())
+
+        if lazy:
+            self.saveFragments(path, templates, compress)
+        elif os.path.isdir(self.fragmentFolder(path)):
+            shutil.rmtree(self.fragmentFolder(path))
+
+        try:
+            with open(temporary_path, "w", buffering = WRITE_BUFFER_SIZE) as file_resource:
+                if compress:
+                    with CompressedCopies(new_path) as copies:
+                        file_resource.writelines(copies.tee(self.iterDocument(templates, style, lazy), file_resource.encoding))
+                else:
+                    file_resource.writelines(self.iterDocument(templates, style, lazy))
+            os.replace(temporary_path, new_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        if not compress:
+            removeCompressed(new_path)
         return new_path
 
+    def fragmentFolder(self, path):
+        """ Object method
+            Params: String path -> the save folder's path
+            Return: the path of the folder containing the fragments of the page's classes (String): the page's name, with the CLASS_FRAGMENTS_SUFFIX suffix
+        """
+        return os.path.join(path, os.path.basename(self._name) + CLASS_FRAGMENTS_SUFFIX)
+
+    def saveFragments(self, path, templates = DEFAULT_TEMPLATES, compress = False):
+        """ Object method
+            Params: String path -> the save folder's path
+                    TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    Boolean compress -> if True, the compressed copies of the fragments are written too, has False for default value
+            Return: None
+            Saves the section of each class in its own javascript file, in the fragment folder of the page (see fragmentFolder()).
+            The file of the i-th class is named 'i.js', and inserts the section in place of its outline when the page loads it (see javascript/fold.js).
+            The fragments are javascript rather than html so that they can be loaded by a script tag, from the local file system.
+            The fragments of the classes which no longer exist are removed, and so is the folder of a file without any class.
+            Without compression, the compressed copies of previous fragments are removed too.
+        """
+        folder = self.fragmentFolder(path)
+        if self._classes == []:
+            if os.path.isdir(folder):
+                shutil.rmtree(folder)
+            return
+
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        names = set()
+        for i, python_class in enumerate(self._classes):
+            fragment_path = os.path.join(folder, str(i) + ".js")
+            content = CLASS_FRAGMENT_CALL % (json.dumps(CLASS_FRAGMENT_ID % i), json.dumps(python_class.document(templates)))
+            names.add(str(i) + ".js")
+            with open(fragment_path, "w", encoding="utf-8") as file_resource:
+                file_resource.write(content)
+
+            if compress:
+                with CompressedCopies(fragment_path) as copies:
+                    copies.write(content.encode("utf-8"))
+                names.update(os.path.basename(compressed_path) for compressed_path in compressedPaths(fragment_path))
+
+        for name in os.listdir(folder):
+            if name not in names:
+                os.remove(os.path.join(folder, name))
+
+    def symbols(self):
+        """ Object method
+            Params: None
+            Return: the symbols of the file, for the search index (search_index module): a list of (name, kind, owner, excerpt) tuples.
+            The kind is SYMBOL_CLASS, SYMBOL_METHOD or SYMBOL_FUNCTION, the owner is the class of a method ("" for the others) and the excerpt is given by excerpt().
+            The symbols are read from the elements of the file, which is not parsed again.
+        """
+        symbols = []
+        for python_class in self._classes:
+            symbols.append((python_class._name, SYMBOL_CLASS, "", python_class.excerpt()))
+            for method in python_class._methods:
+                symbols.append((method._name, SYMBOL_METHOD, python_class._name, method.excerpt()))
+
+        for function in self._functions:
+            symbols.append((function._name, SYMBOL_FUNCTION, "", function.excerpt()))
+
+        return symbols
+
     def sort(self):
         """ Object method
             Params: None
             Return: None
             Each class sorts its elements by alphabetical order. 
-            Then self sorts its classes in the same way.
+            Then self sorts its classes and its functions in the same way.
         """
 
         for python_class in self._classes:
             python_class.sort()
 
         self._classes.sort(key = lambda x: x._name)
+        self._functions.sort(key = lambda x: x._name)
 
 
-    def document(self):
+    def document(self, templates = DEFAULT_TEMPLATES, style = STYLE_BASENAME, lazy = False):
         """ Object method
-            Params: None
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    String style -> the quoted name of the style sheet, has STYLE_BASENAME constant for default value
+                    Boolean lazy -> if True, the classes are only outlined (see iterBody()), has False for default value
             Return: documentation of the current file (String).
-            This method generates the documentation of the PythonFile for which it is called by calling documentHead() and documentBody().
+            This method generates the documentation of the PythonFile for which it is called, by joining the fragments of iterDocument().
+        """
+        return "".join(self.iterDocument(templates, style, lazy))
+
+    def iterDocument(self, templates = DEFAULT_TEMPLATES, style = STYLE_BASENAME, lazy = False):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    String style -> the quoted name of the style sheet, has STYLE_BASENAME constant for default value
+                    Boolean lazy -> if True, the classes are only outlined (see iterBody()), has False for default value
+            Yield: the fragments of the documentation of the current file (String).
+            This method renders the page template, filled by calling iterHead() and iterBody().
         """
-        html_documentation = "<!DOCTYPE html>\n"
-        html_documentation += "<html>\n"
-        html_documentation += self.documentHead()
-        html_documentation += self.documentBody()
-        html_documentation += "</html>\n"
-        return html_documentation
+        return templates.page.render({
+            'head': self.iterHead(templates, style),
+            'body': self.iterBody(templates, lazy),
+        })
 
 
-    def documentHead(self):
+    def documentHead(self, templates = DEFAULT_TEMPLATES, style = STYLE_BASENAME):
         """ Object method
-            Params: None
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    String style -> the quoted name of the style sheet, has STYLE_BASENAME constant for default value
             Return: html head of the current file (String)
-            This method generates the html head of the current file.
+            This method joins the fragments of iterHead().
         """
-        html_head = "\t<head>\n"
-        html_head += "\t\t<title> " + os.path.basename(self._name) + " </title>\n"
-        html_head += "\t\t<meta charset='utf-8' />\n"
-        html_head += "\t\t<link  rel='stylesheet' type='text/css' href=" + STYLE_BASENAME + " />\n"
-        html_head += "\t\t<script src='" + os.path.basename(JAVASCRIPT_FILE_PATH) + "'></script>\n"
-        html_head += "\t</head>\n"
-        return html_head
+        return "".join(self.iterHead(templates, style))
+
+    def iterHead(self, templates = DEFAULT_TEMPLATES, style = STYLE_BASENAME):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    String style -> the quoted name of the style sheet, has STYLE_BASENAME constant for default value.
+                                    When the style is known at generation time, the page links it directly, and needs not be restyled.
+            Yield: the fragments of the html head of the current file (String)
+            This method renders the head template of the current file.
+        """
+        return templates.head.render({
+            'title': os.path.basename(self._name),
+            'style': style,
+            'script': os.path.basename(JAVASCRIPT_FILE_PATH),
+        })
 
-    def documentBody(self):
+    def documentBody(self, templates = DEFAULT_TEMPLATES, lazy = False):
         """ Object method.
-            Params: None
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    Boolean lazy -> if True, the classes are only outlined (see iterBody()), has False for default value
             Return: html body of the current file (string).
-            This method generates the html body of the current file.
+            This method joins the fragments of iterBody().
+        """
+        return "".join(self.iterBody(templates, lazy))
+
+    def iterBody(self, templates = DEFAULT_TEMPLATES, lazy = False):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+                    Boolean lazy -> if True, the classes are only outlined, has False for default value
+            Yield: the fragments of the html body of the current file (string).
+            This method renders the body template of the current file.
+            The imports are rendered with the imported template, the classes with their own iterDocument() method.
+            In lazy mode, each class is rendered with the class_outline template instead: its section is loaded from its fragment file
+            when it is expanded or scrolled into view (see saveFragments()), so a module with many classes is displayed as fast as a small one.
+            The functions are only documented if there are any.
         """
-        # Title and docstirng
-        html_body = "\t<body onload='foldAll();'>\n"
-        html_body += "\t\t<h1>\n\t\t\t" + os.path.basename(self._name) + "\n\t\t</h1>\n"
-        html_body += "\t\t<p>\n\t\t\t" + self._docstring + "\n\t\t</p>\n"
-        html_body += "\t\t<h2>imports:</h2>\n\t\t<ul>\n"
+        if self._functions != []:
+            functions = self.iterFunctions(templates)
+        else:
+            functions = ""
 
-        # Imports's documentation
-        for element in self._imported_modules:
-            html_body += "\t\t\t<li>"+element+"</li>\n"
-        html_body += "\t\t</ul>\n"
+        if lazy:
+            classes = self.iterOutline(templates)
+        else:
+            classes = chain.from_iterable(python_class.iterDocument(templates) for python_class in self._classes)
+
+        return templates.body.render({
+            'title': os.path.basename(self._name),
+            'docstring': self._docstring,
+            'imports': (templates.imported.substitute({'module': element}) for element in self._imported_modules),
+            'functions': functions,
+            'classes': classes,
+        })
+
+    def iterOutline(self, templates = DEFAULT_TEMPLATES):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+            Yield: the outline of each class (String), rendered with the class_outline template.
+            Each outline refers to the fragment file of its class (see saveFragments()), relatively to the page.
+        """
+        folder = os.path.basename(self._name) + CLASS_FRAGMENTS_SUFFIX
+        for i, python_class in enumerate(self._classes):
+            yield templates.class_outline.substitute({
+                'id': CLASS_FRAGMENT_ID % i,
+                'fragment': folder + "/" + str(i) + ".js",
+                'name': python_class._name,
+            })
+
+    def documentFunctions(self, templates = DEFAULT_TEMPLATES):
+        """ Object method.
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+            Return: html documentation of the module-level functions (String).
+            This method joins the fragments of iterFunctions().
+        """
+        return "".join(self.iterFunctions(templates))
 
-        # Classes's documentation
-        for python_class in self._classes:
-            html_body += python_class.document()
+    def iterFunctions(self, templates = DEFAULT_TEMPLATES):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+            Yield: the fragments of the html documentation of the module-level functions (String).
+            The functions are documented with the method template, inside the functions template.
+        """
+        return templates.functions.render({
+            'functions': (function.document(templates) for function in self._functions),
+        })
 
-        html_body += "\t</body>\n"
-        return html_body
 
 
+class PythonSource:
+    """ Inherits: None
+        This class represents a python file waiting for its documentation: the file is neither read nor parsed.
+        It has the _path and _name attributes of PythonFile, so both are displayed in the same way.
+    """
+
+    __slots__ = ("_path", "_name")
+
+    def __init__(self, path):
+        """ Constructor
+            Params: String path -> the python file's path
+            Return: None
+            The _path attribute is the given path, the _name attribute is the given path, without its extension.
+        """
+        self._path = path
+        self._name = sys.intern(os.path.splitext(path)[0])
+
+    def parse(self, budget = None, engine = REGEX_ENGINE, cache = None):
+        """ Object method
+            Params: ParseBudget budget -> the parse time budget (parse_budget module), has None (no limit) for default value
+                    String engine -> the parsing engine, has REGEX_ENGINE constant for default value
+                    ParseCache cache -> the cache of the parsed files (parse_cache module), has None (no cache) for default value
+            Return: the parsed file (PythonFile), or None if it exceeded its time budget and was skipped
+        """
+        if budget is None:
+            return PythonFile(self._path, engine, cache)
+        return budget.parse(self._path, engine, cache)
+
 
 class PythonClass(PythonElement):
     """ Inherits: PythonElement
         This class represents a Python class.
     """
 
-    def __init__(self, name, docstring, methods_content):
+    __slots__ = ("_methods",)
+
+    def __init__(self, name, docstring, methods_content = ""):
         """ Constructor
             Params: String name -> the class's name
                     String docstring -> the class's docstring
-                    String methods_content -> the class's content.
+                    String methods_content -> the class's content, has an empty string for default value.
             Return: None
             _name and _docstring attributes are initialized, by calling the super constructor and the initDocstring method.
             The _methods attributes is an empty list, initialized with the extractContent method.
@@ -266,7 +563,7 @@ class PythonClass(PythonElement):
         """ Object method
             Params: String data -> the class's content
             Return: None
-            With a regular expression, all the methods are extractes from the given content.
+            With a regular expression, all the methods are extracted from the given content, in a single walk.
             For each method, a PythonMethod object is created and appended to the _methods list.
         """
         # List of methods creation
@@ -277,31 +574,29 @@ class PythonClass(PythonElement):
             # Methods creation
             new_method = PythonMethod(result.group("name"), result.group("docstring"))
             self._methods.append(new_method)
-            # Delete method from the class's content
-            data = data[0:result.start()] + data[result.end():]
-            result = method_regex.search(data)
+            # The search resumes after the method
+            result = method_regex.search(data, result.end())
 
-    def document(self):
+    def document(self, templates = DEFAULT_TEMPLATES):
         """ Object method
-            Params: None
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
             Return: the class's html documentation (String)
-            This method generates the html_documentation of this Python Class, in an html section.
-            This section contains the name of the class, its docstring and the documentation of all of its methods, in an html table.
+            This method joins the fragments of iterDocument().
         """
-        html_documentation = "\t\t<section class='pythonClass'>\n"
-
-        html_documentation += "\t\t\t<h2>\n\t\t\t\t" + self._name + "\n\t\t\t</h2>\n"
-        html_documentation += "\t\t\t<p>\n\t\t\t\t" + self._docstring + "\n\t\t\t</p>\n"
-
-        html_documentation += "\t\t\t<table class='methods'>\n"
-        html_documentation += "\t\t\t\t<th colspan = 2> Methods </th>\n"
-
-        for method in self._methods:
-            html_documentation += method.document()
-
-        html_documentation += "\t\t\t</table>\n"
-        html_documentation +=  "\t\t</section>\n"
-        return html_documentation
+        return "".join(self.iterDocument(templates))
+
+    def iterDocument(self, templates = DEFAULT_TEMPLATES):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+            Yield: the fragments of the class's html documentation (String)
+            This method renders the python_class template of this Python Class.
+            By default, it is an html section containing the name of the class, its docstring and the documentation of all of its methods, in an html table.
+        """
+        return templates.python_class.render({
+            'name': self._name,
+            'docstring': self._docstring,
+            'methods': (method.document(templates) for method in self._methods),
+        })
 
 
 
@@ -311,6 +606,8 @@ class PythonMethod(PythonElement):
         Class representing a Python method.
     """
 
+    __slots__ = ()
+
     def __init__(self, name, docstring):
         """ Constructor
             Params: String name -> the method's name
@@ -321,29 +618,27 @@ class PythonMethod(PythonElement):
         super().__init__(name)
         self.initDocstring(docstring, METHOD_INDENTATION_LEVEL)
 
-    def document(self):
+    def document(self, templates = DEFAULT_TEMPLATES):
         """ Object method
-            Params: None
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
             Return: the html documentation of this method (String).
-            This method generates the html documentation of the PythonMethod for which it is called, on and html table's row.
-            This row contains the name of the method, in the first cell and its formatted docstring in the second.
+            This method renders the method template of the PythonMethod for which it is called.
+            By default, it is an html table's row, containing the name of the method in the first cell and its formatted docstring in the second.
+        """
+        return templates.method.substitute({
+            'name': self._name,
+            'docstring': self._docstring,
+        })
+
+    def iterDocument(self, templates = DEFAULT_TEMPLATES):
+        """ Generator
+            Params: TemplateSet templates -> the templates of the documentation, has DEFAULT_TEMPLATES for default value
+            Yield: the html documentation of this method, as a single fragment (String).
         """
-        html_documentation = "\t\t\t\t<tr>\n"
-        html_documentation += "\t\t\t\t\t<td onclick='toggle(this);'>\n\t\t\t\t\t\t" + self._name + "\n\t\t\t\t\t</td>\n"
-        html_documentation += "\t\t\t\t\t<td>\n\t\t\t\t\t\t" + self._docstring + "\n\t\t\t\t\t</td>\n"
-        html_documentation += "\t\t\t\t</tr>\n"
-        return html_documentation
+        yield self.document(templates)
 
 
 if __name__ == "__main__":
-    files=[]
-
-    order=ALPHABETICAL_ORDER
-    for arg in sys.argv:
-        if arg==ALPHABETICAL_ORDER or arg==NATURAL_ORDER:
-            order=arg
-        else:
-            files.append(PythonFile(arg))
-
-    for eachPythonFile in files:
-        eachPythonFile.save(order)
\ No newline at end of file
+    # The command line interface documents the files given as arguments
+    from goodoc_cli import main
+    sys.exit(main())
@@ -4,8 +4,155 @@
     Auteur: Hugo
 
     Ce fichier presente des animations simple pouvant être ajouté au fichier HTML générés.
+
+    Les docstrings des méthodes sont repliées par défaut grâce à une règle CSS ajoutée au chargement du script,
+    et un seul écouteur de clics, sur le document, déplie ou replie la ligne dont le nom a été cliqué.
+
+    Dans les pages générées en mode lazy, les classes ne sont que des esquisses : la section de chaque classe est chargée depuis son fragment
+    (voir PythonFile.saveFragments) quand elle est cliquée ou qu'elle approche de la zone visible.
 */
 
+var UNFOLDED_CLASS = "goodocUnfolded";
+// Distance, en pixels, à laquelle une classe est chargée avant d'être visible
+var LAZY_MARGIN = 400;
+
+(function(){
+    var rules = ".methods td:last-child{display:none;}"
+              + ".methods tr." + UNFOLDED_CLASS + " td:last-child{display:block;}";
+    var style = document.createElement("style");
+    style.appendChild(document.createTextNode(rules));
+    document.getElementsByTagName("head")[0].appendChild(style);
+})();
+
+
+// Cellule du nom de méthode contenant l'élément cliqué, ou null (Element.closest n'existe pas dans les anciens QtWebKit)
+function methodTitle(element){
+    for(; element && element.nodeType == 1; element = element.parentNode){
+        if(element.tagName == "TD"){
+            var row = element.parentNode;
+            var table = row.parentNode.tagName == "TABLE" ? row.parentNode : row.parentNode.parentNode;
+            if(element.nextElementSibling && (" " + table.className + " ").indexOf(" methods ") != -1){
+                return element;
+            }
+            return null;
+        }
+    }
+    return null;
+}
+
+
+// Esquisse de classe contenant l'élément, ou null
+function classOutline(element){
+    for(; element && element.nodeType == 1; element = element.parentNode){
+        if(element.tagName == "SECTION"){
+            return element.hasAttribute("data-fragment") ? element : null;
+        }
+    }
+    return null;
+}
+
+
+// Charge le fragment d'une esquisse de classe, une seule fois
+function loadClass(outline){
+    var fragment = outline.getAttribute("data-fragment");
+    if(!fragment){
+        return;
+    }
+    outline.removeAttribute("data-fragment");
+
+    var script = document.createElement("script");
+    script.src = fragment;
+    document.getElementsByTagName("head")[0].appendChild(script);
+}
+
+
+// Appelée par chaque fragment chargé : la section de la classe remplace son esquisse
+function insertClass(id, html){
+    var outline = document.getElementById(id);
+    if(!outline){
+        return;
+    }
+
+    var container = document.createElement("div");
+    container.innerHTML = html;
+    while(container.firstChild){
+        outline.parentNode.insertBefore(container.firstChild, outline);
+    }
+    outline.parentNode.removeChild(outline);
+}
+
+
+// Charge les esquisses proches de la zone visible
+function loadVisibleClasses(){
+    var outlines = document.querySelectorAll("section[data-fragment]");
+
+    for(var i = 0; i<outlines.length; i++){
+        var rect = outlines[i].getBoundingClientRect();
+        if(rect.bottom > -LAZY_MARGIN && rect.top < window.innerHeight + LAZY_MARGIN){
+            loadClass(outlines[i]);
+        }
+    }
+}
+
+
+document.addEventListener("DOMContentLoaded", function(){
+    var outlines = document.querySelectorAll("section[data-fragment]");
+    if(outlines.length == 0){
+        return;
+    }
+
+    if(window.IntersectionObserver){
+        var observer = new IntersectionObserver(function(entries){
+            for(var i = 0; i<entries.length; i++){
+                if(entries[i].isIntersecting){
+                    observer.unobserve(entries[i].target);
+                    loadClass(entries[i].target);
+                }
+            }
+        }, {rootMargin: LAZY_MARGIN + "px"});
+
+        for(var i = 0; i<outlines.length; i++){
+            observer.observe(outlines[i]);
+        }
+        return;
+    }
+
+    // Les anciens QtWebKit n'ont pas IntersectionObserver : la position des esquisses est vérifiée au plus une fois par intervalle de défilement
+    var timer = null;
+    function schedule(){
+        if(timer === null){
+            timer = setTimeout(function(){ timer = null; loadVisibleClasses(); }, 100);
+        }
+    }
+    window.addEventListener("scroll", schedule);
+    window.addEventListener("resize", schedule);
+    loadVisibleClasses();
+});
+
+
+document.addEventListener("click", function(event){
+    var outline = classOutline(event.target);
+    if(outline){
+        loadClass(outline);
+        return;
+    }
+
+    var method_title = methodTitle(event.target);
+
+    // Les pages générées par les anciennes versions ont encore leur propre onclick
+    if(method_title && !method_title.hasAttribute("onclick")){
+        var row = method_title.parentNode;
+        if((" " + row.className + " ").indexOf(" " + UNFOLDED_CLASS + " ") != -1){
+            row.className = (" " + row.className + " ").replace(" " + UNFOLDED_CLASS + " ", " ").trim();
+        }
+        else{
+            row.className = (row.className + " " + UNFOLDED_CLASS).trim();
+        }
+    }
+});
+
+
+// Fonctions conservées pour les pages générées par les anciennes versions (onclick='toggle(this);' et onload='foldAll();')
 function toggle(method_title){
     var docstring = method_title.nextElementSibling;
 
@@ -33,4 +180,4 @@ function foldAll(){
     for(var i = 0; i<title_array.length; i++){
         fold(title_array[i]);
     }
-}
\ No newline at end of file
+}
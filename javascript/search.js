@@ -0,0 +1,124 @@
+/*
+    Projet: GooDoc
+    Fichier: search.js
+
+    Recherche par préfixe dans l'index généré avec la documentation (module search_index).
+    L'index est découpé en fichiers, un par première lettre des noms après leurs tirets bas : seul celui de la lettre tapée est chargé.
+*/
+
+var goodocSearch = (function(){
+    var KINDS = ["class", "method", "function"];
+    var MAX_RESULTS = 50;
+    var shards = {};
+    var waiting = {};
+
+    function shardKey(query){
+        var letter = query.replace(/^_+/, "").charAt(0).toLowerCase();
+        return (letter >= "a" && letter <= "z") ? letter : "_";
+    }
+
+    // Called by each shard file once it is loaded
+    function shard(key, pages, rows){
+        shards[key] = {pages: pages, rows: rows};
+        var callbacks = waiting[key] || [];
+        delete waiting[key];
+        for(var i = 0; i < callbacks.length; i++){
+            callbacks[i]();
+        }
+    }
+
+    function load(key, callback){
+        if(shards[key]){
+            callback();
+            return;
+        }
+        if(waiting[key]){
+            waiting[key].push(callback);
+            return;
+        }
+        waiting[key] = [callback];
+
+        var script = document.createElement("script");
+        script.src = "search/" + key + ".js";
+        script.onerror = function(){ shard(key, [], []); };
+        document.getElementsByTagName("head")[0].appendChild(script);
+    }
+
+    // Rows of the shard whose name starts with the query, found by dichotomy in the sorted rows
+    function lookup(query){
+        var current = shards[shardKey(query)];
+        var rows = current.rows;
+        var low = 0, high = rows.length;
+        while(low < high){
+            var middle = (low + high) >> 1;
+            if(rows[middle][0].toLowerCase() < query){
+                low = middle + 1;
+            }
+            else{
+                high = middle;
+            }
+        }
+
+        var results = [];
+        for(var i = low; i < rows.length && results.length < MAX_RESULTS; i++){
+            if(rows[i][0].toLowerCase().lastIndexOf(query, 0) != 0){
+                break;
+            }
+            results.push({name: rows[i][0], kind: KINDS[rows[i][1]], owner: rows[i][2], page: current.pages[rows[i][3]], excerpt: rows[i][4]});
+        }
+        return results;
+    }
+
+    function search(query, callback){
+        query = query.toLowerCase();
+        if(query == ""){
+            callback([]);
+            return;
+        }
+        load(shardKey(query), function(){ callback(lookup(query)); });
+    }
+
+    function cell(row, text){
+        var td = document.createElement("td");
+        td.appendChild(document.createTextNode(text));
+        row.appendChild(td);
+        return td;
+    }
+
+    function display(results){
+        var table = document.getElementById("goodocResults");
+        while(table.firstChild){
+            table.removeChild(table.firstChild);
+        }
+
+        for(var i = 0; i < results.length; i++){
+            var row = document.createElement("tr");
+            var link = document.createElement("a");
+            link.href = results[i].page;
+            link.appendChild(document.createTextNode(results[i].name));
+            row.appendChild(document.createElement("td")).appendChild(link);
+            cell(row, results[i].owner ? results[i].kind + " of " + results[i].owner : results[i].kind);
+            cell(row, results[i].page);
+            cell(row, results[i].excerpt);
+            table.appendChild(row);
+        }
+    }
+
+    window.addEventListener("load", function(){
+        var input = document.getElementById("goodocQuery");
+        if(!input){
+            return;
+        }
+        input.addEventListener("keyup", function(){
+            var query = input.value;
+            search(query, function(results){
+                // Only the results of the latest query are displayed
+                if(input.value == query){
+                    display(results);
+                }
+            });
+        });
+    });
+
+    return {shard: shard, search: search};
+})();
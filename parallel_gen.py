@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module generating the documentation of many Python files on several cores.
+
+    Each file is parsed, rendered and written by a worker process of a ProcessPoolExecutor.
+    The largest files are scheduled first, so that a large file started last does not delay the end of the generation.
+    The generated pages are identical to the pages generated by PythonFile.save in the current process.
+"""
+
+import os
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from parse_budget import ParseBudget
+from constants import *
+
+
+# The time budget of the current worker process, created by startWorker
+_worker_budget = None
+
+
+def startWorker(budget):
+    """ Function
+        Params: float budget -> the parse time budget of each file, in seconds, or None
+        Return: None
+        Function run once by each worker process, when it starts.
+        The time budget, and its child process, are kept for all the files of the worker, and stopped once when the worker exits.
+        A finalizer is used rather than an atexit hook, which is not run by the forked workers.
+    """
+    global _worker_budget
+    _worker_budget = ParseBudget(budget)
+    Finalize(_worker_budget, _worker_budget.close, exitpriority=0)
+
+
+def generateFile(path, folder, order, engine, templates, cache, budget, style, lazy, compress):
+    """ Function
+        Params: String path -> the python file's path
+                String folder -> the documentation folder
+                String order -> the order of methods and classes
+                String engine -> the parsing engine
+                TemplateSet templates -> the templates of the documentation
+                ParseCache cache -> the cache of the parsed files, or None
+                float budget -> the parse time budget of the file, in seconds, or None
+                String style -> the quoted name of the style sheet linked by the page
+                bool lazy -> if True, the sections of the classes are saved in fragment files (see PythonFile.save)
+                bool compress -> if True, the compressed copies of the page are written too (see PythonFile.save)
+        Return: the path of the python file, the path of the generated page (None if the file was skipped), the diagnostics of the time budget
+                and the symbols of the file, for the search index (tuple)
+        Function run by the worker processes. As in the current process, the file is parsed within its time budget (see parse_budget module).
+        The time budget of the worker is created by startWorker, or by the first file if the function is run outside of generateFiles.
+    """
+    if _worker_budget is None:
+        startWorker(budget)
+
+    python_file = _worker_budget.parse(path, engine, cache)
+    if python_file is None:
+        return (path, None, _worker_budget.diagnostics(), [])
+
+    new_path = python_file.save(folder, order, templates, style, lazy, compress)
+    return (path, new_path, _worker_budget.diagnostics(), python_file.symbols())
+
+
+def generateFiles(paths, folder, order, engine, templates, cache, budget, jobs, style = STYLE_BASENAME, lazy = False, compress = False):
+    """ Generator
+        Params: List paths -> the python files' paths
+                String folder, order, engine, TemplateSet templates, ParseCache cache, float budget -> see generateFile
+                int jobs -> the number of worker processes
+                String style -> see generateFile, has STYLE_BASENAME constant for default value
+                bool lazy, compress -> see generateFile, have False for default value
+        Yield: the (python file's path, page's path, diagnostics, symbols) tuple of each file, as soon as it is generated.
+        The files are submitted from the largest to the smallest.
+        If the generator is closed early, the files not started yet are cancelled, and the files being generated are completed.
+    """
+    paths = sorted(paths, key=os.path.getsize, reverse=True)
+
+    with ProcessPoolExecutor(jobs, initializer=startWorker, initargs=(budget,)) as executor:
+        futures = [executor.submit(generateFile, path, folder, order, engine, templates, cache, budget, style, lazy, compress) for path in paths]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module limiting the time spent parsing each Python file.
+
+    Some sources drive the regular expressions of the regex engine into catastrophic backtracking, which cannot be interrupted.
+    The regex engine is therefore run in a child process, which is terminated when a file exceeds its time budget.
+    Such a file is parsed again with the ast engine, whose time is linear, or skipped if it is not valid Python.
+    The child process is kept from a file to the next, and must be stopped by close() once the files are parsed.
+    It contains the ParseBudget class.
+"""
+
+import threading
+import multiprocessing
+from html_gen import PythonFile
+from constants import *
+
+
+def parseFile(path, engine, cache):
+    """ Function
+        Params: String path -> the python file's path
+                String engine -> the parsing engine
+                ParseCache cache -> the cache of the parsed files, or None
+        Return: the parsed file (PythonFile)
+        Function run by the child process.
+    """
+    return PythonFile(path, engine, cache)
+
+
+class ParseBudget:
+    """ Inherits: None
+        This class parses Python files within a time budget, and records a diagnostic for each file exceeding it.
+    """
+
+    def __init__(self, budget = PARSE_TIME_BUDGET):
+        """ Constructor
+            Params: float budget -> the time budget of each file, in seconds. Has PARSE_TIME_BUDGET constant for default value.
+                                    If it is None, the files are parsed without limit, in the current process.
+            Return: None
+            The child process is only started when the first file is parsed.
+        """
+        self._budget = budget
+        self._pool = None
+        self._diagnostics = []
+
+    def parse(self, path, engine = REGEX_ENGINE, cache = None):
+        """ Object method
+            Params: String path -> the python file's path
+                    String engine -> the parsing engine, has REGEX_ENGINE constant for default value
+                    ParseCache cache -> the cache of the parsed files (parse_cache module), has None (no cache) for default value
+            Return: the parsed file (PythonFile), or None if the file was skipped
+            The regex engine runs in the child process. If it exceeds the budget, the child process is terminated and the file is parsed with the ast engine.
+            If the ast engine fails as well, the file is skipped.
+            The ast engine, being linear, is run without limit in the current process.
+            The child process is forked from the main thread only: from another thread (e.g. the worker of the graphical interface), it is spawned,
+            as a forked process would copy the locks held by the other threads.
+        """
+        if self._budget is None or engine != REGEX_ENGINE:
+            return PythonFile(path, engine, cache)
+
+        if self._pool is None:
+            if threading.current_thread() is threading.main_thread():
+                self._pool = multiprocessing.Pool(1)
+            else:
+                self._pool = multiprocessing.get_context("spawn").Pool(1)
+
+        result = self._pool.apply_async(parseFile, (path, engine, cache))
+        try:
+            return result.get(self._budget)
+        except multiprocessing.TimeoutError:
+            # The only way to stop the regular expression is to stop its process
+            self._pool.terminate()
+            self._pool = None
+
+        try:
+            python_file = PythonFile(path, AST_ENGINE, cache)
+        except (SyntaxError, ValueError) as error:
+            self._diagnostics.append((path, "exceeded %gs, skipped (%s)" % (self._budget, error)))
+            return None
+
+        self._diagnostics.append((path, "exceeded %gs, parsed with the ast engine" % self._budget))
+        return python_file
+
+    def diagnostics(self):
+        """ Object method
+            Params: None
+            Return: the (path, message) tuples of the files which exceeded the budget (List)
+            The recorded diagnostics are cleared.
+        """
+        diagnostics = self._diagnostics
+        self._diagnostics = []
+        return diagnostics
+
+    def record(self, diagnostics):
+        """ Object method
+            Params: List diagnostics -> (path, message) tuples, returned by the diagnostics method of another ParseBudget
+            Return: None
+            Adds the diagnostics of another ParseBudget, e.g. of a worker process, to this one's.
+        """
+        self._diagnostics += diagnostics
+
+    def report(self):
+        """ Object method
+            Params: None
+            Return: the report of the files which exceeded the budget, one line per file (String). Empty if there is no such file.
+            The recorded diagnostics are cleared.
+        """
+        return "\n".join(path + ": " + message for path, message in self.diagnostics())
+
+    def close(self):
+        """ Object method
+            Params: None
+            Return: None
+            Stops the child process, if it was started.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
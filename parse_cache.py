@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the on-disk cache of the parsed Python files.
+
+    The content extracted from a Python file (docstring, imports, classes and functions) is stored in a cache folder.
+    Each entry is keyed by the hash of the file's content, the parsing engine and PARSER_VERSION, so a modified file or a new parser never reads a stale entry.
+    It contains the ParseCache class.
+"""
+
+import os
+import pickle
+import hashlib
+from constants import *
+
+
+class ParseCache:
+    """ Inherits: None
+        This class represents a cache folder.
+        Each entry is a pickle file, named after its key. Its modification time is updated on each hit, so the least recently used entries are evicted first.
+    """
+
+    def __init__(self, folder, max_size = PARSE_CACHE_MAX_SIZE):
+        """ Constructor
+            Params: String folder -> the cache folder, created if it does not exist
+                    int max_size -> the maximum size of the cache, in bytes. Has PARSE_CACHE_MAX_SIZE constant for default value
+            Return: None
+        """
+        self._folder = folder
+        self._max_size = max_size
+        os.makedirs(folder, exist_ok=True)
+
+    @staticmethod
+    def key(data, engine):
+        """ Static method
+            Params: String data -> the content of a Python file
+                    String engine -> the parsing engine
+            Return: the key of the file's entry (String)
+        """
+        digest = hashlib.sha256((PARSER_VERSION + "/" + engine + "/").encode("utf-8"))
+        digest.update(data.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def entryPath(self, key):
+        """ Object method
+            Params: String key -> the key of an entry
+            Return: the path of the entry's file (String)
+        """
+        return os.path.join(self._folder, key + CACHE_EXTENSION)
+
+    def get(self, key):
+        """ Object method
+            Params: String key -> the key of an entry
+            Return: the content stored in the entry, or None if there is no valid entry for the key
+            The entry is marked as recently used.
+        """
+        path = self.entryPath(key)
+        try:
+            with open(path, "rb") as f:
+                content = pickle.load(f)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return None
+
+        return content
+
+    def put(self, key, content):
+        """ Object method
+            Params: String key -> the key of the entry
+                    content -> the content to store, which must be picklable
+            Return: None
+            The entry is written in a temporary file and then renamed, so a concurrent reader never sees a partial entry.
+        """
+        path = self.entryPath(key)
+        temporary_path = path + "." + str(os.getpid())
+        with open(temporary_path, "wb") as f:
+            pickle.dump(content, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+
+    def entries(self):
+        """ Object method
+            Params: None
+            Return: the (modification time, size, path) tuples of the entries (List)
+        """
+        entries = []
+        with os.scandir(self._folder) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(CACHE_EXTENSION) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """ Object method
+            Params: None
+            Return: None
+            Removes the least recently used entries, until the size of the cache is below its maximum size.
+            The cache folder is only scanned here, so this method should be called once per run rather than after each put.
+        """
+        entries = sorted(self.entries())
+        size = sum(entry_size for mtime, entry_size, path in entries)
+
+        for mtime, entry_size, path in entries:
+            if size <= self._max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+
+    def clear(self):
+        """ Object method
+            Params: None
+            Return: None
+            Removes all the entries of the cache.
+        """
+        for mtime, size, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
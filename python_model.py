@@ -10,7 +10,7 @@ from constants import *
 
 class PythonModel(QAbstractListModel):
     """ Inherits: QAbstractListModel
-        Class representing a model for a list of PythonFile objects.
+        Class representing a model for a list of PythonSource objects (html_gen module), the python files waiting for their documentation.
         This model is used by ListView in the documentation screen.
     """
 
@@ -19,18 +19,20 @@ class PythonModel(QAbstractListModel):
             Params: List python_list -> the data represented by the model
             Return: None
             The super constructor is called.
-            Initializes attribute _python_files to python_list.
+            Initializes attribute _python_files to python_list, and _row_count to its length.
+            The displayed rows are the _row_count first elements of the list: elements appended by a worker thread are displayed once appendRows() is called.
         """
         super().__init__()
         self._python_files = python_list
+        self._row_count = len(python_list)
 
 
     def rowCount(self, parent=QModelIndex()):
         """ Object method
             Params: QModelIndex parent -> for tree organization, a parent is requested. Has invalid QModelIndex for default value
-            Return: Number of rows displayed by the model (length of the _python_files list)
+            Return: Number of rows displayed by the model (_row_count attribute)
         """
-        return len(self._python_files)
+        return self._row_count
 
     def data(self, index, role = Qt.DisplayRole):
         """ Object method
@@ -40,7 +42,7 @@ class PythonModel(QAbstractListModel):
             If this index is valid, lower than the length of the python_files list and the given role is Qt.DisplayRole, the correct data is returned.
             Else a QVariant() object is returned.
         """
-        if not index.isValid() or index.row() >= len(self._python_files) or role != Qt.DisplayRole:
+        if not index.isValid() or index.row() >= min(self._row_count, len(self._python_files)) or role != Qt.DisplayRole:
             return QVariant()
 
         else:
@@ -56,8 +58,20 @@ class PythonModel(QAbstractListModel):
         """
         self.beginRemoveRows(parent, index, index+1)
         self._python_files.pop(index)
+        self._row_count -= 1
         self.endRemoveRows()
 
+    def appendRows(self, count = 1):
+        """ Object method
+            Params: int count -> the number of rows appended, has 1 for default value
+            Return: None
+            Displays the next count elements of the _python_files list, appended since the last update.
+            This method calls QAbstractListModel.beginInsertRows() before the change and QAbstractListModel.endInsertRows() after it.
+        """
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + count - 1)
+        self._row_count += count
+        self.endInsertRows()
+
 
     def setPythonList(self, python_list):
         """ Object method
@@ -69,6 +83,7 @@ class PythonModel(QAbstractListModel):
         """
         self.beginResetModel()
         self._python_files = python_list
+        self._row_count = len(python_list)
         self.endResetModel()
 
 
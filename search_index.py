@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the search index of a documentation folder.
+
+    The index lists the classes, methods and functions of the documented files, with their owning class, their page and a docstring excerpt.
+    It is split into shards, one per first letter of the symbols' names after their leading underscores, written as javascript files in the SEARCH_FOLDER_NAME folder.
+    The special methods are thus spread over the shards of their letters, instead of all growing the same shard.
+    The search script (javascript/search.js) only loads the shard of the typed letter, and looks up the prefix by dichotomy in its sorted rows.
+    The shards are javascript rather than JSON so that they can be loaded by a script tag, from the local file system.
+    It contains the SearchIndex class.
+"""
+
+import os
+import json
+import shutil
+from templates import compileTemplate
+from compression import compressAsset, removeCompressed
+from constants import *
+
+
+class SearchIndex:
+    """ Inherits: None
+        This class represents the search index of a documentation folder.
+        Its _pages attribute maps the path of each page to the symbols it documents (see PythonFile.symbols()).
+    """
+
+    def __init__(self):
+        """ Constructor
+            Params: None
+            Return: None
+            The index is empty.
+        """
+        self._pages = {}
+
+    @staticmethod
+    def shardKey(name):
+        """ Static method
+            Params: String name -> the name of a symbol
+            Return: the key of the shard containing the symbol (String): the lowercase first letter of its name after the leading underscores,
+                    or SEARCH_OTHER_SHARD
+        """
+        letter = name.lstrip("_")[:1].lower()
+        if "a" <= letter <= "z":
+            return letter
+        return SEARCH_OTHER_SHARD
+
+    def add(self, page, symbols):
+        """ Object method
+            Params: String page -> the path of a page
+                    List symbols -> the symbols documented by the page
+            Return: None
+            The symbols replace the ones previously added for the page.
+        """
+        self._pages[page] = [tuple(symbol) for symbol in symbols]
+
+    def remove(self, page):
+        """ Object method
+            Params: String page -> the path of a page
+            Return: None
+            Removes the symbols of the page, if any.
+        """
+        self._pages.pop(page, None)
+
+    def symbols(self, page):
+        """ Object method
+            Params: String page -> the path of a page
+            Return: the symbols of the page (List), empty if it isn't indexed
+        """
+        return self._pages.get(page, [])
+
+    def __len__(self):
+        """ Special method
+            Params: None
+            Return: the number of indexed symbols
+        """
+        return sum(len(symbols) for symbols in self._pages.values())
+
+    def shards(self):
+        """ Object method
+            Params: None
+            Return: the content of each shard (Dictionary: shard key -> javascript String)
+            A shard calls goodocSearch.shard with its key, the table of the pages' names and its rows.
+            Each row is a [name, kind, owner, page number, excerpt] array, and the rows are sorted by lowercase name.
+        """
+        rows = {}
+        for page in sorted(self._pages):
+            for name, kind, owner, excerpt in self._pages[page]:
+                rows.setdefault(self.shardKey(name), []).append((name.lower(), name, kind, owner, os.path.basename(page), excerpt))
+
+        shards = {}
+        for key, shard_rows in rows.items():
+            shard_rows.sort()
+            pages = sorted(set(row[4] for row in shard_rows))
+            numbers = {page: i for i, page in enumerate(pages)}
+            content = [[name, kind, owner, numbers[page], excerpt] for lower, name, kind, owner, page, excerpt in shard_rows]
+
+            shards[key] = "goodocSearch.shard(%s,%s,%s);\n" % (json.dumps(key), json.dumps(pages, separators=(",", ":")),
+                                                               json.dumps(content, separators=(",", ":"), ensure_ascii=False))
+        return shards
+
+    def save(self, folder, style = STYLE_BASENAME, compress = False):
+        """ Object method
+            Params: String folder -> the documentation folder
+                    String style -> the quoted name of the style sheet linked by the search page, has STYLE_BASENAME constant for default value
+                    Boolean compress -> if True, the compressed copies of the written files are written too (see compression module), has False for default value
+            Return: the path of the search page (String)
+            Writes the shards in the SEARCH_FOLDER_NAME folder, the search page and the search script in the documentation folder.
+            A shard is only written if its content changed, and the shards of the letters without any symbol are removed, with their compressed copies.
+            The compressed copies of an unchanged file are not written again, and without compression the previous copies are removed.
+        """
+        search_folder = os.path.join(folder, SEARCH_FOLDER_NAME)
+        if not os.path.isdir(search_folder):
+            os.makedirs(search_folder)
+
+        shards = self.shards()
+        for name in os.listdir(search_folder):
+            if name.split(".")[0] not in shards:
+                os.remove(os.path.join(search_folder, name))
+
+        written = []
+        for key, content in shards.items():
+            path = os.path.join(search_folder, key + ".js")
+            written.append(path)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    if f.read() == content:
+                        continue
+            except OSError:
+                pass
+
+            temporary_path = path + "." + str(os.getpid())
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temporary_path, path)
+
+        shutil.copy(SEARCH_SCRIPT_PATH, folder)
+        written.append(os.path.join(folder, os.path.basename(SEARCH_SCRIPT_PATH)))
+
+        page = os.path.join(folder, SEARCH_PAGE_NAME)
+        head = compileTemplate(TEMPLATE_HEAD).substitute({
+            'title': "Search",
+            'style': style,
+            'script': os.path.basename(SEARCH_SCRIPT_PATH),
+        })
+        with open(page, "w") as f:
+            f.write(compileTemplate(TEMPLATE_SEARCH_PAGE).substitute({'head': head}))
+        written.append(page)
+
+        for path in written:
+            if compress:
+                compressAsset(path)
+            else:
+                removeCompressed(path)
+
+        return page
@@ -1,10 +1,12 @@
 #/usr/bin/python3
 # -*- coding:utf-8 -*-
 
+import io
 import os
 import re
 import pickle
-from html_gen import PythonFile
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from constants import *
 
 
@@ -145,20 +147,111 @@ class StyleHandler:
             os.mkdir(SAVE_FOLDER_PATH)
         self.save()
 
+    @staticmethod
+    def findStyle(file_resource):
+        """ Static method
+            Params: file file_resource -> a page, opened in binary mode, at its beginning
+            Return: the offset and the (quoted) value of the href attribute of the page's stylesheet link (tuple of int and bytes), or None if there is no such link
+            Only the head of the page is read, by chunks of HEAD_CHUNK_SIZE bytes, and the link is only searched in it.
+            The file is then positioned after the read bytes.
+        """
+        head = b""
+        while b"</head>" not in head and len(head) < HEAD_SIZE_LIMIT:
+            chunk = file_resource.read(HEAD_CHUNK_SIZE)
+            if chunk == b"":
+                break
+            head += chunk
+
+        end = head.find(b"</head>")
+        if end == -1:
+            return None
+
+        for tag in re.finditer(REGEX_LINK_TAG, head[:end]):
+            if b"stylesheet" not in tag.group():
+                continue
+            href = re.search(REGEX_LINK_HREF, tag.group())
+            if href is not None:
+                return (tag.start() + href.start("style"), href.group("style"))
+
+        return None
+
+    @staticmethod
+    def restyle(document, new_name):
+        """ Static method
+            Params: bytes document -> the content of a page
+                    String new_name -> the style name, with its quotes
+            Return: the content of the page linking the new style (bytes), unchanged if it has no stylesheet link
+            The page is changed in memory only, in the same way as setStyle() changes a file: used to preview a style without touching the files.
+        """
+        found = StyleHandler.findStyle(io.BytesIO(document))
+        if found is None:
+            return document
+
+        offset, old_style = found
+        return document[:offset] + new_name.encode("utf-8") + document[offset + len(old_style):]
+
     @staticmethod
     def setStyle(path, new_name):
         """ Static method
             Params: String path -> the file's path 
-                    String new_name -> the style name
-            Return: None
+                    String new_name -> the style name, with its quotes
+            Return: True if the file was changed, False if it already had this style or has no stylesheet link (bool)
             Changes the style of the file, wich the path is given in params.
-            The old style name is found and replaced by the new style name.
+            The href of the stylesheet link is found in the file's head (see findStyle()), and replaced by the new style name: the rest of the page is never changed.
+            If both names have the same length, the new name is written over the old one, in place.
+            Else, the page is copied into a temporary file, with the new name, which then replaces it: an interrupted change never leaves a half-written file.
         """
-        with open(path, "r+") as handler:
-            text = handler.read()
+        new_style = new_name.encode("utf-8")
+
+        with open(path, "r+b") as handler:
+            found = StyleHandler.findStyle(handler)
+            if found is None:
+                return False
+
+            offset, old_style = found
+            if old_style == new_style:
+                return False
 
-        old_name = re.search(REGEX_STYLE, text).group("style")
-        text = text.replace(old_name, new_name)
+            if len(old_style) == len(new_style):
+                handler.seek(offset)
+                handler.write(new_style)
+                return True
 
-        with open(path, "w") as handler:
-            handler.write(text)
+            temporary_path = path + "." + str(os.getpid())
+            handler.seek(0)
+            with open(temporary_path, "wb") as copy:
+                copy.write(handler.read(offset))
+                copy.write(new_style)
+                handler.seek(offset + len(old_style))
+                shutil.copyfileobj(handler, copy)
+
+        os.replace(temporary_path, path)
+        return True
+
+    @staticmethod
+    def setStyles(paths, new_name, threads = RESTYLE_THREADS, diagnostics = None):
+        """ Static method, generator
+            Params: iterable paths -> the files' paths
+                    String new_name -> the style name, with its quotes
+                    int threads -> the number of threads changing the files, has RESTYLE_THREADS constant for default value
+                    List diagnostics -> the list receiving a (path, message) tuple for each file which couldn't be changed, has None for default value
+            Yield: the (path, changed) tuple of each file, as soon as its style is changed (see setStyle())
+            The files are changed by a pool of threads, the work being bound by the file system.
+            A file which can't be changed, e.g. removed since it was listed or read-only, is not yielded:
+            it is recorded in the diagnostics, as by a ParseBudget, and the other files are changed.
+            If the generator is closed early, the files not started yet are not changed.
+        """
+        with ThreadPoolExecutor(threads) as executor:
+            futures = {executor.submit(StyleHandler.setStyle, path, new_name): path for path in paths}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        changed = future.result()
+                    except (OSError, ValueError) as error:
+                        if diagnostics is not None:
+                            diagnostics.append((futures[future], "not restyled (%s)" % error))
+                        continue
+                    yield (futures[future], changed)
+            finally:
+                for future in futures:
+                    future.cancel()
@@ -6,9 +6,8 @@
 """
 import sys
 import os
-import random
 
-from PyQt5.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QTabWidget, QTabBar, QInputDialog)
+from PyQt5.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QTabWidget, QTabBar, QInputDialog, QMessageBox)
 from PyQt5.QtWebKitWidgets import QWebView
 from PyQt5.QtCore import QUrl
 from PyQt5.QtGui import QIcon
@@ -21,7 +20,7 @@ class StyleScreen(QWidget):
     """ Inherits: QWidget
         Class modeling the stylesheet selection screen. 
         This class displays the style screen, used to add stylesheets to HTML documentation.
-        This screen has a Tab Bar, containing QWebviews.
+        This screen has a Tab Bar, whose tabs share a single QWebView: the preview is moved into the current tab.
         The confirm button is located below this tab bar.
     """
 
@@ -42,6 +41,8 @@ class StyleScreen(QWidget):
             This method initializes the layout of the StyleScreen.
             The tab bar is created, a new tab is created for each stylesheet registered by the application.
             The tab bar has closable and renamable tabs (see editable_tabs module).
+            The single WebView previewing the styles is created. The smallest generated file is read once, and displayed when the first tab becomes current (see changeStyle()).
+            If no generated file can be read, e.g. the documentation folder was removed, the preview stays empty: the styles can still be chosen.
             A push button is created below the tab bar.
         """ 
         vbox = QVBoxLayout()
@@ -51,17 +52,21 @@ class StyleScreen(QWidget):
         self.tab_bar.tabCloseRequested[int].connect(self._styles.pop)
         self.tab_bar.currentChanged[int].connect(self.changeStyle)
 
-        template = list()
-        path = random.choice(self.parent()._files._htmlFiles)
-        self._chosen_file = QUrl.fromUserInput(path)
+        self._chosen_path = self.parent()._files.previewPage()
+        self._chosen_file = QUrl()
+        self._chosen_document = None
+        if self._chosen_path is not None:
+            try:
+                with open(self._chosen_path, "rb") as f:
+                    self._chosen_document = f.read()
+                self._chosen_file = QUrl.fromUserInput(self._chosen_path)
+            except OSError:
+                self._chosen_path = None
+        self._preview = WebView(self)
 
         for i in range(len(self._styles)):
-            # QWebview creation
-            template.append(WebView(self))
-            template[i].load(self._chosen_file)
-            
             # Tab creation
-            self.tab_bar.addTab(template[i], self._styles[i]._name);
+            self.tab_bar.addTab(self.previewTab(), self._styles[i]._name);
             if self._styles[i]._user_style == False:
                 self.tab_bar.tabBar().tabButton(i, QTabBar.RightSide).resize(0,0)
 
@@ -72,6 +77,16 @@ class StyleScreen(QWidget):
         vbox.addWidget(button)
         self.setLayout(vbox)
 
+    def previewTab(self):
+        """ Object method
+            Params: None
+            Return: an empty tab (QWidget), into which the preview is moved when it becomes current
+        """
+        tab = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        tab.setLayout(layout)
+        return tab
 
     def addStyle(self, path):
         """ Object method
@@ -81,16 +96,12 @@ class StyleScreen(QWidget):
             A new tab is created and a new stylesheet is appended to the _styles list.
             Called when a CSS file is dragged and dropped onto the StyleScreen.
         """
-        # WebView Creation
-        new_template = WebView(self)
-        new_template.load(self._chosen_file)
-
         # Style creation and adds to the _styles list.
         new_style = StyleSheet(path, NEW_STYLE_NAME)
         self._styles.append(new_style)  
 
         # Tab creation
-        self.tab_bar.addTab(new_template, new_style._name)
+        self.tab_bar.addTab(self.previewTab(), new_style._name)
 
 
     def changeStyle(self, index):
@@ -99,12 +110,19 @@ class StyleScreen(QWidget):
             Return: None
             Changes the style applied to the HTML files, using the index of the active tab.
             This method is called each time the active tab is changed.
-            This applies a soft StyleSheet change (the HTML files are not modified).
+            The preview is moved into the active tab.
+            This applies a soft StyleSheet change: the previewed document is restyled in memory (see StyleHandler.restyle()) and displayed with setHtml(),
+            its base url being the previewed file, so that its script is found. The HTML files are only modified by confirm().
+            Without any previewed file, the NO_PREVIEW_HTML message is displayed.
         """
+        self.tab_bar.widget(index).layout().addWidget(self._preview)
+        if self._chosen_document is None:
+            self._preview.setHtml(NO_PREVIEW_HTML)
+            return
+
         new_name = "'" + QUrl.fromUserInput(os.path.realpath(self._styles[index]._path)).url() + "'"
-        StyleHandler.setStyle(self._chosen_file.toLocalFile(), new_name)
-        self.tab_bar.widget(index).load(self._chosen_file)
-        old_name = new_name
+        document = StyleHandler.restyle(self._chosen_document, new_name)
+        self._preview.setHtml(document.decode("utf-8", "replace"), self._chosen_file)
 
     def confirm(self):
         """ Object method
@@ -112,12 +130,26 @@ class StyleScreen(QWidget):
             Return: None
             Confirms the chosen style and adds it to the generated documentation.
             The chosen style is the style of the current tab.
-            This applies a hard StyleSheet change (the HTML files are modified).
+            This applies a hard StyleSheet change (the HTML files are modified), in the background: only the pages generated with another style are rewritten.
+            Once it is done, unless it was cancelled, the style is saved for the next sessions and the window is closed.
         """
         index = self.tab_bar.currentIndex()
         style_path = self._styles[index]._path
-        self.parent()._files.processStyles(style_path)
-        self.parent().close()
+        window = self.parent()
+        window.runInBackground(self.stylesApplied, window._files.processStyles, style_path)
+
+    def stylesApplied(self, done):
+        """ Object method
+            Params: bool done -> False if the restyling was cancelled
+            Return: None
+            Saves the style of the file handler, and closes the window. The pages which couldn't be restyled are reported in a message box.
+        """
+        report = self.parent()._files.parseReport()
+        if report != "":
+            QMessageBox.warning(self, PARSE_REPORT_TITLE, report)
+        if done:
+            self.parent()._files.saveStyle()
+            self.parent().close()
 
 
 class WebView(QWebView):
@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing the templates of the generated HTML documentation.
+
+    A template is a text containing fields, written ${field}. A '$' character is written $$.
+    Each template is compiled once per process into a list of literal parts and fields, and rendered fragment by fragment.
+    It contains two classes:
+        - Template: a compiled template
+        - TemplateSet: the set of templates used to document a Python file
+"""
+
+import os
+import re
+import hashlib
+from functools import lru_cache
+from constants import *
+
+
+class Template:
+    """ Inherits: None
+        This class represents a compiled template.
+        It has three attributes:
+            - _text, the template's text
+            - _parts, a list of (literal, field) tuples. The field is None for the last literal of the template.
+            - _substitute, the template compiled into a Python function, used when all the values are strings.
+    """
+
+    def __init__(self, text):
+        """ Constructor
+            Params: String text -> the template's text
+            Return: None
+            The text is split into literal parts and fields. '$$' is turned into '$'.
+            The parts are then compiled into a function concatenating the literals and the values of the fields.
+        """
+        self._text = text
+        self._parts = []
+        literal = ""
+        position = 0
+
+        for result in re.finditer(REGEX_TEMPLATE_FIELD, text):
+            literal += text[position:result.start()]
+            position = result.end()
+            if result.group("field") is None:
+                literal += "$"
+            else:
+                self._parts.append((literal, result.group("field")))
+                literal = ""
+
+        self._parts.append((literal + text[position:], None))
+
+        operands = []
+        for literal, field in self._parts:
+            operands.append(repr(literal))
+            if field is not None:
+                operands.append("values[%r]" % field)
+        self._substitute = eval("lambda values: " + " + ".join(operands))
+
+    def __reduce__(self):
+        """ Special method
+            Params: None
+            Return: the function and arguments rebuilding the template (tuple)
+            The compiled function cannot be pickled, so a pickled template is compiled again from its text, once per process.
+        """
+        return (compileTemplate, (self._text,))
+
+    def fields(self):
+        """ Object method
+            Params: None
+            Return: the names of the template's fields (List of String)
+        """
+        return [field for literal, field in self._parts if field is not None]
+
+    def substitute(self, values):
+        """ Object method
+            Params: dict values -> the value of each field, a String
+            Return: the rendered template (String)
+            This is faster than render(), for small templates such as the method's.
+        """
+        return self._substitute(values)
+
+    def render(self, values):
+        """ Generator
+            Params: dict values -> the value of each field, either a String or an iterable of String
+            Yield: the fragments of the rendered template (String)
+        """
+        for literal, field in self._parts:
+            if literal != "":
+                yield literal
+            if field is None:
+                continue
+
+            value = values[field]
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+
+@lru_cache(maxsize=None)
+def compileTemplate(text):
+    """ Function
+        Params: String text -> the template's text
+        Return: the compiled template (Template)
+        Each text is only compiled once per process.
+    """
+    return Template(text)
+
+
+class TemplateSet:
+    """ Inherits: None
+        This class gathers the compiled templates used to document a Python file:
+            - page: the html page, with fields head and body
+            - head: the html head, with fields title, style and script
+            - body: the html body, with fields title, docstring, imports, functions and classes
+            - imported: an imported module, with field module
+            - functions: the module-level functions, with field functions
+            - python_class: a class, with fields name, docstring and methods
+            - method: a method or a function, with fields name and docstring
+            - class_outline: the outline of a class whose section is loaded lazily, with fields id, fragment and name
+        By default, the generated documentation is the historical GooDoc documentation.
+    """
+
+    def __init__(self, page = TEMPLATE_PAGE, head = TEMPLATE_HEAD, body = TEMPLATE_BODY, imported = TEMPLATE_IMPORT,
+                 functions = TEMPLATE_FUNCTIONS, python_class = TEMPLATE_CLASS, method = TEMPLATE_METHOD,
+                 class_outline = TEMPLATE_CLASS_OUTLINE):
+        """ Constructor
+            Params: String page, head, body, imported, functions, python_class, method, class_outline -> the text of each template, has the TEMPLATE_* constants for default values
+            Return: None
+        """
+        self.page = compileTemplate(page)
+        self.head = compileTemplate(head)
+        self.body = compileTemplate(body)
+        self.imported = compileTemplate(imported)
+        self.functions = compileTemplate(functions)
+        self.python_class = compileTemplate(python_class)
+        self.method = compileTemplate(method)
+        self.class_outline = compileTemplate(class_outline)
+
+        digest = hashlib.sha256()
+        for text in (page, head, body, imported, functions, python_class, method, class_outline):
+            digest.update(text.encode("utf-8") + b"\0")
+        self._fingerprint = digest.hexdigest()
+
+    def fingerprint(self):
+        """ Object method
+            Params: None
+            Return: the hash of the texts of the templates (String), which changes whenever a template changes.
+        """
+        return self._fingerprint
+
+    @staticmethod
+    def load(folder):
+        """ Static method
+            Params: String folder -> a folder containing user templates
+            Return: the set of templates (TemplateSet)
+            Each template is read from the file named after it in the folder, with the '.html' extension (e.g. 'method.html').
+            The default template is used for each missing file.
+        """
+        texts = {}
+        for name in ("page", "head", "body", "imported", "functions", "python_class", "method", "class_outline"):
+            path = os.path.join(folder, name + ".html")
+            if os.path.isfile(path):
+                with open(path, "r") as file_resource:
+                    texts[name] = file_resource.read()
+
+        return TemplateSet(**texts)
+
+
+DEFAULT_TEMPLATES = TemplateSet()
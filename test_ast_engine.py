@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the ast_engine validation. """
+
+import unittest
+import html_gen
+from ast_engine import AstEngine
+from constants import *
+
+
+SOURCE = '''""" Module docstring """
+
+import os, sys as system
+from constants import *
+
+
+def function(a, b = 1, *args, **kwargs):
+    """ Function docstring """
+
+
+class Outer(object):
+    """ Outer docstring """
+
+    @staticmethod
+    def decorated(x):
+        """ Decorated docstring """
+
+    class Inner:
+
+        def method(self):
+            def nested():
+                pass
+'''
+
+
+class TestAstEngine(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides a unitary test for each element of the outline returned by AstEngine.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it.
+            An attribute outline, outline of the SOURCE module, is added.
+        """
+        self.outline = AstEngine(SOURCE).outline()
+
+    def test_docstring(self):
+        """ Object method
+            Params: None
+            Return: None
+            The module's docstring needs to be found, as written in the source.
+        """
+        self.assertEqual(self.outline['docstring'], " Module docstring ")
+
+    def test_imports(self):
+        """ Object method
+            Params: None
+            Return: None
+            Each imported name needs to be found, the 'from ... import' statements coming last.
+        """
+        self.assertEqual(self.outline['imports'], ["os", "sys as system", "constants.*"])
+
+    def test_functions(self):
+        """ Object method
+            Params: None
+            Return: None
+            The module-level function needs to be found, but not the function nested in a method.
+        """
+        self.assertEqual(self.outline['functions'], [("function(a, b = 1, *args, **kwargs)", " Function docstring ")])
+
+    def test_classes(self):
+        """ Object method
+            Params: None
+            Return: None
+            The nested class needs to be found and named after its enclosing class.
+            The decorated method needs to be found.
+        """
+        names = [name for name, docstring, methods in self.outline['classes']]
+        self.assertEqual(names, ["Outer(object)", "Outer.Inner"])
+
+        name, docstring, methods = self.outline['classes'][0]
+        self.assertEqual(docstring, " Outer docstring ")
+        self.assertEqual(methods, [("decorated(x)", " Decorated docstring ")])
+        self.assertEqual(self.outline['classes'][1][2], [("method(self)", None)])
+
+    def test_async(self, source="class A:\n    async def c(self, x):\n        pass\n\nasync def n(y):\n    pass\n"):
+        """ Object method
+            Params: source (str) -> a module with async functions, whose names occur in the 'async' keyword.
+            Return: None
+            The parameters of the async functions and methods need to be found.
+        """
+        outline = AstEngine(source).outline()
+        self.assertEqual(outline['functions'], [("n(y)", None)])
+        self.assertEqual(outline['classes'][0][2], [("c(self, x)", None)])
+
+
+class TestEngines(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class compares the PythonFile objects filled by both engines.
+    """
+
+    def test_sameClasses(self, path="test_html_gen.py"):
+        """ Object method
+            Params: path (str) -> path to a file that both engines read correctly.
+            Return: None
+            Both engines need to find the same classes, with the same methods.
+        """
+        regex_file = html_gen.PythonFile(path, REGEX_ENGINE)
+        ast_file = html_gen.PythonFile(path, AST_ENGINE)
+
+        self.assertEqual([c._name for c in regex_file._classes], [c._name for c in ast_file._classes])
+        for regex_class, ast_class in zip(regex_file._classes, ast_file._classes):
+            self.assertEqual([m._name for m in regex_class._methods], [m._name for m in ast_class._methods])
+
+
+if __name__ == "__main__":
+    unittest.main()
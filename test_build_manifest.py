@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the build_manifest validation. """
+
+import os
+import tempfile
+import unittest
+from build_manifest import BuildManifest
+from constants import *
+
+
+class TestBuildManifest(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the BuildManifest class.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it.
+            A source and its page are created in a temporary directory, and recorded in a new manifest.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "source.py")
+        self.output = os.path.join(self.directory.name, "source.html")
+        self.write(self.source, "class A:\n    pass\n")
+        self.write(self.output, "<html></html>\n")
+
+        self.manifest = BuildManifest(self.directory.name)
+        self.manifest.record(self.source, "settings", self.output)
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The temporary directory is removed.
+        """
+        self.directory.cleanup()
+
+    def write(self, path, content):
+        """ Object method
+            Params: path (str) -> the written file
+                    content (str) -> the file's new content
+            Return: None
+        """
+        with open(path, "w") as file_resource:
+            file_resource.write(content)
+
+    def test_upToDate(self):
+        """ Object method
+            Params: None
+            Return: None
+            An unchanged source needs to be up to date, even in a manifest read again from the disk.
+        """
+        self.assertTrue(self.manifest.isUpToDate(self.source, "settings"))
+        self.manifest.save()
+        self.assertTrue(BuildManifest(self.directory.name).isUpToDate(self.source, "settings"))
+
+    def test_touched(self):
+        """ Object method
+            Params: None
+            Return: None
+            A source whose modification time changed, but not its content, needs to be up to date.
+        """
+        os.utime(self.source, (0, 0))
+        self.assertTrue(self.manifest.isUpToDate(self.source, "settings"))
+
+    def test_changed(self):
+        """ Object method
+            Params: None
+            Return: None
+            A source whose content changed, a build with other settings and a removed page need to be out of date.
+        """
+        self.assertFalse(self.manifest.isUpToDate(self.source, "other settings"))
+
+        self.write(self.source, "class B:\n    pass\n")
+        os.utime(self.source, (0, 0))
+        self.assertFalse(self.manifest.isUpToDate(self.source, "settings"))
+
+        self.manifest.record(self.source, "settings", self.output)
+        os.remove(self.output)
+        self.assertFalse(self.manifest.isUpToDate(self.source, "settings"))
+
+    def test_removeStale(self):
+        """ Object method
+            Params: None
+            Return: None
+            The page of a removed source needs to be deleted, along with its entry.
+        """
+        self.assertEqual(self.manifest.removeStale(), [])
+
+        os.remove(self.source)
+        self.assertEqual(self.manifest.removeStale(), [self.output])
+        self.assertFalse(os.path.exists(self.output))
+        self.assertEqual(self.manifest.output(self.source), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the compression validation. """
+
+import os
+import gzip
+import tempfile
+import unittest
+from html_gen import PythonFile
+from compression import CompressedCopies, compressAsset, compressedPaths, removeCompressed
+from constants import *
+
+
+class TestCompression(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the compression module.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it. A temporary directory is created.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = self.directory.name
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The temporary directory is removed.
+        """
+        self.directory.cleanup()
+
+    def test_tee(self):
+        """ Object method
+            Params: None
+            Return: None
+            The fragments need to be yielded unchanged, and the gzip copy needs to hold their content.
+            Two copies of the same content need to be identical.
+        """
+        path = os.path.join(self.folder, "page.html")
+        contents = []
+        for i in range(2):
+            with CompressedCopies(path) as copies:
+                self.assertEqual(list(copies.tee(["<p>", "é", "</p>"])), ["<p>", "é", "</p>"])
+            with open(path + GZIP_EXTENSION, "rb") as file_resource:
+                contents.append(file_resource.read())
+
+        self.assertEqual(gzip.decompress(contents[0]), "<p>é</p>".encode("utf-8"))
+        self.assertEqual(contents[0], contents[1])
+        self.assertEqual(sorted(os.listdir(self.folder)), sorted(os.path.basename(p) for p in compressedPaths(path)))
+
+    def test_compressAsset(self):
+        """ Object method
+            Params: None
+            Return: None
+            The copies of an asset need to be written only if its content changed, even if it was replaced by an older file,
+            and to be removed by removeCompressed.
+        """
+        path = os.path.join(self.folder, "fold.js")
+        with open(path, "w") as file_resource:
+            file_resource.write("function fold(){}\n")
+
+        self.assertTrue(compressAsset(path))
+        self.assertFalse(compressAsset(path))
+        os.utime(path, (os.stat(path).st_atime, os.stat(path).st_mtime + 10))
+        self.assertFalse(compressAsset(path))
+
+        with open(path, "w") as file_resource:
+            file_resource.write("function unfold(){}\n")
+        os.utime(path, (0, 0))
+        self.assertTrue(compressAsset(path))
+        with gzip.open(path + GZIP_EXTENSION, "rb") as compressed:
+            self.assertEqual(compressed.read(), b"function unfold(){}\n")
+
+        removeCompressed(path)
+        self.assertEqual(os.listdir(self.folder), ["fold.js"])
+
+    def test_save(self, path="compression.py"):
+        """ Object method
+            Params: path (str) -> a documented file, has the compression module for default value
+            Return: None
+            The gzip copy of a page needs to hold the page, and to be removed when the page is saved without compression.
+        """
+        python_file = PythonFile(path)
+        page = python_file.save(self.folder, compress=True)
+        with open(page, "rb") as file_resource, gzip.open(page + GZIP_EXTENSION, "rb") as compressed:
+            self.assertEqual(compressed.read(), file_resource.read())
+
+        python_file.save(self.folder)
+        self.assertFalse(os.path.exists(page + GZIP_EXTENSION))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the dir_walker validation. """
+
+import os
+import tempfile
+import unittest
+from dir_walker import walkFiles, isWanted
+from constants import *
+
+
+class TestWalkFiles(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the walkFiles generator, on a small tree created in a temporary directory.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it.
+            The tree contains sources, a version control folder, a virtual environment, node_modules and a .gitignore file.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        for path in ("main.py", "notes.txt", "package/module.py", "package/page.html", "package/generated/out.py",
+                     "package/keep.py", "tests/test_main.py", ".git/hook.py", "node_modules/lib/tool.py", "env/lib/site.py"):
+            self.write(path, "")
+        self.write("env/" + VIRTUALENV_MARKER, "")
+        self.write(GITIGNORE_FILE_NAME, "# comment\ngenerated/\n*.html\n")
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The temporary directory is removed.
+        """
+        self.directory.cleanup()
+
+    def write(self, path, content):
+        """ Object method
+            Params: path (str) -> the written file, relative to the temporary directory
+                    content (str) -> the file's new content
+            Return: None
+        """
+        path = os.path.join(self.directory.name, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file_resource:
+            file_resource.write(content)
+
+    def walk(self, **options):
+        """ Object method
+            Params: options -> the options of walkFiles
+            Return: the walked files, relative to the temporary directory (sorted list)
+        """
+        return sorted(os.path.relpath(path, self.directory.name).replace(os.sep, "/") for path in walkFiles(self.directory.name, **options))
+
+    def test_pruning(self):
+        """ Object method
+            Params: None
+            Return: None
+            The excluded folders, the virtual environment and the ignored files need to be skipped.
+        """
+        self.assertEqual(self.walk(), ["main.py", "package/keep.py", "package/module.py", "tests/test_main.py"])
+        self.assertIn("package/page.html", self.walk(gitignore=False))
+
+    def test_globs(self):
+        """ Object method
+            Params: None
+            Return: None
+            Only the files matching an include pattern, and no exclude pattern, need to be walked.
+        """
+        self.assertEqual(self.walk(exclude=("tests", "keep.py")), ["main.py", "package/module.py"])
+        self.assertEqual(self.walk(include=("package/*",)), ["package/keep.py", "package/module.py"])
+
+    def test_gitignoreNegation(self):
+        """ Object method
+            Params: None
+            Return: None
+            A negated rule of a .gitignore file in a subfolder needs to override the rules of the parent folder.
+        """
+        self.write("package/" + GITIGNORE_FILE_NAME, "*.py\n!keep.py\n")
+        self.assertEqual(self.walk(), ["main.py", "package/keep.py", "tests/test_main.py"])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symbolic links are not supported")
+    def test_symlinkLoop(self):
+        """ Object method
+            Params: None
+            Return: None
+            A symbolic link to a parent folder must not be followed.
+        """
+        os.symlink(self.directory.name, os.path.join(self.directory.name, "package", "loop"))
+        self.assertEqual(self.walk(), ["main.py", "package/keep.py", "package/module.py", "tests/test_main.py"])
+
+    def test_cache(self):
+        """ Object method
+            Params: None
+            Return: None
+            The cached rules of a .gitignore file need to be used while it is unchanged, and read again once it changed.
+        """
+        cache = {}
+        self.assertEqual(self.walk(cache=cache), ["main.py", "package/keep.py", "package/module.py", "tests/test_main.py"])
+        rules = cache[(self.directory.name, "")][1]
+        self.walk(cache=cache)
+        self.assertIs(cache[(self.directory.name, "")][1], rules)
+
+        self.write(GITIGNORE_FILE_NAME, "tests/\n")
+        self.assertEqual(self.walk(cache=cache), ["main.py", "package/generated/out.py", "package/keep.py", "package/module.py", "package/page.html"])
+
+    def test_isWanted(self):
+        """ Object method
+            Params: None
+            Return: None
+            A single file needs to be wanted if and only if it is walked.
+        """
+        walked = self.walk(exclude=("keep.py",))
+        for path in ("main.py", "notes.txt", "package/module.py", "package/page.html", "package/generated/out.py", "package/keep.py",
+                     ".git/hook.py", "node_modules/lib/tool.py", "env/lib/site.py", "../outside.py"):
+            wanted = isWanted(self.directory.name, os.path.join(self.directory.name, path), exclude=("keep.py",), cache={})
+            self.assertEqual(wanted, path in walked, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,11 +6,12 @@
 import os
 import sys
 import shutil
+import tempfile
 
 from PyQt5.QtWidgets import QApplication
 
 import unittest
-from html_gen import PythonFile
+from html_gen import PythonSource
 from file_handler import FileHandler
 from goodoc import Window
 from constants import *
@@ -75,7 +76,7 @@ class TestFileHandler(unittest.TestCase):
         self.goodoc._files.addFiles(test_list)
 
         for el in self.goodoc._files._pythonFiles:
-            self.assertEqual(type(el), PythonFile)
+            self.assertEqual(type(el), PythonSource)
 
         for el in self.goodoc._files._htmlFiles:
             extension = os.path.splitext(el)[1]
@@ -108,6 +109,70 @@ class TestFileHandler(unittest.TestCase):
 
         shutil.rmtree(self.goodoc._files._path)
 
+    def test_cancel(self):
+        """ Object method
+            Params: None
+            Return: None
+            This method tests the progress notifications and the cancellation of processFiles.
+            The generation is cancelled by the progress callback, as soon as the first page is written.
+            Only this page needs to be generated, and the other python files need to stay in the _pythonFiles list.
+        """
+        handler = self.goodoc._files
+        handler.addFiles(["test_file_handler.py", "file_handler.py", "html_gen.py"])
+        written = []
+
+        def progress(stage, path):
+            if stage == PROGRESS_WRITTEN:
+                written.append(path)
+                handler.cancel()
+
+        handler._progress = progress
+        self.assertFalse(handler.processFiles())
+        handler._progress = None
+
+        self.assertEqual(len(written), 1)
+        self.assertEqual(len(handler._pythonFiles), 2)
+        self.assertEqual([f for f in os.listdir(handler._path) if f.endswith(".html")], [os.path.basename(written[0])])
+
+        shutil.rmtree(handler._path)
+
+    def test_previewPage(self):
+        """ Object method
+            Params: None
+            Return: None
+            The previewed page needs to be the smallest generated page.
+        """
+        handler = self.goodoc._files
+        handler.addFiles(["test_file_handler.py", "file_handler.py", "html_gen.py"])
+        handler.processFiles()
+
+        pages = list(handler._htmlFiles)
+        self.assertEqual(handler.previewPage(), min(pages, key=os.path.getsize))
+
+        shutil.rmtree(handler._path)
+        self.assertEqual(handler.previewPage(), None)
+
+    def test_copyAsset(self):
+        """ Object method
+            Params: None
+            Return: None
+            The copy of an asset needs to be written only if its content differs from the asset's.
+        """
+        handler = self.goodoc._files
+        with tempfile.TemporaryDirectory() as folder:
+            handler._path = folder
+            copy_path = os.path.join(folder, os.path.basename(JAVASCRIPT_FILE_PATH))
+            handler.copyAsset(JAVASCRIPT_FILE_PATH)
+            os.utime(copy_path, (0, 0))
+            handler.copyAsset(JAVASCRIPT_FILE_PATH)
+            self.assertEqual(os.stat(copy_path).st_mtime, 0)
+
+            with open(copy_path, "a") as file_resource:
+                file_resource.write("\n")
+            handler.copyAsset(JAVASCRIPT_FILE_PATH)
+            with open(copy_path, "rb") as copy, open(JAVASCRIPT_FILE_PATH, "rb") as source:
+                self.assertEqual(copy.read(), source.read())
+
 
 if __name__=="__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the file_registry validation. """
+
+import os
+import unittest
+from file_registry import FileRegistry
+
+
+class TestFileRegistry(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the FileRegistry class.
+    """
+
+    def test_add(self):
+        """ Object method
+            Params: None
+            Return: None
+            A file added through another path needs to be found, and must not be added twice.
+        """
+        registry = FileRegistry()
+        self.assertTrue(registry.add("file_registry.py"))
+        self.assertFalse(registry.add(os.path.abspath("file_registry.py")))
+        self.assertFalse(registry.add(os.path.join("..", os.path.basename(os.getcwd()), "file_registry.py")))
+        self.assertTrue(registry.add("constants.py", "item"))
+
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(list(registry), ["file_registry.py", "item"])
+        self.assertEqual(registry[1], "item")
+        self.assertIn("./constants.py", registry)
+        self.assertNotIn("html_gen.py", registry)
+
+    def test_remove(self):
+        """ Object method
+            Params: None
+            Return: None
+            A removed file needs to be unknown, and can be added again.
+        """
+        registry = FileRegistry()
+        for path in ("a.py", "b.py", "c.py"):
+            registry.add(path)
+
+        self.assertEqual(registry.pop(0), "a.py")
+        registry.discard(os.path.abspath("c.py"))
+        registry.discard("d.py")
+        self.assertEqual(list(registry), ["b.py"])
+        self.assertNotIn("a.py", registry)
+        self.assertTrue(registry.add("a.py"))
+
+    def test_index(self):
+        """ Object method
+            Params: None
+            Return: None
+            The items need to be indexed in the order of addition, after removals and additions.
+        """
+        registry = FileRegistry()
+        for path in ("a.py", "b.py", "c.py", "d.py"):
+            registry.add(path)
+
+        self.assertEqual(registry[2], "c.py")
+        registry.discard("b.py")
+        self.assertEqual(registry[1], "c.py")
+        registry.add("e.py")
+        self.assertEqual(registry.pop(), "e.py")
+        self.assertEqual(registry.pop(-2), "c.py")
+        self.assertEqual([registry[i] for i in range(len(registry))], ["a.py", "d.py"])
+        registry.clear()
+        self.assertRaises(IndexError, registry.pop)
+
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
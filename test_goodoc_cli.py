@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the goodoc_cli validation. """
+
+import os
+import sys
+import tempfile
+import unittest
+import subprocess
+from goodoc_cli import main
+from constants import *
+
+
+class TestCommandLine(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class runs the command line interface on the files of GooDoc.
+    """
+
+    def test_main(self, paths=["test_html_gen.py", "test_goodoc_cli.py"]):
+        """ Object method
+            Params: paths (list) -> the documented files
+            Return: None
+            A page needs to be generated for each file, with the requested style sheet, next to a copy of that style sheet.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            output = os.path.join(folder, NAME_CREATED_FOLDER)
+            self.assertEqual(main(paths + ["-o", output, "--style", STYLE_MELTDOWN_NAME]), 0)
+
+            for path in paths:
+                with open(os.path.join(output, path[:-3] + ".html"), "r") as file_resource:
+                    self.assertIn("href='meltdown.css'", file_resource.read())
+            self.assertTrue(os.path.isfile(os.path.join(output, "meltdown.css")))
+
+    def test_errors(self):
+        """ Object method
+            Params: None
+            Return: None
+            An unknown style and paths matching no python file need to fail with a non zero exit status.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            self.assertEqual(main(["test_html_gen.py", "-o", folder, "--style", "no such style"]), 2)
+            self.assertEqual(main([os.path.join(folder, "*.py"), "-o", folder]), 1)
+
+    def test_htmlOnly(self):
+        """ Object method
+            Params: None
+            Return: None
+            Given html files only, they need to be restyled, next to a copy of the style sheet, and the exit status needs to be 0.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            page = os.path.join(folder, "page.html")
+            with open(page, "w") as file_resource:
+                file_resource.write("<html>\n\t<head>\n\t\t<link  rel='stylesheet' type='text/css' href='goo.css' />\n\t</head>\n</html>\n")
+
+            self.assertEqual(main([page, "--style", STYLE_MELTDOWN_NAME]), 0)
+            with open(page, "r") as file_resource:
+                self.assertIn("href='meltdown.css'", file_resource.read())
+            self.assertTrue(os.path.isfile(os.path.join(folder, "meltdown.css")))
+
+    def test_noQt(self):
+        """ Object method
+            Params: None
+            Return: None
+            The command line interface must not import PyQt5.
+        """
+        code = "import sys, goodoc_cli; print('PyQt5' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(output.strip(), b"False")
+
+
+if __name__ == "__main__":
+    unittest.main()
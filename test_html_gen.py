@@ -120,6 +120,73 @@ class TestPythonFile(unittest.TestCase):
             i+=1
 
 
+    def test_formatDocstring(self, indentation_level=1):
+        """ Object method.
+            Params: indentation_level (int) -> an indentation level, different from the file's.
+            Return: None
+            This method tests the behaviour of the formatDocstring method.
+            The docstring formatted with another indentation level needs to be memoized, without changing the file's docstring.
+        """
+        docstring = self.python_file._docstring
+        formatted = self.python_file.formatDocstring(indentation_level)
+
+        self.assertTrue(formatted is self.python_file.formatDocstring(indentation_level))
+        self.assertEqual(formatted.count("<br />\n" + "\t"*indentation_level), self.python_file._raw_docstring.count("\n"))
+        self.assertEqual(self.python_file._docstring, docstring)
+
+
+    def test_save(self, path="."):
+        """ Object method.
+            Params: path (str) -> the save folder's path, has the current dir for default value.
+            Return: None
+            This method tests the behaviour of the save method.
+            The content of the saved file needs to be equal to the documentation returned by the document method.
+        """
+        new_path = self.python_file.save(path)
+        with open(new_path, "r") as file_resource:
+            saved = file_resource.read()
+        os.remove(new_path)
+
+        self.assertEqual(saved, self.python_file.document())
+
+    def test_saveLazy(self, path="."):
+        """ Object method.
+            Params: path (str) -> the save folder's path, has the current dir for default value.
+            Return: None
+            This method tests the behaviour of the save method, in lazy mode.
+            The page needs to outline each class, and each class section needs to be saved in its own fragment.
+            The fragments need to be removed when the page is saved again without the lazy mode.
+        """
+        new_path = self.python_file.save(path, lazy=True)
+        folder = self.python_file.fragmentFolder(path)
+        with open(new_path, "r") as file_resource:
+            saved = file_resource.read()
+        fragments = sorted(os.listdir(folder))
+        with open(os.path.join(folder, "0.js"), "r") as file_resource:
+            fragment = file_resource.read()
+
+        self.python_file.save(path)
+        os.remove(new_path)
+
+        self.assertEqual(saved, self.python_file.document(lazy=True))
+        self.assertEqual(saved.count("data-fragment="), len(self.python_file._classes))
+        self.assertEqual(fragments, sorted(str(i) + ".js" for i in range(len(self.python_file._classes))))
+        self.assertIn(self.python_file._classes[0]._name, fragment)
+        self.assertFalse(os.path.exists(folder))
+
+    def test_documentHead(self, style="'goo.css'"):
+        """ Object method.
+            Params: style (str) -> the quoted name of the style sheet, has 'goo.css' for default value.
+            Return: None
+            This method tests the behaviour of the documentHead method.
+            The head needs to link the given style sheet instead of the STYLE_BASENAME placeholder.
+        """
+        self.assertIn(STYLE_BASENAME, self.python_file.documentHead())
+        head = self.python_file.documentHead(style=style)
+        self.assertIn("href=" + style, head)
+        self.assertNotIn(STYLE_BASENAME, head)
+
+
 
 
 class TestPythonClass(unittest.TestCase):
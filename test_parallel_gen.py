@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the parallel_gen validation. """
+
+import os
+import tempfile
+import unittest
+from html_gen import PythonFile
+from parallel_gen import generateFiles
+from templates import DEFAULT_TEMPLATES
+from constants import *
+
+
+class TestParallelGeneration(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class compares the pages generated by the worker processes with the pages generated by PythonFile.save.
+    """
+
+    def test_generateFiles(self, paths=["test_html_gen.py", "test_parallel_gen.py"], jobs=2):
+        """ Object method
+            Params: paths (list) -> the documented files
+                    jobs (int) -> the number of worker processes
+            Return: None
+            Each file needs to be generated once, and its page needs to be identical to the page generated by PythonFile.save.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            results = list(generateFiles(paths, folder, ALPHABETICAL_ORDER, REGEX_ENGINE, DEFAULT_TEMPLATES, None, PARSE_TIME_BUDGET, jobs))
+            self.assertEqual(sorted(source for source, new_path, diagnostics, symbols in results), sorted(paths))
+
+            for source, new_path, diagnostics, symbols in results:
+                with open(new_path, "r") as file_resource:
+                    generated = file_resource.read()
+
+                python_file = PythonFile(source)
+                python_file.sort()
+                self.assertEqual(generated, python_file.document())
+                self.assertEqual(diagnostics, [])
+                self.assertEqual(symbols, python_file.symbols())
+
+
+if __name__ == "__main__":
+    unittest.main()
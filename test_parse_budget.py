@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the parse_budget validation. """
+
+import os
+import tempfile
+import threading
+import unittest
+from html_gen import PythonFile
+from parse_budget import ParseBudget
+from constants import *
+
+
+# Each line is a failed attempt for REGEX_CLASS, which scans the rest of the file
+PATHOLOGICAL_SOURCE = 'x = """class A(b): \n"""\n' + 'd = {"class K(": 1, "): def": 2}\n' * 4000
+
+
+class TestParseBudget(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the ParseBudget class.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it.
+            A ParseBudget with a short budget is created, and a temporary directory is created for the tested sources.
+        """
+        self.budget = ParseBudget(0.5)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The child process and the temporary directory are removed.
+        """
+        self.budget.close()
+        self.directory.cleanup()
+
+    def writeSource(self, content):
+        """ Object method
+            Params: content (str) -> the content of the source
+            Return: the path of a new source containing content (str).
+        """
+        path = os.path.join(self.directory.name, "source.py")
+        with open(path, "w") as file_resource:
+            file_resource.write(content)
+        return path
+
+    def test_withinBudget(self, path="test_html_gen.py"):
+        """ Object method
+            Params: path (str) -> a file parsed quickly.
+            Return: None
+            The file needs to be parsed with the regex engine, and nothing needs to be reported.
+        """
+        python_file = self.budget.parse(path)
+        self.assertEqual(len(python_file._classes), len(PythonFile(path)._classes))
+        self.assertEqual(self.budget.report(), "")
+
+    def test_fallback(self):
+        """ Object method
+            Params: None
+            Return: None
+            A file exceeding the budget needs to be parsed with the ast engine, and reported.
+        """
+        path = self.writeSource(PATHOLOGICAL_SOURCE)
+        python_file = self.budget.parse(path)
+        self.assertEqual(python_file._engine, AST_ENGINE)
+        self.assertTrue(path in self.budget.report())
+
+    def test_skip(self):
+        """ Object method
+            Params: None
+            Return: None
+            A file exceeding the budget and not valid Python needs to be skipped, and reported.
+        """
+        path = self.writeSource(PATHOLOGICAL_SOURCE + "def (:\n")
+        self.assertEqual(self.budget.parse(path), None)
+        self.assertTrue("skipped" in self.budget.report())
+
+    def test_thread(self, path="test_html_gen.py"):
+        """ Object method
+            Params: path (str) -> a file parsed quickly.
+            Return: None
+            A file needs to be parsed from another thread than the main thread, by a spawned child process, which is stopped by close().
+        """
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.budget.parse(path)))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(results[0]._classes), len(PythonFile(path)._classes))
+        self.assertEqual(self.budget._pool._ctx.get_start_method(), "spawn")
+        self.budget.close()
+        self.assertEqual(self.budget._pool, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the parse_cache validation. """
+
+import os
+import tempfile
+import unittest
+from html_gen import PythonFile
+from parse_cache import ParseCache
+from constants import *
+
+
+class TestParseCache(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the ParseCache class.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it.
+            A ParseCache is created in a temporary directory.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(self.directory.name)
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The temporary directory is removed.
+        """
+        self.directory.cleanup()
+
+    def test_key(self, data="class A:\n    pass\n"):
+        """ Object method
+            Params: data (str) -> a file's content.
+            Return: None
+            The key needs to depend on the content and on the engine.
+        """
+        self.assertEqual(ParseCache.key(data, REGEX_ENGINE), ParseCache.key(data, REGEX_ENGINE))
+        self.assertNotEqual(ParseCache.key(data, REGEX_ENGINE), ParseCache.key(data, AST_ENGINE))
+        self.assertNotEqual(ParseCache.key(data, REGEX_ENGINE), ParseCache.key(data + "\n", REGEX_ENGINE))
+
+    def test_hit(self, path="test_html_gen.py"):
+        """ Object method
+            Params: path (str) -> path to a python file.
+            Return: None
+            A file parsed twice needs to be read from the cache the second time, and documented in the same way.
+        """
+        parsed = PythonFile(path, REGEX_ENGINE, self.cache)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+        cached = PythonFile(path, REGEX_ENGINE, self.cache)
+        self.assertEqual(cached.document(), parsed.document())
+        self.assertEqual(len(self.cache.entries()), 1)
+
+    def test_evict(self):
+        """ Object method
+            Params: None
+            Return: None
+            The least recently used entries need to be removed until the cache is below its maximum size.
+        """
+        for i in range(3):
+            self.cache.put(str(i), "x" * 1000)
+            os.utime(self.cache.entryPath(str(i)), (i, i))
+
+        self.cache._max_size = 2500
+        self.cache.evict()
+
+        self.assertEqual(self.cache.get("0"), None)
+        self.assertEqual(self.cache.get("2"), "x" * 1000)
+
+    def test_clear(self):
+        """ Object method
+            Params: None
+            Return: None
+            No entry needs to remain after clear.
+        """
+        self.cache.put("key", [1, 2, 3])
+        self.cache.clear()
+        self.assertEqual(self.cache.entries(), [])
+        self.assertEqual(self.cache.get("key"), None)
+
+
+if __name__ == "__main__":
+    unittest.main()
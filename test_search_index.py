@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the search_index validation. """
+
+import os
+import json
+import tempfile
+import unittest
+from html_gen import PythonFile
+from search_index import SearchIndex
+from constants import *
+
+
+class TestSearchIndex(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the SearchIndex class.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it. The index contains the symbols of two pages.
+        """
+        self.index = SearchIndex()
+        self.index.add("folder/first.html", [("Beta", SYMBOL_CLASS, "", "A class"), ("alpha(self)", SYMBOL_METHOD, "Beta", "A method")])
+        self.index.add("folder/second.html", [("_private()", SYMBOL_FUNCTION, "", ""), ("Another", SYMBOL_CLASS, "", "")])
+
+    def rows(self, content):
+        """ Object method
+            Params: content (str) -> the content of a shard
+            Return: the key, pages and rows of the shard (tuple)
+        """
+        return json.loads("[" + content[len("goodocSearch.shard("):-len(");\n")] + "]")
+
+    def test_shards(self):
+        """ Object method
+            Params: None
+            Return: None
+            The symbols need to be split by first letter after the leading underscores, and sorted by lowercase name in each shard.
+        """
+        self.assertEqual(SearchIndex.shardKey("__init__(self)"), "i")
+        self.assertEqual(SearchIndex.shardKey("été()"), SEARCH_OTHER_SHARD)
+
+        shards = self.index.shards()
+        self.assertEqual(sorted(shards), ["a", "b", "p"])
+
+        key, pages, rows = self.rows(shards["a"])
+        self.assertEqual(key, "a")
+        self.assertEqual(pages, ["first.html", "second.html"])
+        self.assertEqual(rows, [["alpha(self)", SYMBOL_METHOD, "Beta", 0, "A method"], ["Another", SYMBOL_CLASS, "", 1, ""]])
+
+        self.index.remove("folder/second.html")
+        self.assertEqual(sorted(self.index.shards()), ["a", "b"])
+        self.assertEqual(len(self.index), 2)
+
+    def test_save(self):
+        """ Object method
+            Params: None
+            Return: None
+            The shards, the search page and the search script need to be written. The shard of a letter without symbols anymore needs to be removed.
+            The search page can't have the name of a module's page.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            page = self.index.save(folder, "'goo.css'")
+            self.assertFalse(os.path.splitext(os.path.basename(page))[0].isidentifier())
+            self.assertEqual(sorted(os.listdir(os.path.join(folder, SEARCH_FOLDER_NAME))), ["a.js", "b.js", "p.js"])
+            self.assertTrue(os.path.isfile(os.path.join(folder, os.path.basename(SEARCH_SCRIPT_PATH))))
+            with open(page, "r") as file_resource:
+                self.assertIn("href='goo.css'", file_resource.read())
+
+            self.index.remove("folder/second.html")
+            self.index.save(folder)
+            self.assertEqual(sorted(os.listdir(os.path.join(folder, SEARCH_FOLDER_NAME))), ["a.js", "b.js"])
+
+    def test_compress(self):
+        """ Object method
+            Params: None
+            Return: None
+            The shards, the search page and the search script need to have a gzip copy, removed with the shard of a letter without symbols anymore,
+            and removed when the index is saved without compression.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            page = self.index.save(folder, compress=True)
+            search_folder = os.path.join(folder, SEARCH_FOLDER_NAME)
+            self.assertIn("p.js" + GZIP_EXTENSION, os.listdir(search_folder))
+            self.assertTrue(os.path.isfile(page + GZIP_EXTENSION))
+            self.assertTrue(os.path.isfile(os.path.join(folder, os.path.basename(SEARCH_SCRIPT_PATH)) + GZIP_EXTENSION))
+
+            self.index.remove("folder/second.html")
+            self.index.save(folder, compress=True)
+            self.assertEqual(sorted(name for name in os.listdir(search_folder) if name.endswith(GZIP_EXTENSION)), ["a.js.gz", "b.js.gz"])
+
+            self.index.save(folder)
+            self.assertEqual(sorted(os.listdir(search_folder)), ["a.js", "b.js"])
+            self.assertFalse(os.path.exists(page + GZIP_EXTENSION))
+
+    def test_symbols(self, path="search_index.py"):
+        """ Object method
+            Params: path (str) -> a documented file, has the search_index module for default value
+            Return: None
+            The symbols of a python file need to contain its classes and their methods.
+        """
+        symbols = PythonFile(path).symbols()
+        self.assertIn(("SearchIndex", SYMBOL_CLASS, "", "Inherits: None"), symbols)
+        self.assertIn("SearchIndex", [owner for name, kind, owner, excerpt in symbols if name.startswith("shards(")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the style_handler validation. """
+
+import os
+import tempfile
+import unittest
+from style_handler import StyleHandler
+from constants import *
+
+
+PAGE = ("<!DOCTYPE html>\n<html>\n\t<head>\n\t\t<link  rel='stylesheet' type='text/css' href='goo.css' />\n\t</head>\n"
+        "\t<body>\n\t\t<a href='goo.css' >goo.css</a>\n\t</body>\n</html>\n")
+
+
+class TestSetStyle(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the restyling static methods of the StyleHandler class.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it. Pages using the goo style are created in a temporary directory.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = [os.path.join(self.directory.name, "page%d.html" % i) for i in range(20)]
+        for path in self.paths:
+            with open(path, "w") as file_resource:
+                file_resource.write(PAGE)
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The temporary directory is removed.
+        """
+        self.directory.cleanup()
+
+    def read(self, path):
+        """ Object method
+            Params: path (str) -> a page's path
+            Return: the page's content (str)
+        """
+        with open(path, "r") as file_resource:
+            return file_resource.read()
+
+    def test_setStyle(self):
+        """ Object method
+            Params: None
+            Return: None
+            Only the href of the stylesheet link needs to change, whatever the length of the new name.
+            A page which already has the style needs to be left untouched.
+        """
+        for new_name in ("'abc.css'", "'meltdown.css'"):
+            self.assertTrue(StyleHandler.setStyle(self.paths[0], new_name))
+            self.assertEqual(self.read(self.paths[0]), PAGE.replace("href='goo.css' />", "href=" + new_name + " />"))
+            self.assertFalse(StyleHandler.setStyle(self.paths[0], new_name))
+            StyleHandler.setStyle(self.paths[0], "'goo.css'")
+
+        self.assertEqual(sorted(os.listdir(self.directory.name)), sorted(os.path.basename(path) for path in self.paths))
+
+    def test_restyle(self):
+        """ Object method
+            Params: None
+            Return: None
+            The content needs to be restyled as the file would be by setStyle, and the file needs to be left untouched.
+        """
+        with open(self.paths[0], "rb") as file_resource:
+            document = file_resource.read()
+        restyled = StyleHandler.restyle(document, "'meltdown.css'")
+        StyleHandler.setStyle(self.paths[1], "'meltdown.css'")
+
+        with open(self.paths[1], "rb") as file_resource:
+            self.assertEqual(restyled, file_resource.read())
+        self.assertEqual(self.read(self.paths[0]), PAGE)
+
+    def test_setStyles(self):
+        """ Object method
+            Params: None
+            Return: None
+            Each page needs to be restyled once.
+        """
+        results = dict(StyleHandler.setStyles(self.paths, "'deepblue.css'", threads=4))
+        self.assertEqual(results, dict.fromkeys(self.paths, True))
+        for path in self.paths:
+            self.assertIn("href='deepblue.css' />", self.read(path))
+
+    def test_setStylesFailure(self):
+        """ Object method
+            Params: None
+            Return: None
+            A page removed since it was listed needs to be reported, and the other pages need to be restyled.
+        """
+        os.remove(self.paths[0])
+        diagnostics = []
+        results = dict(StyleHandler.setStyles(self.paths, "'deepblue.css'", threads=4, diagnostics=diagnostics))
+
+        self.assertEqual(results, dict.fromkeys(self.paths[1:], True))
+        self.assertEqual([path for path, message in diagnostics], [self.paths[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the templates validation. """
+
+import os
+import tempfile
+import unittest
+import html_gen
+from templates import Template, TemplateSet, compileTemplate
+from constants import *
+
+
+class TestTemplate(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides a unitary test for each method of the Template class.
+    """
+
+    def setUp(self, text="<p class='${kind}'>$$${name}{}</p>"):
+        """ Object method
+            Params: text (str) -> the text of the tested template.
+            Return: None
+            Method called before each test, initializing it.
+            An attribute template, the compiled text, is added.
+        """
+        self.template = Template(text)
+
+    def test_fields(self):
+        """ Object method
+            Params: None
+            Return: None
+            The fields need to be found in their order of appearance.
+        """
+        self.assertEqual(self.template.fields(), ["kind", "name"])
+
+    def test_render(self):
+        """ Object method
+            Params: None
+            Return: None
+            The fields need to be replaced by their values, strings or iterables of strings, and '$$' by '$'.
+        """
+        fragments = self.template.render({'kind': "method", 'name': iter(["a", "b"])})
+        self.assertEqual("".join(fragments), "<p class='method'>$ab{}</p>")
+
+    def test_substitute(self):
+        """ Object method
+            Params: None
+            Return: None
+            substitute needs to return the same text as render, for string values.
+        """
+        values = {'kind': "method", 'name': "a"}
+        self.assertEqual(self.template.substitute(values), "".join(self.template.render(values)))
+
+    def test_compileTemplate(self, text="${name}"):
+        """ Object method
+            Params: text (str) -> a template's text.
+            Return: None
+            A text needs to be compiled only once.
+        """
+        self.assertTrue(compileTemplate(text) is compileTemplate(text))
+
+
+class TestTemplateSet(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class tests the user templates.
+    """
+
+    def test_load(self, path="test_templates.py"):
+        """ Object method
+            Params: path (str) -> path to the documented file.
+            Return: None
+            A template read from a folder needs to replace the default template. The other templates are the default ones.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            with open(os.path.join(folder, "method.html"), "w") as file_resource:
+                file_resource.write("<li>${name}</li>\n")
+            templates = TemplateSet.load(folder)
+
+        self.assertTrue(templates.page is compileTemplate(TEMPLATE_PAGE))
+
+        documentation = html_gen.PythonFile(path).document(templates)
+        self.assertTrue("<li>setUp(self, text=" in documentation)
+        self.assertFalse("<tr>" in documentation)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module providing unitary tests needed for the watcher validation. """
+
+import os
+import time
+import tempfile
+import unittest
+from file_handler import FileHandler
+from build_manifest import BuildManifest
+from watcher import Watcher, Observer
+from constants import *
+
+
+class TestWatcher(unittest.TestCase):
+    """ Inherits: unittest.TestCase
+        This class provides the unitary tests of the Watcher class.
+    """
+
+    def setUp(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called before each test, initializing it.
+            Two python files are documented in a temporary directory, with the meltdown style, and the directory is scanned.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.first = os.path.join(self.directory.name, "first.py")
+        self.second = os.path.join(self.directory.name, "second.py")
+        self.write(self.first, "class A:\n    pass\n")
+        self.write(self.second, "class B:\n    pass\n")
+
+        self.handler = FileHandler()
+        self.handler._style = STYLE_MELTDOWN_PATH
+        self.handler.addFiles([self.directory.name])
+        self.handler.processFiles()
+        self.watcher = Watcher([self.directory.name], self.handler, debounce=1, notify=False)
+
+    def tearDown(self):
+        """ Object method
+            Params: None
+            Return: None
+            Method called after each test. The watcher is closed and the temporary directory is removed.
+        """
+        self.watcher.close()
+        self.directory.cleanup()
+
+    def write(self, path, content):
+        """ Object method
+            Params: path (str) -> the written file
+                    content (str) -> the file's new content
+            Return: None
+        """
+        with open(path, "w") as file_resource:
+            file_resource.write(content)
+
+    def page(self, path):
+        """ Object method
+            Params: path (str) -> a documented python file
+            Return: the path of its page (str)
+        """
+        return os.path.join(self.handler._path, os.path.basename(path)[:-3] + ".html")
+
+    def test_poll(self):
+        """ Object method
+            Params: None
+            Return: None
+            Only the touched file needs to be generated again, once the debounce delay is over, with the current style.
+        """
+        self.assertEqual(self.watcher.poll(0), [])
+
+        self.write(self.first, 'class C:\n    """ Doc of C """\n    pass\n')
+        self.assertEqual(self.watcher.poll(10), [])
+        self.assertEqual(self.watcher.poll(11), [self.page(self.first)])
+        self.assertEqual(self.watcher.poll(12), [])
+
+        with open(self.page(self.first), "r") as file_resource:
+            page = file_resource.read()
+        self.assertIn("Doc of C", page)
+        self.assertIn("href='meltdown.css'", page)
+
+    def test_removed(self):
+        """ Object method
+            Params: None
+            Return: None
+            The page of a removed file needs to be removed.
+        """
+        os.remove(self.second)
+        self.assertEqual(self.watcher.poll(10), [])
+        self.assertEqual(self.watcher.poll(11), [self.page(self.second)])
+        self.assertFalse(os.path.exists(self.page(self.second)))
+        self.assertNotIn(self.page(self.second), self.handler._htmlFiles)
+
+    def test_syntaxError(self):
+        """ Object method
+            Params: None
+            Return: None
+            A file with a syntax error needs to keep its previous page and to be reported, and the other touched files need to be generated.
+        """
+        self.handler._engine = AST_ENGINE
+        with open(self.page(self.first), "r") as file_resource:
+            previous = file_resource.read()
+
+        self.write(self.first, "def f(:\n")
+        self.write(self.second, 'class D:\n    """ Doc of D """\n')
+        self.assertEqual(self.watcher.poll(10), [])
+        self.assertEqual(self.watcher.poll(11), [self.page(self.second)])
+
+        with open(self.page(self.first), "r") as file_resource:
+            self.assertEqual(file_resource.read(), previous)
+        self.assertIn(self.first, self.handler.parseReport())
+        self.assertIn("D", [name for name, kind, owner, excerpt in self.handler._searchIndex.symbols(self.page(self.second))])
+
+    def test_gitignore(self):
+        """ Object method
+            Params: None
+            Return: None
+            A file ignored by a new .gitignore file needs to stop being watched, its page being removed.
+        """
+        self.write(os.path.join(self.directory.name, GITIGNORE_FILE_NAME), "second.py\n")
+        self.assertEqual(self.watcher.poll(10), [])
+        self.assertEqual(self.watcher.poll(11), [self.page(self.second)])
+
+    def test_manifest(self):
+        """ Object method
+            Params: None
+            Return: None
+            In incremental mode, the regenerated pages need to be recorded in the build manifest, for the next incremental build.
+        """
+        self.handler._incremental = True
+        self.handler.addFiles([self.directory.name])
+        self.handler.processFiles()
+        self.watcher = Watcher([self.directory.name], self.handler, debounce=1, notify=False)
+
+        self.write(self.first, "class E:\n    pass\n")
+        self.watcher.poll(10)
+        self.assertEqual(self.watcher.poll(11), [self.page(self.first)])
+        self.assertTrue(BuildManifest(self.handler._path).isUpToDate(self.first, self.handler.buildSettings()))
+
+    @unittest.skipIf(Observer is None, "the watchdog module is not installed")
+    def test_notify(self):
+        """ Object method
+            Params: None
+            Return: None
+            With the notifications of the operating system, the touched file needs to be generated again.
+        """
+        self.watcher = Watcher([self.directory.name], self.handler, debounce=0)
+        self.write(self.first, 'class F:\n    """ Doc of F """\n')
+
+        pages = []
+        deadline = time.monotonic() + 5
+        while pages == [] and time.monotonic() < deadline:
+            time.sleep(0.05)
+            pages = self.watcher.poll()
+        self.assertEqual(pages, [self.page(self.first)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+#!/usr/bin/python3
+#-*- coding:utf-8 -*-
+
+""" Module regenerating the documentation while its sources are edited.
+
+    If the optional watchdog module is installed, the changes are notified by the operating system (e.g. inotify), and only the notified files are checked.
+    Otherwise, the watched files and folders are scanned periodically, and the modification time and size of each python file are compared with the previous scan.
+    The scan reads the rules of each .gitignore file again only when it changed.
+    Once no file changed for a short delay (the debounce), only the touched files are parsed and rendered again, with the current style.
+    The cost of an edit thus depends on the edited files, not on the size of the documented project.
+"""
+
+import os
+import sys
+import time
+import shutil
+import threading
+from build_manifest import BuildManifest
+from dir_walker import walkFiles, isWanted
+from compression import removeCompressed
+from constants import *
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+
+# Extensions of the watched files
+WATCHED_EXTENSIONS = ('.py', '.pyw')
+
+
+class Watcher:
+    """ Inherits: None
+        Class watching python files and folders, and regenerating the pages of the touched files.
+        The documentation settings (folder, order, engine, templates, cache and parse time budget) are the ones of a FileHandler.
+        With the watchdog module, the Watcher is the handler of the notified events (see dispatch()): they are recorded by the thread of the observer,
+        and handled by poll().
+    """
+
+    def __init__(self, paths, handler, debounce = WATCH_DEBOUNCE, notify = True):
+        """ Constructor
+            Params: List paths -> the watched files and folders
+                    FileHandler handler -> the file handler which generated the documentation
+                    float debounce -> the delay without any change before the pages are generated again, in seconds. Has WATCH_DEBOUNCE for default value
+                    bool notify -> if True, and if the watchdog module is installed, the changes are notified by the operating system instead of scanned.
+                                   Has True for default value
+            Return: self
+            The watched files are scanned a first time: only the later changes are handled.
+            If the operating system can't watch the folders (e.g. too many of them for inotify), they are scanned.
+            In incremental mode, the build manifest of the handler is kept up to date with the generated pages.
+        """
+        self._paths = [os.path.normpath(path) for path in paths]
+        self._folders = [path for path in self._paths if os.path.isdir(path)]
+        self._files = set(path for path in self._paths if not os.path.isdir(path))
+        self._handler = handler
+        self._debounce = debounce
+        self._touched = set()
+        self._removed = set()
+        self._last_change = 0
+        self._ignore_cache = {}
+        self._manifest = BuildManifest(handler._path) if handler._incremental else None
+
+        # Changes notified by the observer's thread
+        self._lock = threading.Lock()
+        self._events = set()
+        self._rescan = False
+        self._observer = None
+        if notify and Observer is not None:
+            self._observer = Observer()
+            try:
+                for folder in self._folders:
+                    self._observer.schedule(self, folder, recursive=True)
+                for folder in set(os.path.dirname(path) or os.curdir for path in self._files):
+                    self._observer.schedule(self, folder, recursive=False)
+                self._observer.start()
+            except OSError:
+                self._observer = None
+
+        self._states = self.scan()
+
+    def dispatch(self, event):
+        """ Object method
+            Params: FileSystemEvent event -> an event notified by the watchdog observer
+            Return: None
+            Called by the thread of the observer. The paths of the event are recorded, to be checked by the next poll().
+            An event on a folder (created, removed or moved), other than the modification of its content, requires a full scan.
+        """
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+
+        with self._lock:
+            if event.is_directory:
+                if event.event_type != "modified":
+                    self._rescan = True
+                return
+            self._events.add(os.path.normpath(os.fsdecode(event.src_path)))
+            if getattr(event, "dest_path", ""):
+                self._events.add(os.path.normpath(os.fsdecode(event.dest_path)))
+
+    def close(self):
+        """ Object method
+            Params: None
+            Return: None
+            Stops the observer of the operating system's notifications, if any.
+        """
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def state(self, path):
+        """ Object method
+            Params: String path -> the path of a file
+            Return: the state of the file (tuple: modification time, size), or None if it doesn't exist or isn't watched
+            Only the folders between the watched folder and the file are checked (see dir_walker.isWanted).
+        """
+        if os.path.splitext(path)[1] not in WATCHED_EXTENSIONS:
+            return None
+        if path not in self._files:
+            handler = self._handler
+            if not any(isWanted(folder, path, WATCHED_EXTENSIONS, handler._include, handler._exclude, cache=self._ignore_cache) for folder in self._folders):
+                return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def scan(self):
+        """ Object method
+            Params: None
+            Return: the state of each watched python file (Dictionary: path -> (modification time, size))
+            The folders are walked by the dir_walker module, as by FileHandler.extractFiles, with the cached rules of the .gitignore files.
+            A file removed during the scan is ignored.
+        """
+        files = []
+        for path in self._paths:
+            if os.path.isdir(path):
+                files += walkFiles(path, WATCHED_EXTENSIONS, self._handler._include, self._handler._exclude, cache=self._ignore_cache)
+            elif os.path.isfile(path):
+                files.append(path)
+
+        states = {}
+        for path in files:
+            if os.path.splitext(path)[1] not in WATCHED_EXTENSIONS:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            states[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return states
+
+    def poll(self, now = None):
+        """ Object method
+            Params: float now -> the current time (time.monotonic()), has None for default value
+            Return: the paths of the generated and removed pages (List of String), empty while the debounce delay is running
+            Checks the notified files, or scans all the watched files without notifications, and remembers the touched and removed ones.
+            A notified .gitignore file, or folder event, requires a full scan, as the set of watched files may have changed.
+            If some files changed, and none changed during the debounce delay, their pages are generated again by regenerate().
+        """
+        if now is None:
+            now = time.monotonic()
+
+        rescan = self._observer is None
+        paths = ()
+        if not rescan:
+            with self._lock:
+                paths, self._events = self._events, set()
+                rescan, self._rescan = self._rescan, False
+            rescan = rescan or any(os.path.basename(path) == GITIGNORE_FILE_NAME for path in paths)
+
+        if rescan:
+            states = self.scan()
+            paths = states.keys() | self._states.keys()
+        else:
+            states = {path: self.state(path) for path in paths}
+
+        for path in paths:
+            state = states.get(path)
+            if self._states.get(path) == state:
+                continue
+            self._last_change = now
+            if state is None:
+                del self._states[path]
+                self._removed.add(path)
+                self._touched.discard(path)
+            else:
+                self._states[path] = state
+                self._touched.add(path)
+                self._removed.discard(path)
+
+        if (self._touched or self._removed) and now - self._last_change >= self._debounce:
+            return self.regenerate()
+        return []
+
+    def regenerate(self):
+        """ Object method
+            Params: None
+            Return: the paths of the generated and removed pages (List of String)
+            Parses and renders the touched files again, with the style of the handler, and removes the pages of the removed files, with the fragments of their classes and their compressed copies.
+            The search index of the handler is updated: only its shards which changed are written again.
+            The html files list of the handler is kept up to date, and the child process of its parse time budget is stopped until the next changes.
+            In incremental mode, the generated pages are recorded in the build manifest, and the removed sources are removed from it:
+            the next incremental build doesn't generate them again.
+            A file which can't be documented, e.g. caught in the middle of an edit with a syntax error, or removed since the scan,
+            keeps its previous page: the failure is recorded as a diagnostic of the handler (see FileHandler.parseReport()), and the other files are generated.
+        """
+        handler = self._handler
+        settings = handler.buildSettings()
+        pages = []
+
+        for path in sorted(self._touched):
+            try:
+                python_file = handler._budget.parse(path, handler._engine, handler._cache)
+                if python_file is None:
+                    continue
+                new_path = python_file.save(handler._path, handler._order, handler._templates, handler.styleName(), handler._lazy, handler._compress)
+            except (SyntaxError, ValueError, OSError, UnicodeDecodeError) as error:
+                handler._budget.record([(path, "not documented, previous page kept (%s)" % error)])
+                continue
+
+            symbols = python_file.symbols()
+            if self._manifest is not None:
+                self._manifest.record(path, settings, new_path, symbols)
+            handler._pageStyles[new_path] = handler.styleName()
+            handler._searchIndex.add(new_path, symbols)
+            handler._htmlFiles.add(new_path)
+            pages.append(new_path)
+
+        for path in sorted(self._removed):
+            old_path = os.path.join(handler._path, os.path.basename(os.path.splitext(path)[0]) + ".html")
+            if os.path.isfile(old_path):
+                os.remove(old_path)
+                pages.append(old_path)
+            removeCompressed(old_path)
+            fragments = os.path.splitext(old_path)[0] + CLASS_FRAGMENTS_SUFFIX
+            if os.path.isdir(fragments):
+                shutil.rmtree(fragments)
+            handler._htmlFiles.discard(old_path)
+            handler._searchIndex.remove(old_path)
+
+        if self._manifest is not None:
+            self._manifest.removeStale()
+            self._manifest.save()
+
+        self._touched.clear()
+        self._removed.clear()
+        handler._budget.close()
+        handler.saveSearchIndex()
+        handler.updateHtmlView()
+        return pages
+
+    def run(self, callback = None, interval = WATCH_INTERVAL):
+        """ Object method
+            Params: function callback -> function called with the paths returned by each poll() generating pages, has None for default value
+                    float interval -> the delay between two scans, in seconds. Has WATCH_INTERVAL for default value
+            Return: None
+            Watches the files until the process is interrupted (KeyboardInterrupt). The observer of the notifications is then stopped.
+            The diagnostics of the files which couldn't be documented are printed on the error output, as the parse report of the command line interface.
+        """
+        try:
+            while True:
+                pages = self.poll()
+                if pages and callback is not None:
+                    callback(pages)
+                report = self._handler.parseReport()
+                if report != "":
+                    print(PARSE_REPORT_TITLE + ":\n" + report, file=sys.stderr)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+""" The worker module runs the long operations of the file handler in the background.
+    It contains the class Worker.
+"""
+
+from PyQt5.QtCore import (QThread, pyqtSignal)
+from constants import *
+
+
+class Worker(QThread):
+    """ Inherits: QThread
+        Class running an operation of a FileHandler (file_handler module) in its own thread, so that the window keeps responding.
+        The progress of the operation is emitted file by file by the progress signal, which is received in the thread of the interface.
+        The operation is cancelled by FileHandler.cancel().
+    """
+
+    progress = pyqtSignal(str, str)
+
+    def __init__(self, handler, operation, *args):
+        """ Constructor
+            Params: FileHandler handler -> the file handler running the operation
+                    function operation -> the operation (addFiles, processFiles or processStyles method of the handler)
+                    args -> the arguments of the operation
+            Return: self
+            The _result attribute is the return value of the operation, once it is finished.
+        """
+        super().__init__()
+        self._handler = handler
+        self._operation = operation
+        self._args = args
+        self._result = None
+
+    def run(self):
+        """ Redefined Object method
+            Params: None
+            Return: None
+            Runs the operation in the worker's thread. Meanwhile, the handler notifies its progress through the progress signal, and doesn't update the views itself.
+        """
+        self._handler._progress = self.progress.emit
+        try:
+            self._result = self._operation(*self._args)
+        finally:
+            self._handler._progress = None
+
+    def result(self):
+        """ Object method
+            Params: None
+            Return: the return value of the operation, or None if it isn't finished
+        """
+        return self._result